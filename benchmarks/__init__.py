@@ -0,0 +1 @@
+"""Performance benchmarks for py-ibkr. Run with: python -m benchmarks --help"""
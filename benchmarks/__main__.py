@@ -0,0 +1,81 @@
+import argparse
+import fnmatch
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from . import bench_client, bench_parse, bench_utils  # noqa: F401  (register benchmarks)
+from .harness import BENCHMARKS, Result, Workload, run_benchmark
+from .synthetic import FlexXMLGenerator
+
+# Every result is also shown relative to this one, when it is selected
+BASELINE = "parse"
+
+
+def format_result(result: Result, baseline: Result | None = None) -> str:
+    rss = f"{result.peak_rss / 2**20:>9.1f}MiB" if result.peak_rss else f"{'n/a':>12}"
+    ratio = f"{result.seconds / baseline.seconds:>9.2f}x" if baseline else f"{'':>10}"
+    return (
+        f"{result.name:<32}{result.rows:>10}{result.seconds * 1e3:>12.1f}ms"
+        f"{result.rows_per_second:>14,.0f}{rss}{ratio}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--statements", type=int, default=1, help="Statements per report")
+    parser.add_argument("--trades", type=int, default=20_000, help="Trades per statement")
+    parser.add_argument("--cash", type=int, default=2_000, help="Cash transactions per statement")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (best is kept)")
+    parser.add_argument("-k", dest="pattern", default="*", help="Glob to select benchmarks")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if fnmatch.fnmatch(name, args.pattern)]
+    if args.list:
+        print("\n".join(names))
+        return
+    if not names:
+        print(f"No benchmark matches {args.pattern!r}", file=sys.stderr)
+        sys.exit(1)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = FlexXMLGenerator(args.statements, args.trades, args.cash)
+        workload = Workload(
+            path=generator.write(Path(tmp) / "synthetic.xml"),
+            statements=args.statements,
+            trades=args.trades,
+            cash_transactions=args.cash,
+        )
+        size = workload.path.stat().st_size / 2**20
+        print(f"Workload: {workload.rows} rows, {size:.1f}MiB", file=sys.stderr)
+
+        header = (
+            f"{'benchmark':<32}{'rows':>10}{'best':>14}{'rows/s':>14}{'peak RSS':>12}"
+            f"{'vs ' + BASELINE:>10}"
+        )
+        print(header)
+        print("-" * len(header))
+        baseline = None
+        if BASELINE in names:  # run first, so that every line has the ratio
+            names.remove(BASELINE)
+            names.insert(0, BASELINE)
+        for name in names:
+            result = run_benchmark(name, workload, repeat=args.repeat)
+            if name == BASELINE:
+                baseline = result
+            print(format_result(result, baseline), flush=True)
+            results.append(result)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                [dict(vars(r), rows_per_second=r.rows_per_second) for r in results], f, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""FlexClient benchmarks against a local mock of the Flex Web Service."""
+
+import io
+
+from py_ibkr import FlexClient, iter_section_models
+
+from .harness import Setup, Workload, benchmark
+from .mock_server import MockFlexServer
+
+# Bytes/s served by the pipelining benchmarks: a transfer takes about as long as parsing
+BANDWIDTH = 20e6
+
+
+@benchmark("FlexClient.download")
+def bench_download(w: Workload) -> Setup:
+    with MockFlexServer(w.path.read_bytes(), not_ready=1) as server, FlexClient() as client:
+        client.BASE_URL = server.base_url
+
+        def run() -> None:
+            client.download("token", "query", retry_interval=0)
+
+        yield run, w.rows
+
+
+@benchmark("FlexClient.download_to[gzip]")
+def bench_download_to_gzip(w: Workload) -> Setup:
+    with (
+        MockFlexServer(w.path.read_bytes(), compress=True) as server,
+        FlexClient() as client,
+    ):
+        client.BASE_URL = server.base_url
+
+        def run() -> None:
+            client.download_to("token", "query", io.BytesIO(), retry_interval=0)
+
+        yield run, w.rows
+
+
+@benchmark("download+iter[20MB/s]")
+def bench_download_then_parse(w: Workload) -> Setup:
+    with (
+        MockFlexServer(w.path.read_bytes(), bandwidth=BANDWIDTH) as server,
+        FlexClient() as client,
+    ):
+        client.BASE_URL = server.base_url
+
+        def run() -> None:
+            for _ in iter_section_models(client.download("token", "query", retry_interval=0)):
+                pass
+
+        yield run, w.rows
+
+
+@benchmark("download_parsed[20MB/s]")
+def bench_download_parsed(w: Workload) -> Setup:
+    with (
+        MockFlexServer(w.path.read_bytes(), bandwidth=BANDWIDTH) as server,
+        FlexClient() as client,
+    ):
+        client.BASE_URL = server.base_url
+
+        def run() -> None:
+            for _ in client.download_parsed("token", "query", retry_interval=0):
+                pass
+
+        yield run, w.rows
@@ -0,0 +1,137 @@
+"""Parser benchmarks: whole-document parse, streaming, columnar and clean_attributes."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+from py_ibkr import iter_trades, parse, parse_columns, parse_many
+from py_ibkr.flex.models import Trade
+from py_ibkr.flex.parser import clean_attributes, parse_flex_statement
+
+from .harness import Setup, Workload, benchmark
+from .synthetic import OTHER_SECTIONS, FlexXMLGenerator
+
+
+@benchmark("parse")
+def bench_parse(w: Workload) -> Setup:
+    yield lambda: parse(str(w.path)), w.rows
+
+
+@benchmark("parse[validate=False]")
+def bench_parse_trusted(w: Workload) -> Setup:
+    yield lambda: parse(str(w.path), validate=False), w.rows
+
+
+@benchmark("parse[lxml]")
+def bench_parse_lxml(w: Workload) -> Setup:
+    yield lambda: parse(str(w.path), backend="lxml"), w.rows
+
+
+@benchmark("parse[expat]")
+def bench_parse_expat(w: Workload) -> Setup:
+    yield lambda: parse(str(w.path), backend="expat"), w.rows
+
+
+@benchmark("parse[bytes]")
+def bench_parse_bytes(w: Workload) -> Setup:
+    data = w.path.read_bytes()  # e.g. the result of FlexClient.download()
+    yield lambda: parse(data), w.rows
+
+
+@benchmark("parse[compact]")
+def bench_parse_compact(w: Workload) -> Setup:
+    yield lambda: parse(str(w.path), record_type="compact"), w.rows
+
+
+@benchmark("parse[projected]")
+def bench_parse_projected(w: Workload) -> Setup:
+    fields = {"Trade": ["symbol", "quantity", "tradePrice", "tradeDate"]}
+    yield lambda: parse(str(w.path), sections={"Trades"}, fields=fields), w.statements * w.trades
+
+
+@benchmark("parse[snapshot]")
+def bench_parse_snapshot(w: Workload) -> Setup:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        parse(str(w.path), cache_dir=cache_dir)
+        yield lambda: parse(str(w.path), cache_dir=cache_dir), w.rows
+
+
+@benchmark("parse[workers=4]")
+def bench_parse_parallel(w: Workload) -> Setup:
+    yield lambda: parse(str(w.path), workers=4), w.rows
+
+
+@benchmark("py-ibkr parse[jsonl]")
+def bench_cli_parse(w: Workload) -> Setup:
+    # End to end, as a user runs it: interpreter startup, parse and JSON output
+    command = [sys.executable, "-c", "from py_ibkr.cli import main; main()", "parse"]
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "report.jsonl")
+        args = [str(w.path), "--workers", "1", "--output", output]
+        yield (
+            lambda: subprocess.run([*command, *args], check=True, stderr=subprocess.DEVNULL),
+            w.rows,
+        )
+
+
+@benchmark("parse_many[4 files]")
+def bench_parse_many(w: Workload) -> Setup:
+    def run() -> None:
+        for _ in parse_many([w.path] * 4, workers=4):
+            pass
+
+    yield run, 4 * w.rows
+
+
+@benchmark("iter_trades")
+def bench_iter_trades(w: Workload) -> Setup:
+    def run() -> None:
+        for _ in iter_trades(str(w.path)):
+            pass
+
+    yield run, w.statements * w.trades
+
+
+@benchmark("parse_columns")
+def bench_parse_columns(w: Workload) -> Setup:
+    yield lambda: parse_columns(str(w.path)), w.rows
+
+
+@benchmark("parse_columns[snapshot]")
+def bench_parse_columns_snapshot(w: Workload) -> Setup:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        parse_columns(str(w.path), cache_dir=cache_dir)
+        yield lambda: parse_columns(str(w.path), cache_dir=cache_dir), w.rows
+
+
+@benchmark("parse_flex_statement[many sections]")
+def bench_statement_sections(w: Workload) -> Setup:
+    # Statements of a report with many sections selected, few rows each and a
+    # non-standard CashReport: the per-statement section dispatch dominates
+    generator = FlexXMLGenerator(
+        statements=2000,
+        trades=2,
+        cash_transactions=2,
+        other_sections=len(OTHER_SECTIONS),
+        cash_report_tag="CashReportInfo",
+    )
+    elems = list(ET.fromstring(generator.to_bytes()).iter("FlexStatement"))
+
+    def run() -> None:
+        for elem in elems:
+            parse_flex_statement(elem)
+
+    yield run, len(elems)
+
+
+@benchmark("clean_attributes[Trade]")
+def bench_clean_attributes(w: Workload) -> Setup:
+    rows = [elem.attrib for elem in ET.parse(w.path).iter("Trade")]
+
+    def run() -> None:
+        for attrs in rows:
+            clean_attributes(attrs, Trade)
+
+    yield run, len(rows)
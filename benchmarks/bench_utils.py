@@ -0,0 +1,127 @@
+"""
+Micro-benchmark of the flex.utils date/time parsers.
+
+Compares the strptime-based parsers py-ibkr used up to 0.1.4 with the hand-written
+fixed-width parsers, both uncached (`__wrapped__`) and through the LRU cache, on a
+workload that repeats a small set of values like a real statement does.
+
+Run standalone with: python -m benchmarks.bench_utils
+"""
+
+import random
+import timeit
+from collections.abc import Callable
+from datetime import date, datetime, time
+from typing import Any
+
+from py_ibkr.flex.utils import parse_date, parse_datetime, parse_time
+
+from .harness import Setup, Workload, benchmark
+
+
+def strptime_date(value: str) -> date | None:
+    if not value or value in ("0", "N/A", ""):
+        return None
+    if len(value) == 8:
+        return datetime.strptime(value, "%Y%m%d").date()
+    if "-" in value:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    raise ValueError(f"Unsupported date format: {value}")
+
+
+def strptime_time(value: str) -> time | None:
+    if not value or value in ("0", "N/A", ""):
+        return None
+    if len(value) == 6:
+        return datetime.strptime(value, "%H%M%S").time()
+    if ":" in value:
+        return datetime.strptime(value, "%H:%M:%S").time()
+    raise ValueError(f"Unsupported time format: {value}")
+
+
+def strptime_datetime(value: str) -> datetime | None:
+    d_str, t_str = value.split(";")
+    d = strptime_date(d_str)
+    t = strptime_time(t_str)
+    assert d and t
+    return datetime.combine(d, t)
+
+
+def workload(rows: int = 10_000, distinct: int = 250, seed: int = 0) -> dict[str, list[str]]:
+    """Attribute values as they appear in a statement: few distinct, many repeats."""
+    rng = random.Random(seed)
+    days = [date(2023, 1, 2).toordinal() + i for i in range(distinct)]
+    seconds = [rng.randrange(9 * 3600, 17 * 3600) for _ in range(distinct)]
+
+    def pick_date(fmt: str) -> str:
+        return date.fromordinal(rng.choice(days)).strftime(fmt)
+
+    def pick_time() -> str:
+        s = rng.choice(seconds)
+        return f"{s // 3600:02d}{s % 3600 // 60:02d}{s % 60:02d}"
+
+    return {
+        "yyyyMMdd": [pick_date("%Y%m%d") for _ in range(rows)],
+        "yyyy-MM-dd": [pick_date("%Y-%m-%d") for _ in range(rows)],
+        "HHmmss": [pick_time() for _ in range(rows)],
+        "yyyyMMdd;HHmmss": [f"{pick_date('%Y%m%d')};{pick_time()}" for _ in range(rows)],
+    }
+
+
+def bench(func: Callable[[str], Any], values: list[str], repeat: int = 5) -> float:
+    """Best wall time in seconds for converting all values once."""
+    clear = getattr(func, "cache_clear", None)
+
+    def run() -> None:
+        if clear is not None:
+            clear()  # every run starts cold, repeats within the run hit the cache
+        for value in values:
+            func(value)
+
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def _register(layout: str, parser: Callable[[str], Any]) -> None:
+    @benchmark(f"{parser.__name__}[{layout}]")
+    def bench(w: Workload) -> Setup:
+        values = workload()[layout]
+
+        def run() -> None:
+            parser.cache_clear()  # type: ignore[attr-defined]
+            for value in values:
+                parser(value)
+
+        yield run, len(values)
+
+
+_register("yyyyMMdd", parse_date)
+_register("yyyy-MM-dd", parse_date)
+_register("HHmmss", parse_time)
+_register("yyyyMMdd;HHmmss", parse_datetime)
+
+
+def main() -> None:
+    data = workload()
+    cases = [
+        ("yyyyMMdd", strptime_date, parse_date),
+        ("yyyy-MM-dd", strptime_date, parse_date),
+        ("HHmmss", strptime_time, parse_time),
+        ("yyyyMMdd;HHmmss", strptime_datetime, parse_datetime),
+    ]
+
+    header = f"{'layout':<18}{'strptime':>12}{'fixed-width':>14}{'cached':>12}{'speedup':>10}"
+    print(header)
+    print("-" * len(header))
+    for layout, baseline, parser in cases:
+        values = data[layout]
+        t_base = bench(baseline, values)
+        t_fixed = bench(parser.__wrapped__, values)
+        t_cached = bench(parser, values)
+        print(
+            f"{layout:<18}{t_base * 1e3:>10.2f}ms{t_fixed * 1e3:>12.2f}ms"
+            f"{t_cached * 1e3:>10.2f}ms{t_base / t_cached:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
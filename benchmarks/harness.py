@@ -0,0 +1,92 @@
+"""
+Minimal benchmark harness.
+
+A benchmark is a generator function registered with `@benchmark`. It receives the
+`Workload`, does its setup, yields `(run, rows)` once and may clean up after the
+yield. Every benchmark runs in a fresh spawned process, so the reported peak RSS
+belongs to that benchmark alone (or to the largest process it started, e.g. a worker
+or the `py-ibkr` command).
+"""
+
+import importlib
+import sys
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+Setup = Generator[tuple[Callable[[], object], int], None, None]
+BENCHMARKS: dict[str, Callable[["Workload"], Setup]] = {}
+
+
+@dataclass(frozen=True)
+class Workload:
+    """Synthetic report shared by all benchmarks of a run."""
+
+    path: Path
+    statements: int
+    trades: int
+    cash_transactions: int
+
+    @property
+    def rows(self) -> int:
+        return self.statements * (self.trades + self.cash_transactions)
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    rows: int
+    seconds: float
+    peak_rss: int | None  # bytes
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+def benchmark(name: str) -> Callable[[Callable[[Workload], Setup]], Callable[[Workload], Setup]]:
+    def register(func: Callable[[Workload], Setup]) -> Callable[[Workload], Setup]:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def _peak_rss() -> int | None:
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _run_in_child(module: str, name: str, workload: Workload, repeat: int) -> Result:
+    importlib.import_module(module)  # registers the benchmark in this process
+    setup = BENCHMARKS[name](workload)
+    run, rows = next(setup)
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        setup.close()
+    return Result(name, rows, best, _peak_rss())
+
+
+def run_benchmark(name: str, workload: Workload, repeat: int = 3) -> Result:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        module = BENCHMARKS[name].__module__
+        return pool.submit(_run_in_child, module, name, workload, repeat).result()
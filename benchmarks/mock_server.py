@@ -0,0 +1,106 @@
+"""Local stand-in for the Flex Web Service used by the client benchmarks."""
+
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from urllib.parse import urlparse
+
+SEND_REQUEST_OK = (
+    b"<FlexStatementResponse><Status>Success</Status>"
+    b"<ReferenceCode>1234567890</ReferenceCode></FlexStatementResponse>"
+)
+NOT_READY = (
+    b"<FlexStatementResponse><Status>Warn</Status><ErrorCode>1003</ErrorCode>"
+    b"<ErrorMessage>Statement generation in progress</ErrorMessage></FlexStatementResponse>"
+)
+
+# Bytes written between pauses when `bandwidth` is set
+_PACE_CHUNK_SIZE = 64 * 1024
+
+
+class MockFlexServer:
+    """
+    Serve SendRequest/GetStatement on 127.0.0.1 with a fixed statement body.
+
+    Each GetStatement answers `not_ready` times with error 1003 before returning
+    the body, mimicking the polling protocol. With `compress`, the body is served
+    gzip-encoded to clients that accept it. `bandwidth` (bytes/s) paces the body,
+    like a remote server would.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        not_ready: int = 0,
+        compress: bool = False,
+        bandwidth: float | None = None,
+    ):
+        self.body = body
+        self.bandwidth = bandwidth
+        self.not_ready = not_ready
+        self.compressed = gzip.compress(body) if compress else None
+        self.requests = 0
+        self._pending = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body are written separately
+
+            def do_GET(self) -> None:
+                server.requests += 1
+                path = urlparse(self.path).path
+                encoding = None
+                if path.endswith("/SendRequest"):
+                    server._pending = server.not_ready
+                    payload = SEND_REQUEST_OK
+                elif path.endswith("/GetStatement"):
+                    if server._pending:
+                        server._pending -= 1
+                        payload = NOT_READY
+                    elif server.compressed and "gzip" in self.headers.get("Accept-Encoding", ""):
+                        payload = server.compressed
+                        encoding = "gzip"
+                    else:
+                        payload = server.body
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/xml")
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if server.bandwidth is None:
+                    self.wfile.write(payload)
+                    return
+                for start in range(0, len(payload), _PACE_CHUNK_SIZE):
+                    self.wfile.write(payload[start : start + _PACE_CHUNK_SIZE])
+                    time.sleep(_PACE_CHUNK_SIZE / server.bandwidth)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}/AccountManagement/FlexWebService"
+
+    def __enter__(self) -> "MockFlexServer":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
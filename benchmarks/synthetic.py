@@ -0,0 +1,216 @@
+"""Synthetic Flex Query XML generator for benchmarks."""
+
+import random
+from collections.abc import Iterator, Mapping
+from datetime import date, timedelta
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+from py_ibkr.flex.enums import (
+    AssetClass,
+    BuySell,
+    CashAction,
+    Code,
+    OpenClose,
+    OrderType,
+    TradeType,
+)
+
+CURRENCIES = ["USD", "EUR", "GBP", "CHF", "JPY", "CAD", "HKD"]
+NOTES = ["", "O", "C", "O;P", "C;P", "C;Ep", "A;C", "O;R", "C;LT", "IA;O"]
+ASSET_CLASSES = [AssetClass.STOCK, AssetClass.STOCK, AssetClass.OPTION, AssetClass.FUTURE]
+CASH_ACTIONS = [action for action in CashAction if action is not CashAction.UNKNOWN]
+# Sections of real reports that py-ibkr does not parse: container tag -> row tag
+OTHER_SECTIONS = {
+    "AccountInformation": "AccountInformation",
+    "EquitySummaryInBase": "EquitySummaryByReportDateInBase",
+    "MTMPerformanceSummaryInBase": "MTMPerformanceSummaryUnderlying",
+    "FIFOPerformanceSummaryInBase": "FIFOPerformanceSummaryUnderlying",
+    "MTDYTDPerformanceSummary": "MTDYTDPerformanceSummaryUnderlying",
+    "StmtFunds": "StatementOfFundsLine",
+    "ChangeInPositionValues": "ChangeInPositionValue",
+    "UnbundledCommissionDetails": "UnbundledCommissionDetail",
+    "InterestAccruals": "InterestAccrualsCurrency",
+    "TierInterestDetails": "TierInterestDetail",
+    "ChangeInDividendAccruals": "ChangeInDividendAccrual",
+    "OpenDividendAccruals": "OpenDividendAccrual",
+    "SecuritiesInfo": "SecurityInfo",
+    "ConversionRates": "ConversionRate",
+}
+
+
+def _attrs(values: Mapping[str, object]) -> str:
+    return " ".join(f"{key}={quoteattr(str(value))}" for key, value in values.items())
+
+
+class FlexXMLGenerator:
+    """
+    Produce N statements x M trades/cash transactions with realistic values.
+
+    Values come from `py_ibkr.flex.enums` and repeat like in real reports: a few
+    hundred symbols, one currency per symbol, and dates within one year.
+    `other_sections` adds sections that the parser skips, which real reports with
+    many sections selected carry.
+    """
+
+    def __init__(
+        self,
+        statements: int = 1,
+        trades: int = 1000,
+        cash_transactions: int = 100,
+        symbols: int = 300,
+        seed: int = 0,
+        other_sections: int = 0,
+        cash_report_tag: str = "CashReportCurrency",
+    ):
+        self.statements = statements
+        self.trades = trades
+        self.cash_transactions = cash_transactions
+        # Unparsed sections per statement (up to len(OTHER_SECTIONS)), 3 rows each
+        self.other_sections = list(OTHER_SECTIONS.items())[:other_sections]
+        self.cash_report_tag = cash_report_tag  # "CashReportInfo": a non-standard file
+        self.rng = random.Random(seed)
+        self.symbols = [self._symbol() for _ in range(symbols)]
+        self.symbol_currency = {s: self.rng.choice(CURRENCIES) for s in self.symbols}
+        self.conids = {s: str(self.rng.randrange(10_000, 900_000_000)) for s in self.symbols}
+        self.start = date(2023, 1, 2)
+
+    @property
+    def rows(self) -> int:
+        return self.statements * (self.trades + self.cash_transactions)
+
+    def _symbol(self) -> str:
+        letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        return "".join(self.rng.choice(letters) for _ in range(self.rng.randint(2, 5)))
+
+    def _date(self) -> date:
+        return self.start + timedelta(days=self.rng.randrange(365))
+
+    def _trade(self, account: str, n: int) -> dict[str, object]:
+        rng = self.rng
+        symbol = rng.choice(self.symbols)
+        trade_date = self._date()
+        trade_time = f"{rng.randrange(9, 17):02d}{rng.randrange(60):02d}{rng.randrange(60):02d}"
+        quantity = rng.randrange(1, 500)
+        price = round(rng.uniform(1, 1500), rng.choice([2, 4]))
+        buy_sell = rng.choice([BuySell.BUY, BuySell.SELL])
+        if buy_sell == BuySell.SELL:
+            quantity = -quantity
+        proceeds = round(-quantity * price, 2)
+        commission = round(-rng.uniform(0.35, 5), 6)
+        return {
+            "accountId": account,
+            "acctAlias": "",
+            "model": "",
+            "currency": self.symbol_currency[symbol],
+            "fxRateToBase": round(rng.uniform(0.5, 1.5), 5),
+            "assetCategory": rng.choice(ASSET_CLASSES).value,
+            "symbol": symbol,
+            "description": f"{symbol} COMMON STOCK",
+            "conid": self.conids[symbol],
+            "securityID": "",
+            "securityIDType": "",
+            "cusip": "",
+            "isin": "",
+            "listingExchange": "NASDAQ",
+            "multiplier": 1,
+            "strike": "",
+            "expiry": "",
+            "putCall": "",
+            "tradeID": str(100_000_000 + n),
+            "reportDate": trade_date.strftime("%Y%m%d"),
+            "tradeDate": trade_date.strftime("%Y%m%d"),
+            "tradeTime": trade_time,
+            "dateTime": f"{trade_date:%Y%m%d};{trade_time}",
+            "settleDateTarget": (trade_date + timedelta(days=2)).strftime("%Y%m%d"),
+            "transactionType": rng.choice([TradeType.EXCHTRADE] * 9 + [TradeType.BOOKTRADE]).value,
+            "exchange": rng.choice(["ISLAND", "ARCA", "NYSE", "IBKRATS"]),
+            "quantity": quantity,
+            "tradePrice": price,
+            "tradeMoney": round(quantity * price, 2),
+            "proceeds": proceeds,
+            "taxes": 0,
+            "ibCommission": commission,
+            "ibCommissionCurrency": self.symbol_currency[symbol],
+            "netCash": round(proceeds + commission, 2),
+            "closePrice": round(price * rng.uniform(0.95, 1.05), 4),
+            "openCloseIndicator": rng.choice([OpenClose.OPEN, OpenClose.CLOSE]).value,
+            "notes": rng.choice(NOTES),
+            "cost": round(-proceeds, 2),
+            "fifoPnlRealized": round(rng.uniform(-500, 500), 2),
+            "mtmPnl": round(rng.uniform(-100, 100), 2),
+            "buySell": buy_sell.value,
+            "ibOrderID": str(rng.randrange(10**9)),
+            "ibExecID": f"0000{rng.randrange(16**8):08x}.{rng.randrange(16**4):04x}.01.01",
+            "orderTime": f"{trade_date:%Y%m%d};{trade_time}",
+            "levelOfDetail": "EXECUTION",
+            "orderType": rng.choice([OrderType.LIMIT.value, OrderType.MARKET.value, "LMT;MKT"]),
+            "isAPIOrder": rng.choice("NY"),
+            "accruedInt": 0,
+        }
+
+    def _cash_transaction(self, account: str, n: int) -> dict[str, object]:
+        rng = self.rng
+        symbol = rng.choice(self.symbols)
+        action = rng.choice(CASH_ACTIONS)
+        when = self._date()
+        return {
+            "accountId": account,
+            "currency": self.symbol_currency[symbol],
+            "fxRateToBase": round(rng.uniform(0.5, 1.5), 5),
+            "assetCategory": AssetClass.STOCK.value,
+            "symbol": symbol,
+            "description": f"{symbol} {action.value}",
+            "conid": self.conids[symbol],
+            "dateTime": f"{when:%Y%m%d};202000",
+            "settleDate": when.strftime("%Y%m%d"),
+            "reportDate": when.strftime("%Y%m%d"),
+            "amount": round(rng.uniform(-250, 1000), 2),
+            "type": action.value,
+            "tradeID": "",
+            "code": rng.choice(["", Code.POSTACCRUAL.value, Code.REVERSE.value]),
+            "transactionID": str(200_000_000 + n),
+            "levelOfDetail": "DETAIL",
+        }
+
+    def iter_chunks(self) -> Iterator[str]:
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield '<FlexQueryResponse queryName="Synthetic" type="AF">\n'
+        yield f'<FlexStatements count="{self.statements}">\n'
+        for s in range(self.statements):
+            account = f"U{1_000_000 + s}"
+            header = {
+                "accountId": account,
+                "fromDate": "20230101",
+                "toDate": "20231231",
+                "period": "Custom",
+                "whenGenerated": "20240102;083000",
+            }
+            yield f"<FlexStatement {_attrs(header)}>\n"
+            for container, row in self.other_sections:
+                yield f"<{container}>\n"
+                for currency in CURRENCIES[:3]:
+                    yield f"<{row} {_attrs({'accountId': account, 'currency': currency})} />\n"
+                yield f"</{container}>\n"
+            yield "<Trades>\n"
+            for n in range(self.trades):
+                yield f"<Trade {_attrs(self._trade(account, n))} />\n"
+            yield "</Trades>\n<CashTransactions>\n"
+            for n in range(self.cash_transactions):
+                yield f"<CashTransaction {_attrs(self._cash_transaction(account, n))} />\n"
+            yield "</CashTransactions>\n<CashReport>\n"
+            for currency in CURRENCIES:
+                report = {"accountId": account, "currency": currency, "endingCash": 1000}
+                yield f"<{self.cash_report_tag} {_attrs(report)} />\n"
+            yield "</CashReport>\n</FlexStatement>\n"
+        yield "</FlexStatements>\n</FlexQueryResponse>\n"
+
+    def write(self, path: str | Path) -> Path:
+        path = Path(path)
+        with path.open("w", encoding="utf-8") as f:
+            for chunk in self.iter_chunks():
+                f.write(chunk)
+        return path
+
+    def to_bytes(self) -> bytes:
+        return "".join(self.iter_chunks()).encode()
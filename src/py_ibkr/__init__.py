@@ -1,5 +1,11 @@
 from .flex import (
+    AdaptiveBackoff,
+    AsyncFlexClient,
+    Backoff,
     CashTransaction,
+    ChangeInNAV,
+    CorporateAction,
+    DownloadCache,
     FlexAuthError,
     FlexClient,
     FlexError,
@@ -8,20 +14,52 @@ from .flex import (
     FlexQueryResponse,
     FlexRateLimitError,
     FlexStatement,
+    OpenPosition,
+    OptionEAE,
+    TokenBucket,
     Trade,
+    Transfer,
+    available_backends,
+    iter_cash_transactions,
+    iter_section_models,
+    iter_statements,
+    iter_trades,
     parse,
+    parse_columns,
+    parse_many,
+    register_enum_alias,
+    set_unknown_enum_policy,
 )
 
 __all__ = [
     "parse",
+    "parse_many",
+    "iter_trades",
+    "iter_cash_transactions",
+    "iter_section_models",
+    "iter_statements",
+    "parse_columns",
+    "available_backends",
+    "register_enum_alias",
+    "set_unknown_enum_policy",
     "FlexQueryResponse",
     "FlexStatement",
     "Trade",
     "CashTransaction",
+    "OpenPosition",
+    "Transfer",
+    "CorporateAction",
+    "OptionEAE",
+    "ChangeInNAV",
     "FlexClient",
+    "AsyncFlexClient",
     "FlexError",
     "FlexAuthError",
     "FlexNotReadyError",
     "FlexRateLimitError",
     "FlexInProgressError",
+    "TokenBucket",
+    "Backoff",
+    "AdaptiveBackoff",
+    "DownloadCache",
 ]
@@ -1,9 +1,15 @@
 import argparse
+import json
 import os
 import sys
+import time
 from datetime import date, timedelta
+from typing import Any
 
 from .flex.client import FlexClient, FlexError
+from .flex.columns import ColumnTable
+from .flex.parallel import iter_parse_times
+from .flex.sections import SECTIONS
 
 
 def load_dotenv(path: str = ".env") -> None:
@@ -58,6 +64,27 @@ def main() -> None:
     download_parser.add_argument("--from-date", help="Optional start date in YYYYMMDD format")
     download_parser.add_argument("--to-date", help="Optional end date in YYYYMMDD format")
 
+    # Parse command
+    parse_parser = subparsers.add_parser("parse", help="Parse Flex Query XML files")
+    parse_parser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="XML files, or directories of *.xml files"
+    )
+    parse_parser.add_argument(
+        "--workers", "-w", type=int, help="Parallel processes (default: one per CPU)"
+    )
+    parse_parser.add_argument(
+        "--format",
+        "-f",
+        choices=["jsonl", "parquet"],
+        default="jsonl",
+        help="jsonl: one report per line; parquet: one file per section (default: jsonl)",
+    )
+    parse_parser.add_argument(
+        "--output",
+        "-o",
+        help="Output file for jsonl (stdout if omitted) or directory for parquet (required)",
+    )
+
     args = parser.parse_args()
 
     if args.command == "download":
@@ -68,6 +95,8 @@ def main() -> None:
             print("Error: --query-id or IBKR_FLEX_QUERY_ID env var is required", file=sys.stderr)
             sys.exit(1)
         handle_download(args)
+    elif args.command == "parse":
+        handle_parse(args)
     else:
         parser.print_help()
         sys.exit(1)
@@ -95,20 +124,21 @@ def handle_download(args: argparse.Namespace) -> None:
             msg += f" ({from_date or ''} to {to_date or ''})"
         print(f"{msg}...", file=sys.stderr)
 
-        data = client.download(
-            token=args.token,
-            query_id=args.query_id,
-            max_retries=args.max_retries,
-            retry_interval=args.retry_interval,
-            from_date=from_date,
-            to_date=to_date,
-        )
+        options = {
+            "token": args.token,
+            "query_id": args.query_id,
+            "max_retries": args.max_retries,
+            "retry_interval": args.retry_interval,
+            "from_date": from_date,
+            "to_date": to_date,
+        }
 
         if args.output:
-            with open(args.output, "wb") as f:
-                f.write(data)
+            # Stream to disk rather than holding the whole report in memory
+            client.download_to(dest=args.output, **options)
             print(f"Report saved to {args.output}", file=sys.stderr)
         else:
+            data = client.download(**options)
             sys.stdout.buffer.write(data)
             sys.stdout.buffer.flush()
 
@@ -120,5 +150,70 @@ def handle_download(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def collect_xml_files(paths: list[str]) -> list[str]:
+    """Expand directories to the *.xml files they contain, sorted by name."""
+    files: list[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(name for name in os.listdir(path) if name.lower().endswith(".xml"))
+            files.extend(os.path.join(path, name) for name in names)
+        else:
+            files.append(path)
+    return files
+
+
+def handle_parse(args: argparse.Namespace) -> None:
+    if args.format == "parquet":
+        if not args.output:
+            print("Error: --output directory is required for parquet", file=sys.stderr)
+            sys.exit(1)
+        try:
+            import pyarrow.parquet as pq  # type: ignore
+        except ImportError:
+            print("Error: parquet output requires pyarrow: pip install pyarrow", file=sys.stderr)
+            sys.exit(1)
+
+    files = collect_xml_files(args.paths)
+    tables = {name: ColumnTable(section.model) for name, section in SECTIONS.items()}
+    out: Any = None
+    if args.format == "jsonl":
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    failed = 0
+    start = time.perf_counter()
+    try:
+        results = iter_parse_times(files, args.workers)
+        for done, (path, result, seconds) in enumerate(results, 1):
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"[{done}/{len(files)}] {path}: error: {result}", file=sys.stderr)
+                continue
+            if out is not None:
+                report = result.model_dump_json()
+                out.write(f'{{"path": {json.dumps(path)}, "report": {report}}}\n')
+            else:
+                for statement in result.FlexStatements:
+                    for name, table in tables.items():
+                        rows = getattr(statement, name)
+                        if not SECTIONS[name].rows:  # a single record, e.g. ChangeInNAV
+                            rows = [] if rows is None else [rows]
+                        for row in rows:
+                            table.append_model(row)
+            print(f"[{done}/{len(files)}] {path}: {seconds:.3f}s", file=sys.stderr)
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+
+    if args.format == "parquet":
+        os.makedirs(args.output, exist_ok=True)
+        for section, table in tables.items():
+            pq.write_table(table.to_arrow(), os.path.join(args.output, f"{section}.parquet"))
+
+    elapsed = time.perf_counter() - start
+    print(f"Parsed {len(files) - failed}/{len(files)} files in {elapsed:.2f}s", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -1,25 +1,65 @@
+from .async_client import AsyncFlexClient as AsyncFlexClient
+from .backends import available_backends as available_backends
+from .cache import DownloadCache as DownloadCache
 from .client import FlexAuthError as FlexAuthError
 from .client import FlexClient as FlexClient
 from .client import FlexError as FlexError
 from .client import FlexInProgressError as FlexInProgressError
 from .client import FlexNotReadyError as FlexNotReadyError
 from .client import FlexRateLimitError as FlexRateLimitError
+from .columns import parse_columns as parse_columns
+from .enum_lookup import register_enum_alias as register_enum_alias
+from .enum_lookup import set_unknown_enum_policy as set_unknown_enum_policy
 from .models import CashTransaction as CashTransaction
+from .models import ChangeInNAV as ChangeInNAV
+from .models import CorporateAction as CorporateAction
 from .models import FlexQueryResponse as FlexQueryResponse
 from .models import FlexStatement as FlexStatement
+from .models import OpenPosition as OpenPosition
+from .models import OptionEAE as OptionEAE
 from .models import Trade as Trade
+from .models import Transfer as Transfer
+from .parallel import parse_many as parse_many
+from .parser import iter_cash_transactions as iter_cash_transactions
+from .parser import iter_section_models as iter_section_models
+from .parser import iter_statements as iter_statements
+from .parser import iter_trades as iter_trades
 from .parser import parse_xml_file as parse
+from .ratelimit import AdaptiveBackoff as AdaptiveBackoff
+from .ratelimit import Backoff as Backoff
+from .ratelimit import TokenBucket as TokenBucket
+from .records import Record as Record
 
 __all__ = [
     "FlexClient",
+    "AsyncFlexClient",
     "FlexError",
     "FlexAuthError",
     "FlexNotReadyError",
     "FlexRateLimitError",
     "FlexInProgressError",
+    "TokenBucket",
+    "Backoff",
+    "AdaptiveBackoff",
+    "DownloadCache",
     "FlexQueryResponse",
     "FlexStatement",
     "Trade",
     "CashTransaction",
+    "OpenPosition",
+    "Transfer",
+    "CorporateAction",
+    "OptionEAE",
+    "ChangeInNAV",
     "parse",
+    "parse_many",
+    "iter_trades",
+    "iter_cash_transactions",
+    "iter_section_models",
+    "iter_statements",
+    "parse_columns",
+    "available_backends",
+    "Record",
+    "register_enum_alias",
+    "set_unknown_enum_policy",
 ]
@@ -0,0 +1,292 @@
+import asyncio
+import os
+from collections.abc import Awaitable, Callable, Iterable
+from types import TracebackType
+from typing import BinaryIO, Literal, TypeVar, overload
+
+from ..vo import FlexQueryID, FlexToken, ReferenceCode
+from .cache import DownloadCache
+from .client import (
+    FlexClient,
+    FlexInProgressError,
+    FlexNotReadyError,
+    FlexRateLimitError,
+    _check_statement_response,
+    _fetch,
+    _fetch_statement_to,
+    _open_sink,
+    _parse_send_request_response,
+    _retry_delay,
+    _send_request_url,
+    _statement_url,
+)
+from .ratelimit import Backoff, TokenBucket
+from .transport import ConnectionPool
+
+T = TypeVar("T")
+
+
+class AsyncFlexClient:
+    """
+    Asyncio counterpart of `FlexClient` (Zero Dependencies).
+
+    Mirrors the sync API and raises the same `FlexError` subclasses. Waiting between
+    polls uses `asyncio.sleep`, so many downloads can be in flight at once; the HTTP
+    requests themselves run on the default thread pool over a shared pool of
+    persistent connections.
+
+    Args:
+        user_agent: Value of the User-Agent header.
+        pool_size: Maximum number of idle connections kept per host; match it to the
+            `download_many` concurrency to keep every connection alive.
+        idle_timeout: Seconds an idle connection may be reused before it is closed.
+        timeout: Socket timeout in seconds.
+        rate_limiter: Optional request budget, shared with other clients using the token.
+        backoff: Retry schedule for 1003/1008/1019 (default: fixed exponential `Backoff`).
+        compression: Ask for gzip/deflate responses, decompressed as they arrive.
+        cache: Optional `DownloadCache` consulted by `download` before any request.
+    """
+
+    BASE_URL = FlexClient.BASE_URL
+
+    def __init__(
+        self,
+        user_agent: str = "python/py-ibkr",
+        pool_size: int = 4,
+        idle_timeout: float = 30.0,
+        timeout: float | None = 60.0,
+        rate_limiter: TokenBucket | None = None,
+        backoff: Backoff | None = None,
+        compression: bool = True,
+        cache: DownloadCache | None = None,
+    ):
+        self.user_agent = user_agent
+        self.pool = ConnectionPool(maxsize=pool_size, idle_timeout=idle_timeout, timeout=timeout)
+        self.rate_limiter = rate_limiter
+        self.backoff = backoff or Backoff()
+        self.compression = compression
+        self.cache = cache
+
+    async def __aenter__(self) -> "AsyncFlexClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+    async def _get(self, url: str) -> bytes:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        return await asyncio.to_thread(_fetch, self.pool, url, self.user_agent, self.compression)
+
+    async def _get_to(self, url: str, sink: BinaryIO, keep_compressed: bool) -> int:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        return await asyncio.to_thread(
+            _fetch_statement_to,
+            self.pool,
+            url,
+            self.user_agent,
+            sink,
+            self.compression,
+            keep_compressed,
+        )
+
+    async def download(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        max_retries: int = 10,
+        retry_interval: int = 10,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> bytes:
+        """
+        Download a Flex Query report. See `FlexClient.download`.
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(query_id, from_date, to_date)
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
+
+        content = await self._poll(
+            token,
+            query_id,
+            lambda reference_code: self.get_statement(token, reference_code),
+            max_retries=max_retries,
+            retry_interval=retry_interval,
+            from_date=from_date,
+            to_date=to_date,
+        )
+        if self.cache is not None and key is not None:
+            await asyncio.to_thread(self.cache.put, key, content)
+        return content
+
+    async def download_to(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        dest: str | os.PathLike[str] | BinaryIO,
+        max_retries: int = 10,
+        retry_interval: int = 10,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        keep_compressed: bool = False,
+    ) -> int:
+        """
+        Stream a Flex Query report into a file. See `FlexClient.download_to`.
+        """
+        with _open_sink(dest) as sink:
+            return await self._poll(
+                token,
+                query_id,
+                lambda reference_code: self.get_statement_to(
+                    token, reference_code, sink, keep_compressed
+                ),
+                max_retries=max_retries,
+                retry_interval=retry_interval,
+                from_date=from_date,
+                to_date=to_date,
+            )
+
+    async def _poll(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        fetch: Callable[[ReferenceCode], Awaitable[T]],
+        max_retries: int,
+        retry_interval: int,
+        from_date: str | None,
+        to_date: str | None,
+    ) -> T:
+        reference_code: ReferenceCode
+        # Stage 1: Send Request (Retrying on 1008 and 1019)
+        for i in range(max_retries):
+            try:
+                reference_code = await self.send_request(
+                    token, query_id, from_date=from_date, to_date=to_date
+                )
+                self.backoff.on_success()
+                break
+            except (FlexInProgressError, FlexRateLimitError) as e:
+                if i == max_retries - 1:
+                    raise
+                await asyncio.sleep(_retry_delay(self.backoff, retry_interval, i, e))
+
+        # Stage 2: Get Statement (Retrying on 1003, 1008 and 1019)
+        for i in range(max_retries):
+            try:
+                result = await fetch(reference_code)
+                self.backoff.on_success()
+                return result
+            except (FlexNotReadyError, FlexInProgressError, FlexRateLimitError) as e:
+                if i == max_retries - 1:
+                    raise
+                await asyncio.sleep(_retry_delay(self.backoff, retry_interval, i, e))
+
+        raise FlexNotReadyError("Maximum retries exceeded while waiting for report to be ready.")
+
+    async def send_request(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> ReferenceCode:
+        """
+        Step 1: Send a request to generate a Flex Query.
+
+        Returns the reference code for the generated report.
+        """
+        url = _send_request_url(self.BASE_URL, token, query_id, from_date, to_date)
+        return _parse_send_request_response(await self._get(url))
+
+    async def get_statement(
+        self, token: FlexToken.Input, reference_code: ReferenceCode.Input
+    ) -> bytes:
+        """
+        Step 2: Retrieve the generated Flex Query statement.
+        """
+        url = _statement_url(self.BASE_URL, token, reference_code)
+        return _check_statement_response(await self._get(url))
+
+    async def get_statement_to(
+        self,
+        token: FlexToken.Input,
+        reference_code: ReferenceCode.Input,
+        sink: BinaryIO,
+        keep_compressed: bool = False,
+    ) -> int:
+        """
+        Step 2, streaming: write the generated statement into `sink`. See
+        `FlexClient.get_statement_to`.
+        """
+        url = _statement_url(self.BASE_URL, token, reference_code)
+        return await self._get_to(url, sink, keep_compressed)
+
+    @overload
+    async def download_many(
+        self,
+        queries: Iterable[tuple[FlexToken.Input, FlexQueryID.Input]],
+        concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+        **kwargs: object,
+    ) -> list[bytes]: ...
+
+    @overload
+    async def download_many(
+        self,
+        queries: Iterable[tuple[FlexToken.Input, FlexQueryID.Input]],
+        concurrency: int = ...,
+        return_exceptions: bool = ...,
+        **kwargs: object,
+    ) -> list[bytes | BaseException]: ...
+
+    async def download_many(
+        self,
+        queries: Iterable[tuple[FlexToken.Input, FlexQueryID.Input]],
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+        **kwargs: object,
+    ) -> list[bytes] | list[bytes | BaseException]:
+        """
+        Download many reports concurrently.
+
+        Args:
+            queries: `(token, query_id)` pairs.
+            concurrency: Maximum number of downloads in flight at once.
+            return_exceptions: Return errors in place of the failed reports instead of
+                raising the first one, which cancels the downloads still running.
+            **kwargs: Passed to `download` (max_retries, retry_interval, dates).
+
+        Returns:
+            The raw XML of each report, in the order of `queries`.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(token: FlexToken.Input, query_id: FlexQueryID.Input) -> bytes:
+            async with semaphore:
+                return await self.download(token, query_id, **kwargs)  # type: ignore[arg-type]
+
+        tasks = [asyncio.ensure_future(limited(token, query_id)) for token, query_id in queries]
+        if return_exceptions:
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # gather leaves the other downloads running: stop them, and let them
+            # release their connections before the error propagates
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -0,0 +1,240 @@
+"""
+XML parser backends for `parse(..., backend=...)`.
+
+- "etree": `xml.etree.ElementTree` builds the element tree, which is then converted
+  (default).
+- "expat": pyexpat start/end handlers convert every row straight from the attribute
+  dict expat reports, without building any `Element`.
+- "lxml": the same handlers as the target of an lxml (libxml2) parser, with
+  `huge_tree` so that very large documents are accepted. External entities are never
+  loaded, from files or the network. Falls back to "etree" when lxml is not installed
+  (`pip install py-ibkr[lxml]`).
+
+All backends produce identical results and raise `ET.ParseError` for malformed XML.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from collections.abc import Collection, Mapping
+from functools import cache
+from types import ModuleType
+from typing import Any
+from xml.parsers import expat
+
+from .models import FlexQueryResponse, FlexStatement
+from .parser import (
+    STATEMENT_SECTIONS,
+    Backend,
+    XMLSource,
+    build_record,
+    clean_attributes,
+    source_chunks,
+)
+from .records import Record, RecordType
+from .sections import Section, section_dispatch
+
+BACKENDS: tuple[Backend, ...] = ("etree", "lxml", "expat")
+
+
+@cache
+def _lxml_etree() -> ModuleType | None:
+    try:
+        from lxml import etree  # type: ignore
+    except ImportError:
+        return None
+    return etree
+
+
+def available_backends() -> list[Backend]:
+    """The backends that run natively here; "lxml" requires lxml to be installed."""
+    return [name for name in BACKENDS if name != "lxml" or _lxml_etree() is not None]
+
+
+def resolve_backend(backend: str) -> Backend:
+    """Check `backend`, falling back from "lxml" to "etree" when lxml is missing."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if backend == "lxml" and _lxml_etree() is None:
+        return "etree"
+    return backend  # type: ignore[return-value]
+
+
+def _parse_error(error: Exception, position: tuple[int, int]) -> ET.ParseError:
+    """The `ET.ParseError` matching a backend's own syntax error."""
+    parse_error = ET.ParseError(str(error))
+    parse_error.position = position
+    return parse_error
+
+
+class _EventBuilder:
+    """
+    Build the response from start/end events, without `Element` objects.
+
+    Follows `parse_flex_query_response`: only the first `FlexStatements` element and
+    the first container of each section count, and rows are the direct children of
+    their container.
+    """
+
+    def __init__(
+        self,
+        validate: bool,
+        sections: Collection[str],
+        fields: Mapping[str, frozenset[str]],
+        record_type: RecordType,
+    ):
+        self.validate = validate
+        self.sections = section_dispatch(frozenset(sections))
+        self.fields = fields
+        self.record_type = record_type
+        self.depth = 0
+        self.root_attrs: dict[str, str] = {}
+        self.statements_seen = False
+        self.in_statements = False
+        self.statements: list[FlexStatement | Record] = []
+        self.statement_attrs: dict[str, str] | None = None
+        self.parsed: dict[str, Any] = {}
+        self.container: Section | None = None
+        self.rows: dict[str, list[Any]] = {}
+        self.result: FlexQueryResponse | Record | None = None
+
+    def start(self, tag: str, attrs: dict[str, str]) -> None:
+        depth = self.depth
+        self.depth += 1
+        if depth == 0:
+            if tag != "FlexQueryResponse":
+                raise ValueError("Not a FlexQueryResponse XML file")
+            self.root_attrs = attrs
+        elif depth == 1:
+            if tag == "FlexStatements" and not self.statements_seen:
+                self.statements_seen = self.in_statements = True
+        elif depth == 2:
+            if self.in_statements and tag == "FlexStatement":
+                self.statement_attrs = attrs
+                self.parsed = {}
+        elif depth == 3:
+            section = self.sections.get(tag)
+            if self.statement_attrs is None or section is None or tag in self.parsed:
+                return
+            if section.rows:
+                self.container = section
+                self.rows = {}
+                self.parsed[tag] = []
+            else:
+                self.parsed[tag] = self._build_row(section, attrs)
+        elif depth == 4:
+            container = self.container
+            if container is not None and tag in container.rows:
+                # Fallback rows are kept raw: only converted if the container needs them
+                standard = tag == container.rows[0]
+                row = self._build_row(container, attrs) if standard else attrs
+                self.rows.setdefault(tag, []).append(row)
+
+    def end(self, tag: str) -> None:
+        self.depth -= 1
+        depth = self.depth
+        if depth == 3:
+            if self.container is not None:
+                self.parsed[self.container.name] = self._section_rows(self.container)
+                self.container = None
+        elif depth == 2:
+            if self.statement_attrs is not None:
+                self.statements.append(self._build_statement(self.statement_attrs))
+                self.statement_attrs = None
+        elif depth == 1:
+            self.in_statements = False
+        elif depth == 0:
+            attrs = clean_attributes(
+                self.root_attrs, FlexQueryResponse, self.fields.get("FlexQueryResponse")
+            )
+            attrs["FlexStatements"] = self.statements
+            self.result = build_record(FlexQueryResponse, attrs, self.validate, self.record_type)
+
+    def close(self) -> FlexQueryResponse | Record | None:
+        # None if the document ended early; the parser reports the syntax error
+        return self.result
+
+    def _build_row(self, section: Section, attrs: dict[str, str]) -> Any:
+        model_class = section.model
+        cleaned = clean_attributes(attrs, model_class, self.fields.get(model_class.__name__))
+        return build_record(model_class, cleaned, self.validate, self.record_type)
+
+    def _section_rows(self, section: Section) -> list[Any]:
+        tag, *fallbacks = section.rows
+        rows = self.rows.get(tag, [])
+        if not rows:
+            rows = [
+                self._build_row(section, raw)
+                for fallback in fallbacks
+                for raw in self.rows.get(fallback, [])
+            ]
+        return rows
+
+    def _build_statement(self, statement_attrs: dict[str, str]) -> FlexStatement | Record:
+        attrs = clean_attributes(statement_attrs, FlexStatement, self.fields.get("FlexStatement"))
+        attrs.update(self.parsed)
+        return build_record(FlexStatement, attrs, self.validate, self.record_type)
+
+
+def parse_expat(
+    source: XMLSource,
+    validate: bool = True,
+    sections: Collection[str] = frozenset(STATEMENT_SECTIONS),
+    fields: Mapping[str, frozenset[str]] | None = None,
+    record_type: RecordType = "model",
+) -> FlexQueryResponse | Record:
+    """Parse a report with the expat backend."""
+    builder = _EventBuilder(validate, sections, fields or {}, record_type)
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = builder.start
+    parser.EndElementHandler = builder.end
+    try:
+        with source_chunks(source) as chunks:
+            for chunk in chunks:
+                parser.Parse(chunk, False)
+        parser.Parse(b"", True)
+    except expat.ExpatError as e:
+        raise _parse_error(e, (e.lineno, e.offset)) from e
+    result = builder.close()
+    assert result is not None
+    return result
+
+
+def parse_lxml(
+    source: XMLSource,
+    validate: bool = True,
+    sections: Collection[str] = frozenset(STATEMENT_SECTIONS),
+    fields: Mapping[str, frozenset[str]] | None = None,
+    record_type: RecordType = "model",
+) -> FlexQueryResponse | Record:
+    """Parse a report with the lxml backend; lxml must be installed."""
+    etree = _lxml_etree()
+    assert etree is not None
+    builder = _EventBuilder(validate, sections, fields or {}, record_type)
+    # huge_tree lifts libxml2's size limits: never load external entities. Predefined
+    # ones such as &amp; must still resolve (False leaves them escaped in attributes)
+    parser = etree.XMLParser(
+        target=builder, huge_tree=True, resolve_entities="internal", no_network=True
+    )
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            # libxml2 reads the file itself, without Python-level chunks
+            return etree.parse(os.fspath(source), parser)  # type: ignore[no-any-return]
+        with source_chunks(source) as chunks:
+            for chunk in chunks:
+                parser.feed(bytes(chunk) if isinstance(chunk, memoryview) else chunk)
+        return parser.close()  # type: ignore[no-any-return]
+    except etree.XMLSyntaxError as e:
+        raise _parse_error(e, e.position) from e
+
+
+def parse_with_backend(
+    source: XMLSource,
+    backend: Backend,
+    validate: bool = True,
+    sections: Collection[str] = frozenset(STATEMENT_SECTIONS),
+    fields: Mapping[str, frozenset[str]] | None = None,
+    record_type: RecordType = "model",
+) -> FlexQueryResponse | Record:
+    """Parse a whole report with a non-default backend, see `resolve_backend`."""
+    parse = parse_expat if backend == "expat" else parse_lxml
+    return parse(source, validate, sections, fields, record_type)
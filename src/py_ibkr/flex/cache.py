@@ -0,0 +1,156 @@
+import hashlib
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date
+
+from ..vo import FlexQueryID
+
+_SUFFIX = ".xml"
+_PART_SUFFIX = ".part"
+
+# Seconds after which a temporary file is taken to be left behind by a crashed writer
+PART_GRACE = 60 * 60
+
+
+class DownloadCache:
+    """
+    On-disk cache of downloaded Flex statements.
+
+    Entries are keyed by `(query_id, from_date, to_date, day)`: Flex data refreshes
+    once a day, so repeated downloads of the same query on the same day are served
+    from disk without any network round-trip. Each entry is a file named after the
+    SHA-256 of its key.
+
+    Writes go through a temporary file renamed into place, so concurrent processes
+    sharing the directory only ever see complete entries; a concurrent eviction
+    turns a hit into a miss, never into a partial read.
+
+    Args:
+        directory: Cache directory, created (mode 0700) if missing.
+        ttl: Seconds an entry stays valid after it was written (None: until the day
+            changes).
+        max_size: Total bytes kept on disk; least recently used entries are evicted
+            beyond it (None: unbounded).
+        clock: Wall-clock time source, for tests.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        ttl: float | None = 24 * 60 * 60,
+        max_size: int | None = 1 << 30,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = os.path.expanduser(os.fspath(directory))
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def key(
+        self,
+        query_id: FlexQueryID.Input,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        day: date | None = None,
+    ) -> str:
+        """Return the cache key of a download; `day` defaults to today."""
+        day = day or date.fromtimestamp(self.clock())
+        raw = "\0".join((str(query_id), from_date or "", to_date or "", day.isoformat()))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached report for `key`, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                now = self.clock()
+                if self.ttl is not None and now - stat.st_mtime > self.ttl:
+                    data = None
+                else:
+                    data = f.read()
+        except FileNotFoundError:
+            data = None
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            # atime records the last use for LRU eviction; mtime keeps the write time
+            os.utime(path, (now, stat.st_mtime))
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store `data` under `key` atomically, then evict down to `max_size`."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=_PART_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            now = self.clock()
+            os.utime(tmp_path, (now, now))
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove expired entries, then the least recently used ones beyond `max_size`.
+
+        Temporary files older than `PART_GRACE`, left by writers that crashed before
+        renaming them into place, are removed too.
+        """
+        now = self.clock()
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_PART_SUFFIX):
+                try:
+                    if now - entry.stat().st_mtime > PART_GRACE:
+                        self._remove(entry.path)
+                except FileNotFoundError:
+                    pass  # renamed into place or removed meanwhile
+                continue
+            if not entry.name.endswith(_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if self.ttl is not None and now - stat.st_mtime > self.ttl:
+                self._remove(entry.path)
+            else:
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+
+        if self.max_size is None:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            # Already evicted by another process, or still open on Windows
+            pass
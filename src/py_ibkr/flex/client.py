@@ -1,9 +1,30 @@
+import http.client
+import os
+import tempfile
 import time
 import xml.etree.ElementTree as ET
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+import zlib
+from collections.abc import Callable, Collection, Generator, Iterator, Mapping
+from contextlib import closing, contextmanager
+from itertools import chain
+from types import TracebackType
+from typing import BinaryIO, TypeVar
+
+from pydantic import BaseModel
 
 from ..vo import FlexQueryID, FlexToken, ReferenceCode
+from .cache import DownloadCache
+from .models import Trade
+from .parser import iter_section_models, iter_trades
+from .ratelimit import Backoff, TokenBucket
+from .transport import ACCEPT_ENCODING, ConnectionPool, ContentDecoder, HTTPStatusError
+
+T = TypeVar("T")
+
+# Size of the chunks read from the network and written to the sink by `download_to`
+CHUNK_SIZE = 64 * 1024
+
+_ERROR_ENVELOPE = b"<FlexStatementResponse"
 
 
 class FlexError(Exception):
@@ -36,6 +57,239 @@ class FlexInProgressError(FlexError):
     pass
 
 
+def _headers(user_agent: str, compression: bool) -> dict[str, str]:
+    headers = {"User-Agent": user_agent}
+    if compression:
+        headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return headers
+
+
+def _fetch(pool: ConnectionPool, url: str, user_agent: str, compression: bool = True) -> bytes:
+    """GET `url` over `pool` and return the decoded body, mapping transport errors to FlexError."""
+    try:
+        with pool.urlopen(url, headers=_headers(user_agent, compression)) as response:
+            decoder = ContentDecoder(response.headers.get("Content-Encoding"))
+            return decoder.decompress(response.read()) + decoder.flush()
+    except HTTPStatusError as e:
+        raise FlexError(f"HTTP Error {e.code}: {e.reason}") from e
+    except (OSError, http.client.HTTPException) as e:
+        raise FlexError(f"URL Error: {e}") from e
+
+
+def _iter_body(
+    pool: ConnectionPool,
+    url: str,
+    user_agent: str,
+    compression: bool = True,
+    keep_compressed: bool = False,
+) -> Generator[tuple[bytes, bytes], None, None]:
+    """
+    GET `url` over `pool` and yield the body in `(decoded, stored)` chunk pairs.
+
+    `stored` is the decoded chunk itself, or with `keep_compressed` the matching piece
+    of a gzip stream: gzip responses are passed through as received, anything else is
+    compressed on the fly. Transport errors are mapped to FlexError.
+    """
+    try:
+        with pool.urlopen(url, headers=_headers(user_agent, compression)) as response:
+            decoder = ContentDecoder(response.headers.get("Content-Encoding"))
+            passthrough = keep_compressed and decoder.encoding in ("gzip", "x-gzip")
+            compressor = None
+            if keep_compressed and not passthrough:
+                compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+            while chunk := response.read(CHUNK_SIZE):
+                data = decoder.decompress(chunk)
+                if passthrough:
+                    yield data, chunk
+                elif compressor is not None:
+                    yield data, compressor.compress(data)
+                else:
+                    yield data, data
+            data = decoder.flush()
+            if compressor is not None:
+                yield data, compressor.compress(data) + compressor.flush()
+            elif data:
+                yield data, b"" if passthrough else data
+    except HTTPStatusError as e:
+        raise FlexError(f"HTTP Error {e.code}: {e.reason}") from e
+    except (OSError, http.client.HTTPException) as e:
+        raise FlexError(f"URL Error: {e}") from e
+
+
+def _read_head(chunks: Iterator[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    """
+    Read the first chunks of a GetStatement body, raising if it is an error envelope.
+
+    `chunks` yields `(decoded, stored)` pairs, see `_iter_body`. Only the first decoded
+    bytes are inspected; envelopes are small, so they are read whole and checked.
+    Returns the pairs read, which the caller passes on before the rest of `chunks`.
+    """
+    head = b""
+    pending = []
+    for data, stored in chunks:
+        head += data
+        pending.append((data, stored))
+        if len(head.lstrip()) >= len(_ERROR_ENVELOPE):
+            break
+    if head.lstrip().startswith(_ERROR_ENVELOPE):
+        for data, stored in chunks:
+            head += data
+            pending.append((data, stored))
+        _check_statement_response(head)
+    return pending
+
+
+def _write_statement(chunks: Iterator[tuple[bytes, bytes]], sink: BinaryIO) -> int:
+    """
+    Copy a GetStatement body to `sink` and return the number of bytes written.
+
+    Nothing is written if the body is an error envelope, see `_read_head`.
+    """
+    size = 0
+    for _, stored in chain(_read_head(chunks), chunks):
+        sink.write(stored)
+        size += len(stored)
+    return size
+
+
+def _statement_chunks(
+    head: list[tuple[bytes, bytes]], chunks: Generator[tuple[bytes, bytes], None, None]
+) -> Iterator[bytes]:
+    """The decoded chunks of a checked GetStatement body; closing this closes the response."""
+    with closing(chunks):
+        for data, _ in chain(head, chunks):
+            if data:
+                yield data
+
+
+def _caching(chunks: Iterator[bytes], cache: DownloadCache, key: str) -> Iterator[bytes]:
+    """Pass `chunks` through, storing the report in `cache` once it arrived completely."""
+    received = []
+    for chunk in chunks:
+        received.append(chunk)
+        yield chunk
+    cache.put(key, b"".join(received))
+
+
+def _fetch_statement_to(
+    pool: ConnectionPool,
+    url: str,
+    user_agent: str,
+    sink: BinaryIO,
+    compression: bool = True,
+    keep_compressed: bool = False,
+) -> int:
+    with closing(_iter_body(pool, url, user_agent, compression, keep_compressed)) as chunks:
+        return _write_statement(chunks, sink)
+
+
+@contextmanager
+def _open_sink(dest: str | os.PathLike[str] | BinaryIO) -> Iterator[BinaryIO]:
+    """
+    Yield a writable binary file for `dest`.
+
+    File objects are used as they are. Paths are written through a temporary file in
+    the same directory that replaces `dest` only once the download succeeded, so a
+    failed download never leaves a truncated report behind.
+    """
+    if not isinstance(dest, (str, os.PathLike)):
+        yield dest
+        return
+    path = os.fspath(dest)
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _retry_delay(backoff: Backoff, retry_interval: float, attempt: int, error: FlexError) -> float:
+    """Seconds to wait before retrying after `error`, as decided by `backoff`."""
+    if isinstance(error, FlexRateLimitError):
+        backoff.on_rate_limited()
+    wait = backoff.delay(retry_interval, attempt)
+    backoff.record_wait(wait)
+    return wait
+
+
+def _send_request_url(
+    base_url: str,
+    token: FlexToken.Input,
+    query_id: FlexQueryID.Input,
+    from_date: str | None = None,
+    to_date: str | None = None,
+) -> str:
+    url = f"{base_url}/SendRequest?t={token}&q={query_id}&v=3"
+    if from_date:
+        url += f"&fd={from_date}"
+    if to_date:
+        url += f"&td={to_date}"
+    return url
+
+
+def _statement_url(
+    base_url: str, token: FlexToken.Input, reference_code: ReferenceCode.Input
+) -> str:
+    return f"{base_url}/GetStatement?t={token}&q={reference_code}&v=3"
+
+
+def _parse_envelope(content: bytes) -> ET.Element:
+    """Parse a FlexStatementResponse, e.g. an HTML error page becomes a `FlexError`."""
+    try:
+        return ET.fromstring(content)
+    except ET.ParseError as e:
+        raise FlexError(f"Invalid Flex Web Service response: {e}") from e
+
+
+def _parse_send_request_response(content: bytes) -> ReferenceCode:
+    root = _parse_envelope(content)
+    status = root.findtext("Status")
+
+    if status == "Success":
+        code = root.findtext("ReferenceCode")
+        if not code:
+            raise FlexError("ReferenceCode missing in success response")
+        return ReferenceCode(code)
+
+    error_code = root.findtext("ErrorCode")
+    error_msg = root.findtext("ErrorMessage")
+
+    if error_code == "1008":
+        raise FlexRateLimitError(f"IBKR Rate Limit Exceeded: {error_msg}")
+    if error_code in ("1009", "1012"):
+        raise FlexAuthError(f"IBKR Authentication Error: {error_msg}")
+    if error_code == "1019":
+        raise FlexInProgressError(f"Statement generation in progress: {error_msg}")
+
+    raise FlexError(f"Flex API Error {error_code}: {error_msg}")
+
+
+def _check_statement_response(content: bytes) -> bytes:
+    """Raise if a GetStatement response is an error envelope instead of the data."""
+    stripped_content = content.strip()
+    if stripped_content.startswith(b"<FlexStatementResponse"):
+        root = _parse_envelope(stripped_content)
+        status = root.findtext("Status")
+        if status != "Success":
+            error_code = root.findtext("ErrorCode")
+            error_msg = root.findtext("ErrorMessage")
+
+            if error_code == "1003":
+                raise FlexNotReadyError(f"Statement not ready: {error_msg}")
+            if error_code == "1008":
+                raise FlexRateLimitError(f"IBKR Rate Limit Exceeded: {error_msg}")
+            if error_code == "1019":
+                raise FlexInProgressError(f"Statement generation in progress: {error_msg}")
+
+            raise FlexError(f"Flex API Error {error_code}: {error_msg}")
+
+    return content
+
+
 class FlexClient:
     """
     Official IBKR Flex Web Service API Client (Zero Dependencies).
@@ -43,23 +297,85 @@ class FlexClient:
     This client implements the two-step protocol for downloading Flex Queries:
     1. SendRequest: Tells IBKR to generate the report.
     2. GetStatement: Fetches the generated report.
+
+    Requests go through a pool of persistent connections, so polling reuses the
+    same TLS session. Call `close()` or use the client as a context manager to
+    release them.
+
+    Args:
+        user_agent: Value of the User-Agent header.
+        pool_size: Maximum number of idle connections kept per host.
+        idle_timeout: Seconds an idle connection may be reused before it is closed.
+        timeout: Socket timeout in seconds.
+        rate_limiter: Optional request budget, shared with other clients using the token.
+        backoff: Retry schedule for 1003/1008/1019; pass a shared `AdaptiveBackoff` to
+            slow down on rate limiting (default: fixed exponential `Backoff`).
+        compression: Ask for gzip/deflate responses (Flex XML shrinks 10-20x on the
+            wire); bodies are decompressed incrementally as they arrive.
+        cache: Optional `DownloadCache`; `download` returns cached reports for the same
+            query and date range without any network round-trip.
     """
 
     BASE_URL = "https://ndcdyn.interactivebrokers.com/AccountManagement/FlexWebService"
 
-    def __init__(self, user_agent: str = "python/py-ibkr"):
+    def __init__(
+        self,
+        user_agent: str = "python/py-ibkr",
+        pool_size: int = 4,
+        idle_timeout: float = 30.0,
+        timeout: float | None = 60.0,
+        rate_limiter: TokenBucket | None = None,
+        backoff: Backoff | None = None,
+        compression: bool = True,
+        cache: DownloadCache | None = None,
+    ):
         self.user_agent = user_agent
+        self.pool = ConnectionPool(maxsize=pool_size, idle_timeout=idle_timeout, timeout=timeout)
+        self.rate_limiter = rate_limiter
+        self.backoff = backoff or Backoff()
+        self.compression = compression
+        self.cache = cache
+
+    def __enter__(self) -> "FlexClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
 
     def _get(self, url: str) -> bytes:
-        """Internal helper for standard GET requests using urllib."""
-        req = Request(url, headers={"User-Agent": self.user_agent})
+        """Internal helper for standard GET requests over the connection pool."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return _fetch(self.pool, url, self.user_agent, self.compression)
+
+    def _open(self, url: str) -> Iterator[bytes]:
+        """Like `_get`, but return a GetStatement body as decoded chunks while it arrives."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        chunks = _iter_body(self.pool, url, self.user_agent, self.compression)
         try:
-            with urlopen(req) as response:
-                return response.read()
-        except HTTPError as e:
-            raise FlexError(f"HTTP Error {e.code}: {e.reason}") from e
-        except URLError as e:
-            raise FlexError(f"URL Error: {e.reason}") from e
+            head = _read_head(chunks)
+        except BaseException:
+            chunks.close()
+            raise
+        return _statement_chunks(head, chunks)
+
+    def _get_to(self, url: str, sink: BinaryIO, keep_compressed: bool) -> int:
+        """Like `_get`, but stream a GetStatement body into `sink`."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return _fetch_statement_to(
+            self.pool, url, self.user_agent, sink, self.compression, keep_compressed
+        )
 
     def download(
         self,
@@ -84,29 +400,188 @@ class FlexClient:
         Returns:
             The raw XML content as bytes.
         """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(query_id, from_date, to_date)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        content = self._poll(
+            token,
+            query_id,
+            lambda reference_code: self.get_statement(token, reference_code),
+            max_retries=max_retries,
+            retry_interval=retry_interval,
+            from_date=from_date,
+            to_date=to_date,
+        )
+        if self.cache is not None and key is not None:
+            self.cache.put(key, content)
+        return content
+
+    def download_to(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        dest: str | os.PathLike[str] | BinaryIO,
+        max_retries: int = 10,
+        retry_interval: int = 10,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        keep_compressed: bool = False,
+    ) -> int:
+        """
+        Download a Flex Query report straight into a file, without holding it in memory.
+
+        The report is written in chunks as it arrives. A path is only replaced once the
+        download completed; a file object receives the bytes as they come.
+
+        Args:
+            dest: Output path or writable binary file object.
+            keep_compressed: Write a gzip file (e.g. `report.xml.gz`) for archival:
+                gzip responses are stored exactly as received, others are compressed
+                while writing.
+            Other arguments as in `download`.
+
+        Returns:
+            The number of bytes written.
+        """
+        with _open_sink(dest) as sink:
+            return self._poll(
+                token,
+                query_id,
+                lambda reference_code: self.get_statement_to(
+                    token, reference_code, sink, keep_compressed
+                ),
+                max_retries=max_retries,
+                retry_interval=retry_interval,
+                from_date=from_date,
+                to_date=to_date,
+            )
+
+    def iter_download(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        max_retries: int = 10,
+        retry_interval: int = 10,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Download a Flex Query report as decoded chunks, yielded as they arrive.
+
+        Polling happens in this call, so protocol errors raise here; the returned
+        iterator reads the body. Pass it to `parse`, `iter_trades` etc. to parse
+        while downloading. The connection is returned to the pool once the iterator
+        is exhausted or closed. A configured `cache` is used as in `download`.
+
+        Args:
+            Same as `download`.
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(query_id, from_date, to_date)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return iter((cached,))
+
+        chunks = self._poll(
+            token,
+            query_id,
+            lambda reference_code: self.open_statement(token, reference_code),
+            max_retries=max_retries,
+            retry_interval=retry_interval,
+            from_date=from_date,
+            to_date=to_date,
+        )
+        if self.cache is not None and key is not None:
+            return _caching(chunks, self.cache, key)
+        return chunks
+
+    def download_parsed(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        sections: Collection[str] = ("Trades", "CashTransactions"),
+        validate: bool = True,
+        fields: Mapping[str, Collection[str]] | None = None,
+        max_retries: int = 10,
+        retry_interval: int = 10,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> Iterator[BaseModel]:
+        """
+        Download a report and yield the rows of `sections` as each element closes.
+
+        Rows (`Trade`, `CashTransaction`, ...) come in document order while the rest
+        of the body is still arriving: the socket keeps receiving while a chunk is
+        being converted, so the total time approaches the longer of download and
+        parse instead of their sum. Only the open path of the document is held in
+        memory.
+
+        Args:
+            sections, validate, fields: As in `parse`.
+            Other arguments as in `download`.
+        """
+        chunks = self.iter_download(
+            token, query_id, max_retries, retry_interval, from_date=from_date, to_date=to_date
+        )
+        return iter_section_models(chunks, sections, validate, fields)
+
+    def iter_download_trades(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        validate: bool = True,
+        fields: Collection[str] | None = None,
+        max_retries: int = 10,
+        retry_interval: int = 10,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> Iterator[Trade]:
+        """Download a report and yield its trades while it arrives, see `download_parsed`."""
+        chunks = self.iter_download(
+            token, query_id, max_retries, retry_interval, from_date=from_date, to_date=to_date
+        )
+        return iter_trades(chunks, validate, fields)
+
+    def _poll(
+        self,
+        token: FlexToken.Input,
+        query_id: FlexQueryID.Input,
+        fetch: Callable[[ReferenceCode], T],
+        max_retries: int,
+        retry_interval: int,
+        from_date: str | None,
+        to_date: str | None,
+    ) -> T:
+        """Run the two-step protocol, passing the reference code to `fetch` once issued."""
         reference_code: ReferenceCode
-        # Stage 1: Send Request (Retrying on 1019)
+        # Stage 1: Send Request (Retrying on 1008 and 1019)
         for i in range(max_retries):
             try:
                 reference_code = self.send_request(
                     token, query_id, from_date=from_date, to_date=to_date
                 )
+                self.backoff.on_success()
                 break
-            except FlexInProgressError:
+            except (FlexInProgressError, FlexRateLimitError) as e:
                 if i == max_retries - 1:
                     raise
-                wait = min(retry_interval * (2**i), 60)
-                time.sleep(wait)
+                time.sleep(_retry_delay(self.backoff, retry_interval, i, e))
 
-        # Stage 2: Get Statement (Retrying on 1003 and 1019)
+        # Stage 2: Get Statement (Retrying on 1003, 1008 and 1019)
         for i in range(max_retries):
             try:
-                return self.get_statement(token, reference_code)
-            except (FlexNotReadyError, FlexInProgressError):
+                result = fetch(reference_code)
+                self.backoff.on_success()
+                return result
+            except (FlexNotReadyError, FlexInProgressError, FlexRateLimitError) as e:
                 if i == max_retries - 1:
                     raise
-                wait = min(retry_interval * (2**i), 60)
-                time.sleep(wait)
+                time.sleep(_retry_delay(self.backoff, retry_interval, i, e))
 
         raise FlexNotReadyError("Maximum retries exceeded while waiting for report to be ready.")
 
@@ -122,59 +597,43 @@ class FlexClient:
 
         Returns the reference code for the generated report.
         """
-        url = f"{self.BASE_URL}/SendRequest?t={token}&q={query_id}&v=3"
-        if from_date:
-            url += f"&fd={from_date}"
-        if to_date:
-            url += f"&td={to_date}"
-
-        content = self._get(url)
-
-        root = ET.fromstring(content)
-        status = root.findtext("Status")
-
-        if status == "Success":
-            code = root.findtext("ReferenceCode")
-            if not code:
-                raise FlexError("ReferenceCode missing in success response")
-            return ReferenceCode(code)
-
-        error_code = root.findtext("ErrorCode")
-        error_msg = root.findtext("ErrorMessage")
-
-        if error_code == "1008":
-            raise FlexRateLimitError(f"IBKR Rate Limit Exceeded: {error_msg}")
-        if error_code in ("1009", "1012"):
-            raise FlexAuthError(f"IBKR Authentication Error: {error_msg}")
-        if error_code == "1019":
-            raise FlexInProgressError(f"Statement generation in progress: {error_msg}")
-
-        raise FlexError(f"Flex API Error {error_code}: {error_msg}")
+        url = _send_request_url(self.BASE_URL, token, query_id, from_date, to_date)
+        return _parse_send_request_response(self._get(url))
 
     def get_statement(self, token: FlexToken.Input, reference_code: ReferenceCode.Input) -> bytes:
         """
         Step 2: Retrieve the generated Flex Query statement.
         """
-        url = f"{self.BASE_URL}/GetStatement?t={token}&q={reference_code}&v=3"
+        url = _statement_url(self.BASE_URL, token, reference_code)
+        return _check_statement_response(self._get(url))
 
-        content = self._get(url)
+    def get_statement_to(
+        self,
+        token: FlexToken.Input,
+        reference_code: ReferenceCode.Input,
+        sink: BinaryIO,
+        keep_compressed: bool = False,
+    ) -> int:
+        """
+        Step 2, streaming: write the generated statement into `sink` in chunks.
 
-        # Check if the response is an error XML instead of the actual data
-        stripped_content = content.strip()
-        if stripped_content.startswith(b"<FlexStatementResponse"):
-            root = ET.fromstring(stripped_content)
-            status = root.findtext("Status")
-            if status != "Success":
-                error_code = root.findtext("ErrorCode")
-                error_msg = root.findtext("ErrorMessage")
+        Nothing is written if IBKR answers with an error envelope. With
+        `keep_compressed`, `sink` receives a gzip stream, see `download_to`.
 
-                if error_code == "1003":
-                    raise FlexNotReadyError(f"Statement not ready: {error_msg}")
-                if error_code == "1008":
-                    raise FlexRateLimitError(f"IBKR Rate Limit Exceeded: {error_msg}")
-                if error_code == "1019":
-                    raise FlexInProgressError(f"Statement generation in progress: {error_msg}")
+        Returns:
+            The number of bytes written.
+        """
+        url = _statement_url(self.BASE_URL, token, reference_code)
+        return self._get_to(url, sink, keep_compressed)
 
-                raise FlexError(f"Flex API Error {error_code}: {error_msg}")
+    def open_statement(
+        self, token: FlexToken.Input, reference_code: ReferenceCode.Input
+    ) -> Iterator[bytes]:
+        """
+        Step 2, incremental: the generated statement as decoded chunks.
 
-        return content
+        Error envelopes raise here, before the first chunk. The response stays open
+        until the iterator is exhausted or closed.
+        """
+        url = _statement_url(self.BASE_URL, token, reference_code)
+        return self._open(url)
@@ -0,0 +1,419 @@
+"""Columnar parsing of Flex statement sections without building Pydantic models.
+
+Rows are streamed with `iter_rows` and converted with the same converter plans the
+model parser uses, then appended to typed buffers:
+
+- Decimal fields: fixed-point int64 values plus a per-column `scale` (Python ints once a
+  value no longer fits in int64); Arrow decimal128/decimal256 in `to_arrow`.
+- date fields: int32 days since 1970-01-01.
+- datetime fields: int64 seconds since 1970-01-01 (naive wall-clock time).
+- time fields: int32 seconds since midnight.
+- bool fields: int8 (0/1).
+- everything else (strings, enums, codes): Python strings.
+
+Missing or blank attributes are recorded in a per-column validity mask.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, time, timedelta
+from decimal import MAX_PREC, Context, Decimal
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+from .parser import Converter, XMLSource, converter_plan, iter_rows, read_source
+from .sections import SECTIONS
+from .utils import parse_bool, parse_date, parse_datetime, parse_decimal, parse_time
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+EPOCH = datetime(1970, 1, 1)
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+# Scaling by a power of ten is exact in this context (the default rounds to 28 digits)
+_EXACT = Context(prec=MAX_PREC)
+
+# Distinct raw values whose encoding a string column remembers
+MEMO_LIMIT = 4096
+
+
+class Column:
+    """A typed, append-only column buffer with a validity mask."""
+
+    typecode: str | None = None
+    _null: Any = 0
+
+    def __init__(self, name: str, convert: Converter):
+        self.name = name
+        self.convert = convert
+        self.values: Any = array(self.typecode) if self.typecode else []
+        self.valid = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def append(self, raw: str | None) -> None:
+        self.append_value(self.convert(raw) if raw is not None else None)
+
+    def set(self, row: int, raw: str) -> None:
+        """Store the raw attribute of row `row`; rows skipped so far are missing."""
+        valid = self.valid
+        if len(valid) != row:
+            self.pad(row)
+        value = self.convert(raw)
+        if value is None:
+            self.values.append(self._null)
+            valid.append(0)
+        else:
+            encoded = self.encode(value)  # may rescale, i.e. replace self.values
+            self.values.append(encoded)
+            valid.append(1)
+
+    def pad(self, rows: int) -> None:
+        """Extend the column with missing values up to `rows` rows."""
+        missing = rows - len(self.valid)
+        if missing <= 0:
+            return
+        if isinstance(self.values, array):
+            self.values.frombytes(bytes(missing * self.values.itemsize))  # zeros
+        else:
+            self.values.extend([self._null] * missing)
+        self.valid.extend(bytes(missing))
+
+    def append_value(self, value: Any) -> None:
+        """Append an already converted value, e.g. a model attribute."""
+        if value is None:
+            self.values.append(self._null)
+            self.valid.append(0)
+        else:
+            encoded = self.encode(value)  # may rescale, i.e. replace self.values
+            self.values.append(encoded)
+            self.valid.append(1)
+
+    def encode(self, value: Any) -> Any:
+        return value
+
+    def decode(self, value: Any) -> Any:
+        return value
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Converters may be closures; `ColumnTable.__setstate__` restores them
+        state = self.__dict__.copy()
+        del state["convert"]
+        return state
+
+    def to_list(self) -> list[Any]:
+        """Decode the buffer back to Python values (None for missing)."""
+        return [
+            self.decode(value) if ok else None
+            for value, ok in zip(self.values, self.valid, strict=True)
+        ]
+
+
+class StringColumn(Column):
+    """
+    Strings, enum values and `;`-joined codes.
+
+    Most of these columns hold a few distinct values (currencies, asset classes,
+    codes), so the encoding of each raw attribute is remembered, up to `MEMO_LIMIT`.
+    """
+
+    _null = None
+
+    def __init__(self, name: str, convert: Converter):
+        super().__init__(name, convert)
+        self._memo: dict[str, str | None] = {}
+
+    def set(self, row: int, raw: str) -> None:
+        valid = self.valid
+        if len(valid) != row:
+            self.pad(row)
+        try:
+            encoded = self._memo[raw]
+        except KeyError:
+            value = self.convert(raw)
+            encoded = None if value is None else self.encode(value)
+            if len(self._memo) < MEMO_LIMIT:
+                self._memo[raw] = encoded
+        self.values.append(encoded)
+        valid.append(encoded is not None)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state["_memo"] = {}
+        return state
+
+    def encode(self, value: Any) -> str:
+        if isinstance(value, Enum):
+            return str(value.value)
+        if isinstance(value, (list, tuple)):
+            # Codes IBKR added later stay plain strings under the "raw" policy
+            return ";".join(str(getattr(v, "value", v)) for v in value)
+        return str(value)
+
+
+class DecimalColumn(Column):
+    """
+    Decimals as int64 scaled by 10**scale; the scale grows to fit the data.
+
+    Values that do not fit in int64 at the column scale, e.g. 20 decimal places, switch
+    the buffer to a list of Python ints, so that no value is ever rounded.
+    """
+
+    typecode = "q"
+
+    def __init__(self, name: str, convert: Converter):
+        super().__init__(name, convert)
+        self.scale = 0
+
+    def set(self, row: int, raw: str) -> None:
+        # Plain notation such as "-1,120.50" is read as digits without a Decimal
+        digits = raw.replace(",", "").strip()
+        dot = digits.find(".")
+        try:
+            unscaled = int(digits if dot < 0 else digits[:dot] + digits[dot + 1 :])
+        except ValueError:  # blank, "N/A", exponents...
+            super().set(row, raw)
+            return
+        if len(self.valid) != row:
+            self.pad(row)
+        encoded = self._rescaled(unscaled, 0 if dot < 0 else len(digits) - dot - 1)
+        self.values.append(encoded)
+        self.valid.append(1)
+
+    def _rescaled(self, unscaled: int, places: int) -> int:
+        """`unscaled` * 10**-`places` in the column scale, which grows to `places`."""
+        if places > self.scale:
+            factor = 10 ** (places - self.scale)
+            values: Any = [v * factor for v in self.values]
+            if isinstance(self.values, array):
+                try:
+                    values = array("q", values)
+                except OverflowError:
+                    pass
+            self.values = values
+            self.scale = places
+        encoded = unscaled * 10 ** (self.scale - places)
+        if not INT64_MIN <= encoded <= INT64_MAX and isinstance(self.values, array):
+            self.values = self.values.tolist()
+        return encoded
+
+    def encode(self, value: Decimal) -> int:
+        exponent = value.as_tuple().exponent
+        places = -exponent if isinstance(exponent, int) and exponent < 0 else 0
+        return self._rescaled(int(value.scaleb(places, _EXACT)), places)
+
+    def decode(self, value: int) -> Decimal:
+        return Decimal(value).scaleb(-self.scale, _EXACT)
+
+
+class DateColumn(Column):
+    typecode = "i"
+
+    def encode(self, value: date) -> int:
+        return value.toordinal() - EPOCH_ORDINAL
+
+    def decode(self, value: int) -> date:
+        return date.fromordinal(value + EPOCH_ORDINAL)
+
+
+class DateTimeColumn(Column):
+    typecode = "q"
+
+    def encode(self, value: datetime) -> int:
+        delta = value - EPOCH
+        return delta.days * 86400 + delta.seconds
+
+    def decode(self, value: int) -> datetime:
+        return EPOCH + timedelta(seconds=value)
+
+
+class TimeColumn(Column):
+    typecode = "i"
+
+    def encode(self, value: time) -> int:
+        return value.hour * 3600 + value.minute * 60 + value.second
+
+    def decode(self, value: int) -> time:
+        return time(value // 3600, value % 3600 // 60, value % 60)
+
+
+class BoolColumn(Column):
+    typecode = "b"
+
+    def encode(self, value: bool) -> int:
+        return int(value)
+
+    def decode(self, value: int) -> bool:
+        return bool(value)
+
+
+_COLUMN_TYPES: dict[Converter, type[Column]] = {
+    parse_decimal: DecimalColumn,
+    parse_date: DateColumn,
+    parse_datetime: DateTimeColumn,
+    parse_time: TimeColumn,
+    parse_bool: BoolColumn,
+}
+
+
+class ColumnTable:
+    """
+    Columns of one section, laid out from the fields of its model.
+
+    A row only touches the columns of the attributes it has: rows set a few dozen of
+    the ~100 model fields. Columns are padded with missing values when they are read.
+    """
+
+    def __init__(self, model_class: type[BaseModel]):
+        self.model_class = model_class
+        self._columns: dict[str, Column] = {
+            name: _COLUMN_TYPES.get(convert, StringColumn)(name, convert)
+            for name, convert in converter_plan(model_class).items()
+        }
+        self.num_rows = 0
+        self._setters = {name: column.set for name, column in self._columns.items()}
+
+    @property
+    def columns(self) -> dict[str, Column]:
+        """The columns by field name, each `num_rows` long."""
+        self._pad()
+        return self._columns
+
+    def _pad(self) -> None:
+        for column in self._columns.values():
+            column.pad(self.num_rows)
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __getstate__(self) -> dict[str, Any]:
+        self._pad()  # the pickled columns are complete
+        state = self.__dict__.copy()
+        del state["_setters"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        plan = converter_plan(self.model_class)
+        for name, column in self._columns.items():
+            column.convert = plan[name]
+        self._setters = {name: column.set for name, column in self._columns.items()}
+
+    def append(self, attrs: Mapping[str, str]) -> None:
+        row = self.num_rows
+        setters = self._setters
+        for name, raw in attrs.items():
+            set_cell = setters.get(name)
+            if set_cell is not None:
+                set_cell(row, raw)
+        self.num_rows = row + 1
+
+    def append_model(self, model: BaseModel) -> None:
+        row = self.num_rows
+        columns = self._columns
+        for name, value in model.__dict__.items():
+            column = columns.get(name)
+            if column is not None and value is not None:
+                column.pad(row)
+                column.append_value(value)
+        self.num_rows = row + 1
+
+    def to_pydict(self) -> dict[str, list[Any]]:
+        return {name: column.to_list() for name, column in self.columns.items()}
+
+    def to_arrow(self) -> Any:
+        """Convert to a `pyarrow.Table` (requires the optional `pyarrow` package)."""
+        try:
+            import pyarrow as pa  # type: ignore
+        except ImportError as e:
+            raise ImportError("to_arrow() requires pyarrow: pip install pyarrow") from e
+
+        arrays = []
+        fields = []
+        for name, column in self.columns.items():
+            mask = [not ok for ok in column.valid]
+            if isinstance(column, DecimalColumn):
+                arr = _decimal_array(pa, column, mask)
+            elif isinstance(column, DateColumn):
+                arr = pa.array(column.values, type=pa.int32(), mask=mask).cast(pa.date32())
+            elif isinstance(column, DateTimeColumn):
+                arr = pa.array(column.values, type=pa.int64(), mask=mask).cast(pa.timestamp("s"))
+            elif isinstance(column, TimeColumn):
+                arr = pa.array(column.values, type=pa.int32(), mask=mask).cast(pa.time32("s"))
+            elif isinstance(column, BoolColumn):
+                arr = pa.array([bool(v) for v in column.values], type=pa.bool_(), mask=mask)
+            else:
+                arr = pa.array(column.values, type=pa.string())
+            arrays.append(arr)
+            fields.append(pa.field(name, arr.type))
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _decimal_array(pa: Any, column: DecimalColumn, mask: list[bool]) -> Any:
+    """A decimal128 (decimal256 past 38 digits) array with the precision the values need."""
+    values = column.values
+    largest = max(-min(values, default=0), max(values, default=0))
+    precision = max(len(str(largest)), column.scale, 1)
+    if precision > 76:
+        raise ValueError(f"{column.name}: {precision} digits exceed Arrow's decimal256")
+    decimal = pa.decimal128 if precision <= 38 else pa.decimal256
+    if isinstance(values, array):
+        # decimal128 stores the unscaled integer: reinterpret the int64 values at the scale
+        unscaled = pa.array(values, type=pa.int64(), mask=mask).cast(pa.decimal128(38, 0))
+        return unscaled.view(pa.decimal128(38, column.scale)).cast(decimal(precision, column.scale))
+    return pa.array(column.to_list(), type=decimal(precision, column.scale))
+
+
+def parse_columns(
+    source: XMLSource,
+    sections: Iterable[str] = tuple(SECTIONS),
+    cache_dir: str | None = None,
+) -> dict[str, ColumnTable]:
+    """
+    Parse statement sections straight into column buffers.
+
+    Rows of all statements are concatenated per section; use the `accountId` column to
+    tell accounts apart.
+
+    Args:
+        source: Path, in-memory buffer or binary file object of the XML report, as
+            for `parse`.
+        sections: Section tags to collect (default: all of `sections.SECTIONS`).
+        cache_dir: Directory for binary snapshots of the tables, see `parse`. Loading
+            a snapshot copies the buffers back without touching the XML.
+
+    Returns:
+        A `ColumnTable` per requested section, keyed by section tag.
+    """
+    sections = tuple(sections)
+    if cache_dir is not None:
+        from .snapshot import cached_parse
+
+        data = read_source(source)  # file objects are hashed in memory
+        return cached_parse(
+            data,
+            cache_dir,
+            lambda: parse_columns(data, sections),
+            variant="columns:" + ",".join(sections),
+        )
+
+    tables = {}
+    targets: dict[tuple[str, str], ColumnTable] = {}
+    rows: dict[str, tuple[str, ...]] = {}
+    for name in sections:
+        if name not in SECTIONS:
+            raise ValueError(f"Unsupported columnar section: {name}")
+        section = SECTIONS[name]
+        table = tables[name] = ColumnTable(section.model)
+        for tag in section.row_tags:
+            targets[section.parent, tag] = table
+        rows[section.parent] = (*rows.get(section.parent, ()), *section.row_tags)
+
+    for parent, elem in iter_rows(source, rows):
+        targets[parent, elem.tag].append(elem.attrib)
+
+    return tables
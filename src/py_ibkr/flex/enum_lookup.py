@@ -0,0 +1,126 @@
+"""
+Value -> member lookup tables for the Flex enums.
+
+Each enum gets one precomputed dict holding its values and the aliases registered
+for it, so converting an attribute is a single dict hit. Only a miss goes further:
+to the enum's fallback (e.g. multi-leg "LMT;MKT" order types), then to the policy
+for unknown values:
+
+- "raise": raise ValueError (default).
+- "unknown": map to the enum's `UNKNOWN` member.
+- "raw": keep the string. Pydantic rejects it on enum fields, so this suits
+  `validate=False`, compact records and `parse_columns`.
+"""
+
+from collections.abc import Callable
+from enum import Enum
+from functools import cache
+from typing import Any, Literal
+
+from .enums import CashAction, OrderType, TransferType
+
+UnknownEnumPolicy = Literal["raise", "unknown", "raw"]
+
+# Spellings IBKR emits besides the canonical values: enum -> {alias: value}
+ENUM_ALIASES: dict[type[Enum], dict[str, str]] = {
+    CashAction: {"Deposits/Withdrawals": "Deposits & Withdrawals"},
+    TransferType: {"ACAT": "ACATS"},
+}
+
+
+def _multiple_order_types(value: str) -> str | None:
+    # Multi-leg orders report e.g. "LMT;MKT", see OrderType.MULTIPLE
+    return "MULTIPLE" if ";" in value else None
+
+
+# Tried on a lookup miss, for value families no table can list: enum -> value or None
+_FALLBACKS: dict[type[Enum], Callable[[str], str | None]] = {
+    OrderType: _multiple_order_types,
+}
+
+_policy: UnknownEnumPolicy = "raise"
+
+
+@cache
+def enum_table(enum_class: type[Enum]) -> dict[str, Any]:
+    """The lookup table of `enum_class`: values and aliases to members, "" to None."""
+    table: dict[str, Any] = {"": None}
+    table.update((member.value, member) for member in enum_class)
+    for alias, value in ENUM_ALIASES.get(enum_class, {}).items():
+        table[alias] = enum_class(value)
+    return table
+
+
+def register_enum_alias(enum_class: type[Enum], alias: str, value: str) -> None:
+    """Accept `alias` as a spelling of the `value` member of `enum_class`."""
+    member = enum_class(value)
+    ENUM_ALIASES.setdefault(enum_class, {})[alias] = value
+    enum_table(enum_class)[alias] = member
+    from .utils import parse_codes  # utils builds on this module
+
+    parse_codes.cache_clear()  # may hold the value as unknown
+
+
+def set_unknown_enum_policy(policy: UnknownEnumPolicy) -> None:
+    """Choose what happens to values missing from an enum, for all parsing in this process."""
+    global _policy
+    if policy not in ("raise", "unknown", "raw"):
+        raise ValueError(f"Unknown enum policy: {policy}")
+    _policy = policy
+    from .utils import parse_codes  # utils builds on this module
+
+    parse_codes.cache_clear()  # may hold results of the previous policy
+
+
+def get_unknown_enum_policy() -> UnknownEnumPolicy:
+    return _policy
+
+
+EnumSettings = tuple[UnknownEnumPolicy, dict[type[Enum], dict[str, str]]]
+
+
+def enum_settings() -> EnumSettings:
+    """The policy and aliases of this process, for `apply_enum_settings` in a worker."""
+    return _policy, {enum_class: dict(aliases) for enum_class, aliases in ENUM_ALIASES.items()}
+
+
+def apply_enum_settings(settings: EnumSettings) -> None:
+    """
+    Install the policy and aliases of another process.
+
+    Worker processes started with "spawn" or "forkserver" import this module afresh,
+    so they only see what the parent set up through this.
+    """
+    policy, aliases = settings
+    for enum_class, enum_aliases in aliases.items():
+        for alias, value in enum_aliases.items():
+            register_enum_alias(enum_class, alias, value)
+    set_unknown_enum_policy(policy)
+
+
+def resolve_missing(enum_class: type[Enum], value: str) -> Any:
+    """Convert a value missing from the table of `enum_class`."""
+    fallback = _FALLBACKS.get(enum_class)
+    resolved = fallback(value) if fallback is not None else None
+    if resolved is not None:
+        member = enum_class(resolved)
+        enum_table(enum_class)[value] = member  # a dict hit from now on
+        return member
+    if _policy == "unknown":
+        return enum_class["UNKNOWN"]
+    if _policy == "raw":
+        return value
+    raise ValueError(f"{value!r} is not a valid {enum_class.__name__}")
+
+
+def enum_converter(enum_class: type[Enum]) -> Callable[[str], Any]:
+    """Converter of raw attribute values to members of `enum_class`."""
+    table = enum_table(enum_class)
+
+    def convert(value: str) -> Any:
+        try:
+            return table[value]
+        except KeyError:
+            return resolve_missing(enum_class, value)
+
+    return convert
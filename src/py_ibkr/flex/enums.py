@@ -2,6 +2,9 @@
 
 Values are the text sent by IB in XML element attribute.
 Names keep the convention of using UPPERCASE for Enums.
+
+Every enum has an `UNKNOWN` member, which values IBKR adds later are mapped to under
+the "unknown" policy of `enum_lookup`.
 """
 
 from enum import Enum, unique
@@ -20,6 +23,7 @@ class CashAction(str, Enum):
     PAYMENTINLIEU = "Payment In Lieu Of Dividends"
     COMMADJ = "Commission Adjustments"
     ADVISORFEES = "Advisor Fees"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -93,6 +97,7 @@ class Code(str, Enum):
     STCG = "ST"  # Short-term P/L
     STOCKYIELD = "SY"  # Positions that may be eligible for Stock Yield.
     TRANSFER = "T"  # Transfer
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -113,6 +118,7 @@ class AssetClass(str, Enum):
     OPTIONSONFUTURES = "FSFOP"
     OPTIONSFUTURESSTYLE = "FSOPT"
     MUTUALFUND = "FUND"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -124,6 +130,7 @@ class TradeType(str, Enum):
     TRADECORRECT = "TradeCorrect"
     BOOKTRADE = "BookTrade"
     DVPTRADE = "DvpTrade"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -132,6 +139,7 @@ class BuySell(str, Enum):
     CANCELBUY = "BUY (Ca.)"
     SELL = "SELL"
     CANCELSELL = "SELL (Ca.)"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -159,6 +167,7 @@ class OrderType(str, Enum):
     TRAIL = "TRAIL"
     REL = "REL"
     MIT = "MIT"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -196,6 +205,7 @@ class Reorg(str, Enum):
     TENDERISSUE = "TI"
     TENDER = "TO"
     TBILLMATURITY = "TM"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -206,18 +216,21 @@ class OptionAction(str, Enum):
     SELL = "Sell"
     BUY = "Buy"
     CASHSETTLEMENT = "Cash Settlement"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
 class LongShort(str, Enum):
     LONG = "Long"
     SHORT = "Short"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
 class ToFrom(str, Enum):
     TO = "To"
     FROM = "From"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
@@ -226,21 +239,25 @@ class TransferType(str, Enum):
     ACATS = "ACATS"
     ATON = "ATON"
     FOP = "FOP"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
 class InOut(str, Enum):
     IN = "IN"
     OUT = "OUT"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
 class DeliveredReceived(str, Enum):
     DELIVERED = "Delivered"
     RECEIVED = "Received"
+    UNKNOWN = "UNKNOWN"
 
 
 @unique
 class PutCall(str, Enum):
     PUT = "P"
     CALL = "C"
+    UNKNOWN = "UNKNOWN"
@@ -1,12 +1,39 @@
 from __future__ import annotations
 
+import datetime as dt
 from datetime import date, datetime, time
 from decimal import Decimal
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidatorFunctionWrapHandler, WrapValidator
 
 from ..vo import AccountID, ConID, CurrencyCode, Symbol
-from .enums import AssetClass, BuySell, CashAction, Code, OpenClose, OrderType, PutCall, TradeType
+from .enums import (
+    AssetClass,
+    BuySell,
+    CashAction,
+    Code,
+    InOut,
+    LongShort,
+    OpenClose,
+    OptionAction,
+    OrderType,
+    PutCall,
+    Reorg,
+    TradeType,
+    TransferType,
+)
+
+
+def _keep_parsed_codes(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    # Tuples from `parse_codes` are shared between rows: keep them instead of a copy
+    if type(value) is tuple and all(type(code) is Code for code in value):
+        return value
+    return handler(value)
+
+
+# `notes`/`code` sequences, immutable so that equal strings can share one tuple
+Codes = Annotated[tuple[Code, ...], WrapValidator(_keep_parsed_codes)]
 
 
 class FlexModel(BaseModel):
@@ -50,7 +77,7 @@ class Trade(FlexModel):
     ibCommission: Decimal | None = None
     ibCommissionCurrency: str | None = None
     closePrice: Decimal | None = None
-    notes: list[Code] = Field(default_factory=list)
+    notes: Codes = ()
     cost: Decimal | None = None
     mtmPnl: Decimal | None = None
     origTradePrice: Decimal | None = None
@@ -141,7 +168,7 @@ class CashTransaction(FlexModel):
     putCall: PutCall | None = None
     principalAdjustFactor: Decimal | None = None
     tradeID: str | None = None
-    code: list[Code] = Field(default_factory=list)
+    code: Codes = ()
     transactionID: str | None = None
     reportDate: date | None = None
     clientReference: str | None = None
@@ -173,6 +200,273 @@ class CashReportCurrency(FlexModel):
     reportDate: date | None = None
 
 
+class OpenPosition(FlexModel):
+    side: LongShort | None = None
+    assetCategory: AssetClass | None = None
+    subCategory: str | None = None
+    accountId: AccountID.Input | None = None
+    acctAlias: str | None = None
+    model: str | None = None
+    currency: CurrencyCode.Input | None = None
+    fxRateToBase: Decimal | None = None
+    symbol: Symbol.Input | None = None
+    description: str | None = None
+    conid: ConID.Input | None = None
+    securityID: str | None = None
+    securityIDType: str | None = None
+    cusip: str | None = None
+    isin: str | None = None
+    figi: str | None = None
+    listingExchange: str | None = None
+    underlyingConid: ConID.Input | None = None
+    underlyingSymbol: Symbol.Input | None = None
+    underlyingSecurityID: str | None = None
+    underlyingListingExchange: str | None = None
+    issuer: str | None = None
+    issuerCountryCode: str | None = None
+    multiplier: Decimal | None = None
+    strike: Decimal | None = None
+    expiry: date | None = None
+    putCall: PutCall | None = None
+    principalAdjustFactor: Decimal | None = None
+    reportDate: date | None = None
+    position: Decimal | None = None
+    markPrice: Decimal | None = None
+    positionValue: Decimal | None = None
+    openPrice: Decimal | None = None
+    costBasisPrice: Decimal | None = None
+    costBasisMoney: Decimal | None = None
+    percentOfNAV: Decimal | None = None
+    fifoPnlUnrealized: Decimal | None = None
+    levelOfDetail: str | None = None
+    openDateTime: datetime | None = None
+    holdingPeriodDateTime: datetime | None = None
+    vestingDate: date | None = None
+    code: Codes = ()
+    originatingOrderID: str | None = None
+    originatingTransactionID: str | None = None
+    accruedInt: Decimal | None = None
+    serialNumber: str | None = None
+    deliveryType: str | None = None
+    commodityType: str | None = None
+    fineness: Decimal | None = None
+    weight: str | None = None
+
+
+class Transfer(FlexModel):
+    type: TransferType | None = None
+    direction: InOut | None = None
+    assetCategory: AssetClass | None = None
+    subCategory: str | None = None
+    accountId: AccountID.Input | None = None
+    acctAlias: str | None = None
+    model: str | None = None
+    currency: CurrencyCode.Input | None = None
+    fxRateToBase: Decimal | None = None
+    symbol: Symbol.Input | None = None
+    description: str | None = None
+    conid: ConID.Input | None = None
+    securityID: str | None = None
+    securityIDType: str | None = None
+    cusip: str | None = None
+    isin: str | None = None
+    figi: str | None = None
+    listingExchange: str | None = None
+    underlyingConid: ConID.Input | None = None
+    underlyingSymbol: Symbol.Input | None = None
+    underlyingSecurityID: str | None = None
+    underlyingListingExchange: str | None = None
+    issuer: str | None = None
+    issuerCountryCode: str | None = None
+    multiplier: Decimal | None = None
+    strike: Decimal | None = None
+    expiry: dt.date | None = None
+    putCall: PutCall | None = None
+    principalAdjustFactor: Decimal | None = None
+    reportDate: dt.date | None = None
+    date: dt.date | None = None  # `dt.date` in this class: the field shadows `date`
+    dateTime: datetime | None = None
+    settleDate: dt.date | None = None
+    company: str | None = None
+    account: str | None = None
+    accountName: str | None = None
+    deliveringBroker: str | None = None
+    quantity: Decimal | None = None
+    transferPrice: Decimal | None = None
+    positionAmount: Decimal | None = None
+    positionAmountInBase: Decimal | None = None
+    pnlAmount: Decimal | None = None
+    pnlAmountInBase: Decimal | None = None
+    cashTransfer: Decimal | None = None
+    code: Codes = ()
+    clientReference: str | None = None
+    transactionID: str | None = None
+    levelOfDetail: str | None = None
+    positionInstructionID: str | None = None
+    positionInstructionSetID: str | None = None
+    serialNumber: str | None = None
+    deliveryType: str | None = None
+    commodityType: str | None = None
+    fineness: Decimal | None = None
+    weight: str | None = None
+
+
+class CorporateAction(FlexModel):
+    type: Reorg | None = None
+    assetCategory: AssetClass | None = None
+    subCategory: str | None = None
+    accountId: AccountID.Input | None = None
+    acctAlias: str | None = None
+    model: str | None = None
+    currency: CurrencyCode.Input | None = None
+    fxRateToBase: Decimal | None = None
+    symbol: Symbol.Input | None = None
+    description: str | None = None
+    conid: ConID.Input | None = None
+    securityID: str | None = None
+    securityIDType: str | None = None
+    cusip: str | None = None
+    isin: str | None = None
+    figi: str | None = None
+    listingExchange: str | None = None
+    underlyingConid: ConID.Input | None = None
+    underlyingSymbol: Symbol.Input | None = None
+    underlyingSecurityID: str | None = None
+    underlyingListingExchange: str | None = None
+    issuer: str | None = None
+    issuerCountryCode: str | None = None
+    multiplier: Decimal | None = None
+    strike: Decimal | None = None
+    expiry: date | None = None
+    putCall: PutCall | None = None
+    principalAdjustFactor: Decimal | None = None
+    reportDate: date | None = None
+    dateTime: datetime | None = None
+    actionDescription: str | None = None
+    amount: Decimal | None = None
+    proceeds: Decimal | None = None
+    value: Decimal | None = None
+    quantity: Decimal | None = None
+    fifoPnlRealized: Decimal | None = None
+    mtmPnl: Decimal | None = None
+    code: Codes = ()
+    transactionID: str | None = None
+    actionID: str | None = None
+    levelOfDetail: str | None = None
+    serialNumber: str | None = None
+    deliveryType: str | None = None
+    commodityType: str | None = None
+    fineness: Decimal | None = None
+    weight: str | None = None
+
+
+class OptionEAE(FlexModel):
+    """An option exercise, assignment or expiration (tag: OptionEAE)."""
+
+    transactionType: OptionAction | None = None
+    assetCategory: AssetClass | None = None
+    subCategory: str | None = None
+    accountId: AccountID.Input | None = None
+    acctAlias: str | None = None
+    model: str | None = None
+    currency: CurrencyCode.Input | None = None
+    fxRateToBase: Decimal | None = None
+    symbol: Symbol.Input | None = None
+    description: str | None = None
+    conid: ConID.Input | None = None
+    securityID: str | None = None
+    securityIDType: str | None = None
+    cusip: str | None = None
+    isin: str | None = None
+    figi: str | None = None
+    listingExchange: str | None = None
+    underlyingConid: ConID.Input | None = None
+    underlyingSymbol: Symbol.Input | None = None
+    underlyingSecurityID: str | None = None
+    underlyingListingExchange: str | None = None
+    issuer: str | None = None
+    issuerCountryCode: str | None = None
+    multiplier: Decimal | None = None
+    strike: Decimal | None = None
+    expiry: dt.date | None = None
+    putCall: PutCall | None = None
+    principalAdjustFactor: Decimal | None = None
+    date: dt.date | None = None  # `dt.date` in this class: the field shadows `date`
+    quantity: Decimal | None = None
+    tradePrice: Decimal | None = None
+    markPrice: Decimal | None = None
+    proceeds: Decimal | None = None
+    commisionsAndTax: Decimal | None = None  # sic, as spelled by IBKR
+    costBasis: Decimal | None = None
+    realizedPnl: Decimal | None = None
+    fxPnl: Decimal | None = None
+    mtmPnl: Decimal | None = None
+    tradeID: str | None = None
+    serialNumber: str | None = None
+    deliveryType: str | None = None
+    commodityType: str | None = None
+    fineness: Decimal | None = None
+    weight: str | None = None
+
+
+class ChangeInNAV(FlexModel):
+    """The change in net asset value over the statement period (a single element)."""
+
+    accountId: AccountID.Input | None = None
+    acctAlias: str | None = None
+    model: str | None = None
+    currency: CurrencyCode.Input | None = None
+    fromDate: date | None = None
+    toDate: date | None = None
+    startingValue: Decimal | None = None
+    mtm: Decimal | None = None
+    realized: Decimal | None = None
+    changeInUnrealized: Decimal | None = None
+    costAdjustments: Decimal | None = None
+    transferredPnlAdjustments: Decimal | None = None
+    depositsWithdrawals: Decimal | None = None
+    internalCashTransfers: Decimal | None = None
+    assetTransfers: Decimal | None = None
+    debitCardActivity: Decimal | None = None
+    billPay: Decimal | None = None
+    dividends: Decimal | None = None
+    withholdingTax: Decimal | None = None
+    withholding871m: Decimal | None = None
+    withholdingTaxCollected: Decimal | None = None
+    changeInDividendAccruals: Decimal | None = None
+    interest: Decimal | None = None
+    changeInInterestAccruals: Decimal | None = None
+    advisorFees: Decimal | None = None
+    brokerFees: Decimal | None = None
+    changeInBrokerFeeAccruals: Decimal | None = None
+    clientFees: Decimal | None = None
+    otherFees: Decimal | None = None
+    feesReceivables: Decimal | None = None
+    commissions: Decimal | None = None
+    commissionReceivables: Decimal | None = None
+    forexCommissions: Decimal | None = None
+    transactionTax: Decimal | None = None
+    taxReceivables: Decimal | None = None
+    salesTax: Decimal | None = None
+    billableSalesTax: Decimal | None = None
+    softDollars: Decimal | None = None
+    netFxTrading: Decimal | None = None
+    fxTranslation: Decimal | None = None
+    linkingAdjustments: Decimal | None = None
+    corporateActionProceeds: Decimal | None = None
+    commissionCreditsRedemption: Decimal | None = None
+    grantActivity: Decimal | None = None
+    excessFundSweep: Decimal | None = None
+    other: Decimal | None = None
+    endingValue: Decimal | None = None
+    twr: Decimal | None = None
+
+
+# FlexStatement fields named after these models shadow them within the class
+_OptionEAE = OptionEAE
+_ChangeInNAV = ChangeInNAV
+
+
 class FlexStatement(FlexModel):
     accountId: AccountID.Input | None = None
     fromDate: date | None = None
@@ -182,6 +476,11 @@ class FlexStatement(FlexModel):
     Trades: list[Trade] = Field(default_factory=list)
     CashTransactions: list[CashTransaction] = Field(default_factory=list)
     CashReport: list[CashReportCurrency] = Field(default_factory=list)
+    OpenPositions: list[OpenPosition] = Field(default_factory=list)
+    Transfers: list[Transfer] = Field(default_factory=list)
+    CorporateActions: list[CorporateAction] = Field(default_factory=list)
+    OptionEAE: list[_OptionEAE] = Field(default_factory=list)
+    ChangeInNAV: _ChangeInNAV | None = None
 
 
 class FlexQueryResponse(FlexModel):
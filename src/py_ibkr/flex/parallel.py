@@ -0,0 +1,300 @@
+"""
+Parallel parsing across processes.
+
+- `parse_parallel`: consolidated reports hold one `FlexStatement` per account. The
+  parent process only scans the raw bytes for statement boundaries; worker processes
+  parse batches of statements and send them back pickled.
+- `parse_many`: whole files, e.g. an archive of daily reports, one file per task.
+"""
+
+import mmap
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from itertools import islice, pairwise
+from typing import Any, TypeVar
+
+from .enum_lookup import apply_enum_settings, enum_settings
+from .models import FlexQueryResponse, FlexStatement
+from .parser import (
+    STATEMENT_SECTIONS,
+    XMLBuffer,
+    parse_flex_query_response,
+    parse_flex_statement,
+    parse_root,
+    parse_xml_file,
+)
+from .records import Record, RecordType
+from .snapshot import dumps, loads
+
+# `<FlexStatement` followed by whitespace, `>` or `/` (not `<FlexStatements`)
+_STATEMENT_START = re.compile(rb"<FlexStatement[\s/>]")
+_STATEMENT_END = re.compile(rb"</FlexStatement>")
+_CONTAINER_START = re.compile(rb"<FlexStatements[\s/>]")
+_CONTAINER_END = re.compile(rb"</FlexStatements\s*>")
+_TAG_END = re.compile(rb">")
+
+# Batches per worker, so that uneven statement sizes still balance out
+_BATCHES_PER_WORKER = 4
+
+# Files queued per worker in `parse_many`: keeps workers busy without holding the
+# results of a whole archive in memory when the consumer is slower
+_PENDING_PER_WORKER = 2
+
+P = TypeVar("P", str, os.PathLike[str])
+
+
+def statement_offsets(data: XMLBuffer) -> list[tuple[int, int]]:
+    """
+    Byte ranges `[start, end)` of the `FlexStatement` elements in the first
+    `FlexStatements` container of a report, the only one `parse` reads.
+
+    This is a plain byte scan, not an XML parse: it relies on Flex reports having
+    no comments or CDATA sections, which IBKR never emits.
+    """
+    container = _CONTAINER_START.search(data)
+    if container is None:
+        return []
+    tag_end = _TAG_END.search(data, container.start())
+    if tag_end is None:
+        raise ValueError("Unterminated FlexStatements start tag")
+    if data[tag_end.start() - 1] == ord("/"):
+        return []
+    pos = tag_end.end()
+    container_end = _CONTAINER_END.search(data, pos)
+    endpos = container_end.start() if container_end else len(data)
+
+    offsets = []
+    while match := _STATEMENT_START.search(data, pos, endpos):
+        start = match.start()
+        tag_end = _TAG_END.search(data, start, endpos)
+        if tag_end is None:
+            raise ValueError("Unterminated FlexStatement start tag")
+        if data[tag_end.start() - 1] == ord("/"):
+            end = tag_end.end()
+        else:
+            close = _STATEMENT_END.search(data, tag_end.end(), endpos)
+            if close is None:
+                raise ValueError("Unterminated FlexStatement element")
+            end = close.end()
+        offsets.append((start, end))
+        pos = end
+    return offsets
+
+
+def _batches(offsets: list[tuple[int, int]], workers: int) -> list[tuple[int, int]]:
+    """Group consecutive statements into byte ranges of roughly equal size."""
+    total = offsets[-1][1] - offsets[0][0]
+    target = max(1, total // (workers * _BATCHES_PER_WORKER))
+    batches = []
+    batch_start = None
+    for start, end in offsets:
+        if batch_start is None:
+            batch_start = start
+        if end - batch_start >= target:
+            batches.append((batch_start, end))
+            batch_start = None
+    if batch_start is not None:
+        batches.append((batch_start, offsets[-1][1]))
+    return batches
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    """A process pool whose workers use this process's enum policy and aliases."""
+    return ProcessPoolExecutor(
+        max_workers=workers, initializer=apply_enum_settings, initargs=(enum_settings(),)
+    )
+
+
+def _parse_batch(
+    source: str | bytes,
+    prolog: bytes,
+    start: int,
+    end: int,
+    validate: bool,
+    sections: Collection[str],
+    fields: Mapping[str, frozenset[str]],
+    record_type: RecordType,
+) -> bytes:
+    """
+    Worker: parse the statements in `[start, end)` and return them serialized.
+
+    `source` is the report's path, or the bytes of the batch for in-memory reports.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            f.seek(start)
+            chunk = f.read(end - start)
+    else:
+        chunk = source
+    container = ET.fromstring(prolog + b"<FlexStatements>" + chunk + b"</FlexStatements>")
+    statements = [
+        parse_flex_statement(elem, validate, sections, fields, record_type)
+        for elem in container
+        if elem.tag == "FlexStatement"
+    ]
+    return dumps(statements)
+
+
+def parse_parallel(
+    source: str | os.PathLike[str] | XMLBuffer,
+    workers: int,
+    validate: bool = True,
+    sections: Collection[str] = frozenset(STATEMENT_SECTIONS),
+    fields: Mapping[str, frozenset[str]] | None = None,
+    record_type: RecordType = "model",
+) -> FlexQueryResponse | Record:
+    """
+    Parse a report with its statements spread over `workers` processes.
+
+    Statements are returned in document order. The root element and its other
+    children are parsed in the parent from the bytes around the statements. Workers
+    read their batch from the file, or are sent it when `source` is in memory.
+    """
+    fields = fields or {}
+    with ExitStack() as stack:
+        file_path = None
+        if isinstance(source, XMLBuffer):
+            data = source
+        else:
+            file_path = os.fspath(source)
+            f = stack.enter_context(open(file_path, "rb"))
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("Not a FlexQueryResponse XML file")
+            data = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        if not len(data):
+            raise ValueError("Not a FlexQueryResponse XML file")
+
+        offsets = statement_offsets(data)
+        if offsets:
+            # The document without its statements: root and header only
+            skeleton = bytes(data[: offsets[0][0]]) + bytes(data[offsets[-1][1] :])
+        else:
+            skeleton = bytes(data)
+
+        # Batches must hold whole statements only: anything else between them (or a
+        # statement nested in another element) could be cut in two
+        only_statements = all(
+            not bytes(data[end:start]).strip() for (_, end), (start, _) in pairwise(offsets)
+        )
+        try:
+            root = ET.fromstring(skeleton) if only_statements else None
+        except ET.ParseError:
+            root = None
+        if root is None:
+            root = parse_root(data)  # parsed serially; raises if the XML is malformed
+            if root.tag != "FlexQueryResponse":
+                raise ValueError("Not a FlexQueryResponse XML file")
+            return parse_flex_query_response(
+                root, validate, sections, fields, record_type=record_type
+            )
+        if root.tag != "FlexQueryResponse":
+            raise ValueError("Not a FlexQueryResponse XML file")
+
+        statements: list[FlexStatement | Record] = []
+        if offsets:
+            # Keep the XML declaration, so every batch is decoded with the same encoding
+            prolog = skeleton[: skeleton.find(b"?>") + 2] if skeleton.startswith(b"<?xml") else b""
+            batches = _batches(offsets, workers)
+            with _pool(min(workers, len(batches))) as executor:
+                futures = [
+                    executor.submit(
+                        _parse_batch,
+                        file_path or bytes(data[start:end]),
+                        prolog,
+                        start,
+                        end,
+                        validate,
+                        sections,
+                        fields,
+                        record_type,
+                    )
+                    for start, end in batches
+                ]
+                for future in futures:
+                    statements.extend(loads(future.result()))
+
+    return parse_flex_query_response(
+        root, validate, sections, fields, statements=statements, record_type=record_type
+    )
+
+
+def _timed_parse(
+    file_path: str, options: Mapping[str, Any]
+) -> tuple[FlexQueryResponse | Exception, float]:
+    """Parse one file, returning it (or the error) and the time taken."""
+    start = time.perf_counter()
+    try:
+        result: FlexQueryResponse | Exception = parse_xml_file(file_path, **options)
+    except Exception as e:
+        result = e
+    return result, time.perf_counter() - start
+
+
+def _parse_file(file_path: str, options: Mapping[str, Any]) -> tuple[bytes | Exception, float]:
+    """Worker: parse one file, returning it serialized (or the error) and the time taken."""
+    result, seconds = _timed_parse(file_path, options)
+    if isinstance(result, Exception):
+        return result, seconds
+    return dumps(result), seconds
+
+
+def iter_parse_times(
+    paths: Iterable[P], workers: int | None = None, **options: Any
+) -> Iterator[tuple[P, FlexQueryResponse | Exception, float]]:
+    """Like `parse_many`, also yielding the seconds each file took to parse."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for path in paths:
+            response, seconds = _timed_parse(os.fspath(path), options)
+            yield path, response, seconds
+        return
+
+    queue = iter(paths)
+    with _pool(workers) as executor:
+        pending: dict[Future[tuple[bytes | Exception, float]], P] = {}
+        while True:
+            for path in islice(queue, workers * _PENDING_PER_WORKER - len(pending)):
+                pending[executor.submit(_parse_file, os.fspath(path), options)] = path
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    result, seconds = future.result()
+                except Exception as e:
+                    # The worker died or its result could not be sent back
+                    yield path, e, 0.0
+                    continue
+                yield path, (loads(result) if isinstance(result, bytes) else result), seconds
+
+
+def parse_many(
+    paths: Iterable[P],
+    workers: int | None = None,
+    validate: bool = True,
+    cache_dir: str | None = None,
+    sections: Collection[str] | None = None,
+    fields: Mapping[str, Collection[str]] | None = None,
+) -> Iterator[tuple[P, FlexQueryResponse | Exception]]:
+    """
+    Parse many Flex Query XML files in a process pool.
+
+    Yields `(path, result)` pairs as files finish, so not in input order. A file that
+    fails to parse yields the exception instead of a response; the other files carry on.
+
+    Args:
+        paths: XML files to parse; consumed lazily, so a generator over a huge
+            directory is fine.
+        workers: Number of processes (default: one per CPU). With 1, files are
+            parsed in this process.
+        validate, cache_dir, sections, fields: As for `parse`, per file.
+    """
+    options = {"validate": validate, "cache_dir": cache_dir, "sections": sections, "fields": fields}
+    for path, result, _ in iter_parse_times(paths, workers, **options):
+        yield path, result
@@ -1,144 +1,642 @@
+import mmap
+import os
+import stat
 import xml.etree.ElementTree as ET
-from typing import Any
+from collections.abc import Callable, Collection, Generator, Iterable, Iterator, Mapping
+from contextlib import closing, contextmanager
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import cache, partial
+from types import NoneType, UnionType
+from typing import IO, Any, Literal, TypeVar, Union, cast, get_args, get_origin, overload
 
 from pydantic import BaseModel
 
+from .enum_lookup import enum_converter
 from .enums import Code
-from .models import CashReportCurrency, CashTransaction, FlexQueryResponse, FlexStatement, Trade
+from .models import CashTransaction, FlexQueryResponse, FlexStatement, Trade
+from .records import COMPACT_RECORDS, Record, RecordType
+from .sections import SECTIONS, Section, section_dispatch
 
 # IBKR Date/Time Formats
 # Dates: yyyyMMdd or yyyy-MM-dd
 # Times: HHmmss or HH:mm:ss
 # Datetime: date;time (semicolon separator)
-from .utils import parse_bool, parse_date, parse_datetime, parse_decimal, parse_time
+from .utils import (
+    parse_bool,
+    parse_codes,
+    parse_date,
+    parse_datetime,
+    parse_decimal,
+    parse_time,
+)
 
+Converter = Callable[[str], Any]
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
-def clean_attributes(attrs: dict[str, str], model_class: type[BaseModel]) -> dict[str, Any]:
-    """Convert string attributes to types expected by the model."""
+# In-memory reports, parsed in place: e.g. `FlexClient.download()` bytes or an mmap
+XMLBuffer = bytes | bytearray | memoryview | mmap.mmap
+# What `parse` and the streaming functions read: a path, a buffer, a binary file, or
+# the report's bytes in chunks as they arrive (e.g. `FlexClient.iter_download`)
+XMLSource = str | os.PathLike[str] | XMLBuffer | IO[bytes] | Iterable[bytes]
+
+# XML parsers `parse` can use, see `backends`
+Backend = Literal["etree", "lxml", "expat"]
+
+# Buffers are fed to expat in slices of this size: no copy, and within its int-sized limit
+_FEED_CHUNK_SIZE = 1 << 20
+
+# Statement sections parsed into FlexStatement fields: section tag -> row model
+STATEMENT_SECTIONS: dict[str, type[BaseModel]] = {
+    name: section.model for name, section in SECTIONS.items()
+}
+
+# Models whose attributes can be selected with `fields`, by name
+_PROJECTABLE_MODELS: dict[str, type[BaseModel]] = {
+    "FlexQueryResponse": FlexQueryResponse,
+    "FlexStatement": FlexStatement,
+    **{section.model.__name__: section.model for section in SECTIONS.values()},
+}
+
+
+def _parse_str(value: str) -> str | None:
+    return value or None
+
+
+def _str_type_converter(str_type: type[str]) -> Converter:
+    # Value objects (`vo`) intern their instances, so rows share them
+    def convert(value: str) -> str | None:
+        return str_type(value) if value else None
+
+    return convert
+
+
+# Conversions keyed by attribute name take precedence over the annotation
+_KEY_CONVERTERS: dict[str, Converter] = {
+    "notes": parse_codes,
+    "code": parse_codes,
+}
+
+# Checked by identity, so `datetime` never falls through to `date`
+_TYPE_CONVERTERS: dict[Any, Converter] = {
+    datetime: parse_datetime,
+    date: parse_date,
+    time: parse_time,
+    bool: parse_bool,
+    Decimal: parse_decimal,
+}
+
+
+def _converter_for(annotation: Any) -> Converter:
+    """Pick the converter for a field annotation such as `Decimal | None`."""
+    origin = get_origin(annotation)
+    if origin is list or origin is tuple:
+        if get_args(annotation)[:1] == (Code,):
+            return parse_codes
+        return _parse_str
+    if origin is Union or origin is UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return _converter_for(args[0])
+        return _parse_str
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return enum_converter(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, str) and annotation is not str:
+        return _str_type_converter(annotation)
+    return _TYPE_CONVERTERS.get(annotation, _parse_str)
+
+
+def _field_converter(name: str, annotation: Any) -> Converter:
+    return _KEY_CONVERTERS.get(name) or _converter_for(annotation)
+
+
+@cache
+def converter_plan(model_class: type[BaseModel]) -> dict[str, Converter]:
+    """Map each XML attribute name of a model to its converter (computed once per class)."""
+    return {
+        name: _field_converter(name, field_info.annotation)
+        for name, field_info in model_class.model_fields.items()
+    }
+
+
+@cache
+def projected_plan(model_class: type[BaseModel], fields: frozenset[str]) -> dict[str, Converter]:
+    """The converter plan restricted to `fields`; other attributes are never converted."""
+    plan = converter_plan(model_class)
+    unknown = fields - plan.keys()
+    if unknown:
+        raise ValueError(f"Unknown {model_class.__name__} fields: {', '.join(sorted(unknown))}")
+    return {name: convert for name, convert in plan.items() if name in fields}
+
+
+def clean_attributes(
+    attrs: dict[str, str], model_class: type[BaseModel], fields: frozenset[str] | None = None
+) -> dict[str, Any]:
+    """Convert string attributes to types expected by the model, optionally only `fields`."""
     cleaned: dict[str, Any] = {}
 
+    if fields is not None:
+        # Look up the few selected attributes instead of visiting every attribute
+        for key, converter in projected_plan(model_class, fields).items():
+            raw = attrs.get(key)
+            if raw is not None:
+                cleaned[key] = converter(raw)
+        return cleaned
+
+    plan = converter_plan(model_class)
     for key, value in attrs.items():
-        if key not in model_class.model_fields:
+        convert = plan.get(key)
+        if convert is None:
             # Skip unknown fields to avoid crashing, matching our "extra=ignore" policy
-            # But we could also log them if we wanted to discover new fields
             continue
-
-        field_info = model_class.model_fields[key]
-        annotation = field_info.annotation
-
-        # Determine target type
-        # Simplify references to Optional[Type] etc.
-        # This is a basic conversion, Pydantic does validation too.
-        # But we format data so Pydantic is happy.
-
-        # Check specific conversions
-        if key in ("notes", "code"):
-            # Handle code sequences (sep = ; or ,)
-            if not value:
-                cleaned[key] = []
-            else:
-                sep = ";" if ";" in value else ","
-                codes = [Code(v) for v in value.split(sep) if v]
-                cleaned[key] = codes
-
-        # Legacy Enum Fixups
-        elif key == "type" and value == "Deposits/Withdrawals":
-            cleaned[key] = "Deposits & Withdrawals"
-        elif key == "type" and value == "ACAT":
-            cleaned[key] = "ACATS"
-        elif key == "orderType" and ";" in value:
-            cleaned[key] = "MULTIPLE"
-
-        elif "datetime" in str(annotation):
-            cleaned[key] = parse_datetime(value)
-        elif "date" in str(annotation):
-            cleaned[key] = parse_date(value)
-        elif "time" in str(annotation):
-            cleaned[key] = parse_time(value)
-        elif "bool" in str(annotation):
-            cleaned[key] = parse_bool(value)
-        elif "Decimal" in str(annotation):
-            cleaned[key] = parse_decimal(value)
-        elif "List[Code]" in str(annotation):
-            # Handle code sequences (sep = ; or ,)
-            sep = ";" if ";" in value else ","
-            codes = [Code(v) for v in value.split(sep) if v]
-            cleaned[key] = codes
-        else:
-            # Enums and strings
-            if not value:
-                cleaned[key] = None
-            else:
-                cleaned[key] = value
+        cleaned[key] = convert(value)
 
     return cleaned
 
 
-def parse_xml_file(file_path: str) -> FlexQueryResponse:
-    tree = ET.parse(file_path)
-    root = tree.getroot()
+@cache
+def _field_defaults(
+    model_class: type[BaseModel],
+) -> tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]]:
+    """Defaults of the optional fields, in field order, plus the default factories."""
+    defaults: dict[str, Any] = {}
+    factories = []
+    for name, field_info in model_class.model_fields.items():
+        if field_info.default_factory is not None:
+            defaults[name] = None  # placeholder, keeps the field order
+            factories.append((name, cast(Callable[[], Any], field_info.default_factory)))
+        elif not field_info.is_required():
+            defaults[name] = field_info.default
+    return defaults, tuple(factories)
+
+
+def construct_model(model_class: type[ModelT], attrs: dict[str, Any]) -> ModelT:
+    """
+    Equivalent of `model_class.model_construct(**attrs)` for our Flex models.
+
+    `model_construct` resolves every field default per call, which costs more than
+    validation on the ~110-field `Trade`. The defaults are precomputed per class
+    instead. Relies on Flex models having no aliases and no post-init hook.
+    """
+    if model_class.__pydantic_post_init__:
+        return model_class.model_construct(**attrs)
+
+    defaults, factories = _field_defaults(model_class)
+    values = defaults.copy()
+    values.update(attrs)
+    for name, factory in factories:
+        if name not in attrs:
+            values[name] = factory()
+
+    obj = model_class.__new__(model_class)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(attrs))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
+def build_model(model_class: type[ModelT], attrs: dict[str, Any], validate: bool = True) -> ModelT:
+    """
+    Instantiate a model from cleaned attributes.
+
+    With `validate=False` the already-typed values are trusted and assigned via
+    `construct_model`, skipping a second round of Pydantic validation.
+    """
+    if validate:
+        return model_class(**attrs)
+    return construct_model(model_class, attrs)
+
+
+def build_record(
+    model_class: type[ModelT],
+    attrs: dict[str, Any],
+    validate: bool = True,
+    record_type: RecordType = "model",
+) -> ModelT | Record:
+    """`build_model`, or the compact record of `model_class` (never validated)."""
+    if record_type == "compact":
+        return COMPACT_RECORDS[model_class](attrs)
+    return build_model(model_class, attrs, validate)
+
+
+def parse_element(
+    elem: ET.Element,
+    model_class: type[ModelT],
+    validate: bool = True,
+    fields: frozenset[str] | None = None,
+    record_type: RecordType = "model",
+) -> ModelT | Record:
+    attrs = clean_attributes(elem.attrib, model_class, fields)
+    return build_record(model_class, attrs, validate, record_type)
+
+
+def _projection(
+    sections: Collection[str] | None, fields: Mapping[str, Collection[str]] | None
+) -> tuple[frozenset[str], dict[str, frozenset[str]]]:
+    """Validate and normalize the `sections`/`fields` arguments of the parse functions."""
+    selected = frozenset(STATEMENT_SECTIONS if sections is None else sections)
+    unknown = selected - STATEMENT_SECTIONS.keys()
+    if unknown:
+        raise ValueError(f"Unknown statement sections: {', '.join(sorted(unknown))}")
+
+    projected = {}
+    for name, names in (fields or {}).items():
+        model_class = _PROJECTABLE_MODELS.get(name)
+        if model_class is None:
+            raise ValueError(f"Cannot select fields of {name}")
+        projected[name] = frozenset(names)
+        projected_plan(model_class, projected[name])  # reject unknown field names early
+    return selected, projected
+
+
+def _feed_chunks(data: XMLBuffer) -> Generator[memoryview, None, None]:
+    """Zero-copy slices of `data`, each released once the caller moves on."""
+    with memoryview(data) as view, view.cast("B") as octets:
+        for start in range(0, len(octets), _FEED_CHUNK_SIZE):
+            with octets[start : start + _FEED_CHUNK_SIZE] as chunk:
+                yield chunk
+
+
+def _source_chunks(source: XMLSource) -> Iterable[bytes | memoryview] | None:
+    """The chunks to feed a parser for buffers and chunk iterables; None otherwise."""
+    if isinstance(source, XMLBuffer):
+        return _feed_chunks(source)
+    if isinstance(source, (str, os.PathLike)) or hasattr(source, "read"):
+        return None
+    return cast(Iterable[bytes], source)
+
+
+@contextmanager
+def source_chunks(source: XMLSource) -> Iterator[Iterable[bytes | memoryview]]:
+    """
+    The bytes of any source, as chunks to feed a parser.
+
+    Regular files are memory-mapped, so the parser reads the page cache instead of a
+    copy in userspace; buffers are sliced in place and file objects read in chunks.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            info = os.fstat(f.fileno())
+            if not stat.S_ISREG(info.st_mode) or not info.st_size:
+                # Empty files and pipes cannot be mapped
+                yield iter(partial(f.read, _FEED_CHUNK_SIZE), b"")
+                return
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+                closing(_feed_chunks(data)) as views,  # released before the map closes
+            ):
+                yield views
+        return
+    chunks = _source_chunks(source)
+    if chunks is None:
+        yield iter(partial(cast(IO[bytes], source).read, _FEED_CHUNK_SIZE), b"")
+    else:
+        yield chunks
+
+
+def parse_root(source: XMLSource) -> ET.Element:
+    """Parse a whole report and return its root element."""
+    parser = ET.XMLParser()
+    with source_chunks(source) as chunks:
+        for chunk in chunks:
+            parser.feed(chunk)
+    return parser.close()
+
+
+def read_source(source: XMLSource) -> str | os.PathLike[str] | XMLBuffer:
+    """`source` itself, or the contents of a file object or chunk iterable."""
+    if isinstance(source, (str, os.PathLike)) or isinstance(source, XMLBuffer):
+        return source
+    if hasattr(source, "read"):
+        return cast(IO[bytes], source).read()
+    return b"".join(cast(Iterable[bytes], source))
+
+
+def iter_events(source: XMLSource) -> Iterator[tuple[str, ET.Element]]:
+    """
+    The "start" and "end" events of `ET.iterparse`, also for buffers and chunk
+    iterables: these are fed to a pull parser chunk by chunk, so events are
+    produced while later chunks are still arriving.
+    """
+    chunks = _source_chunks(source)
+    if chunks is None:
+        yield from ET.iterparse(cast(str | IO[bytes], source), ("start", "end"))
+        return
+    parser: ET.XMLPullParser = ET.XMLPullParser(("start", "end"))
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from cast(Iterator[tuple[str, ET.Element]], parser.read_events())
+    parser.close()
+    yield from cast(Iterator[tuple[str, ET.Element]], parser.read_events())
+
+
+@overload
+def parse_xml_file(
+    source: XMLSource,
+    validate: bool = True,
+    cache_dir: str | None = None,
+    sections: Collection[str] | None = None,
+    fields: Mapping[str, Collection[str]] | None = None,
+    workers: int | None = None,
+    record_type: Literal["model"] = "model",
+    backend: Backend = "etree",
+) -> FlexQueryResponse: ...
+
+
+@overload
+def parse_xml_file(
+    source: XMLSource,
+    validate: bool = True,
+    cache_dir: str | None = None,
+    sections: Collection[str] | None = None,
+    fields: Mapping[str, Collection[str]] | None = None,
+    workers: int | None = None,
+    *,
+    record_type: Literal["compact"],
+    backend: Backend = "etree",
+) -> Record: ...
+
+
+def parse_xml_file(
+    source: XMLSource,
+    validate: bool = True,
+    cache_dir: str | None = None,
+    sections: Collection[str] | None = None,
+    fields: Mapping[str, Collection[str]] | None = None,
+    workers: int | None = None,
+    record_type: RecordType = "model",
+    backend: Backend = "etree",
+) -> FlexQueryResponse | Record:
+    """
+    Parse a Flex Query XML report.
+
+    Args:
+        source: Path of the XML report (memory-mapped), the report itself as
+            `bytes`, `bytearray`, `memoryview` or `mmap` (parsed in place, e.g. the
+            result of `FlexClient.download()`), or a binary file object.
+        validate: Run Pydantic validation on every model (default). Pass False for
+            trusted input to build models with `model_construct` instead.
+        cache_dir: Directory for binary snapshots of parsed reports. An unchanged
+            file is loaded from its snapshot instead of being parsed again; snapshots
+            are invalidated by content, py-ibkr version and schema changes. Snapshots
+            are pickles, so the directory must be trusted.
+        sections: Statement sections to parse, e.g. `{"Trades"}` (default: all of
+            `sections.SECTIONS`). Skipped sections are left empty (None for
+            `ChangeInNAV`) and never converted.
+        fields: Attributes to convert per model, e.g. `{"Trade": ["symbol", "quantity"]}`.
+            Other attributes are skipped and keep their defaults (None).
+        workers: Parse the `FlexStatement` elements of a multi-account report in this
+            many processes. Statements keep their document order. Only worthwhile
+            for large consolidated reports: results are pickled back to the parent.
+        record_type: "compact" returns slotted `Compact*` records (see `records`)
+            instead of Pydantic models: a fraction of the memory per row, no Pydantic
+            validation, and `to_model()` to get the full model on demand.
+        backend: XML parser, "etree" (default), "lxml" or "expat" (see `backends`);
+            "lxml" falls back to "etree" when lxml is not installed. All give the same
+            result. Statements parsed by `workers` always use "etree".
+    """
+    selected, projected = _projection(sections, fields)
+    if backend != "etree":
+        from .backends import resolve_backend  # backends build on this module
+
+        backend = resolve_backend(backend)
+    if cache_dir is not None:
+        from .snapshot import cached_parse  # snapshot builds on this module
+
+        variant = "parse"
+        if sections is not None or fields:
+            selection = sorted((name, sorted(names)) for name, names in projected.items())
+            variant += repr((sorted(selected), selection))
+        if record_type != "model":
+            variant += f":{record_type}"
+        data = read_source(source)  # file objects are hashed in memory
+        return cached_parse(
+            data,
+            cache_dir,
+            lambda: parse_xml_file(  # type: ignore[call-overload]
+                data,
+                validate,
+                sections=selected,
+                fields=projected,
+                workers=workers,
+                record_type=record_type,
+                backend=backend,
+            ),
+            variant=variant,
+        )
+
+    if workers is not None and workers > 1:
+        from .parallel import parse_parallel  # parallel builds on this module
+
+        return parse_parallel(
+            read_source(source), workers, validate, selected, projected, record_type
+        )
+
+    if backend != "etree":
+        from .backends import parse_with_backend
+
+        return parse_with_backend(source, backend, validate, selected, projected, record_type)
+
+    root = parse_root(source)
 
     if root.tag != "FlexQueryResponse":
         raise ValueError("Not a FlexQueryResponse XML file")
 
-    return parse_flex_query_response(root)
+    return parse_flex_query_response(root, validate, selected, projected, record_type=record_type)
 
 
-def parse_flex_query_response(elem: ET.Element) -> FlexQueryResponse:
-    attrs = clean_attributes(elem.attrib, FlexQueryResponse)
+def parse_flex_query_response(
+    elem: ET.Element,
+    validate: bool = True,
+    sections: Collection[str] = frozenset(STATEMENT_SECTIONS),
+    fields: Mapping[str, frozenset[str]] | None = None,
+    statements: list[FlexStatement | Record] | None = None,
+    record_type: RecordType = "model",
+) -> FlexQueryResponse | Record:
+    """
+    Build the response from its root element.
 
-    statements = []
+    `statements` may hold statements parsed elsewhere (see `parallel`); the
+    `FlexStatement` children of `elem` are parsed otherwise.
+    """
+    fields = fields or {}
+    attrs = clean_attributes(elem.attrib, FlexQueryResponse, fields.get("FlexQueryResponse"))
 
     # Check for FlexStatements container
-    flex_statements_elem = elem.find("FlexStatements")
+    flex_statements_elem = elem.find("FlexStatements") if statements is None else None
+    statements = statements if statements is not None else []
     if flex_statements_elem is not None:
         for stmt_elem in flex_statements_elem.findall("FlexStatement"):
-            statements.append(parse_flex_statement(stmt_elem))
+            statements.append(
+                parse_flex_statement(stmt_elem, validate, sections, fields, record_type)
+            )
 
     attrs["FlexStatements"] = statements
-    return FlexQueryResponse(**attrs)
-
-
-def parse_flex_statement(elem: ET.Element) -> FlexStatement:
-    attrs = clean_attributes(elem.attrib, FlexStatement)
-
-    trades = []
-    cash_transactions = []
-    cash_reports = []
-
-    # Parse Trades
-    trades_container = elem.find("Trades")
-    if trades_container is not None:
-        for trade_elem in trades_container.findall("Trade"):
-            trade_attrs = clean_attributes(trade_elem.attrib, Trade)
-            trades.append(Trade(**trade_attrs))
-
-    # Parse CashTransactions
-    cash_container = elem.find("CashTransactions")
-    if cash_container is not None:
-        for cash_elem in cash_container.findall("CashTransaction"):
-            cash_attrs = clean_attributes(cash_elem.attrib, CashTransaction)
-            # Pydantic should handle string to Enum if values match
-            cash_transactions.append(CashTransaction(**cash_attrs))
-
-    # Parse CashReports (official tag: CashReportCurrency)
-    cash_report_container = elem.find("CashReport")
-    if cash_report_container is not None:
-        for cash_report_elem in cash_report_container.findall("CashReportCurrency"):
-            cash_report_attrs = clean_attributes(cash_report_elem.attrib, CashReportCurrency)
-            cash_reports.append(CashReportCurrency(**cash_report_attrs))
-
-        # Backward compatibility / fallback for non-standard files
-        if not cash_reports:
-            for tag in ["CashReport", "CashReportInfo"]:
-                for cash_report_elem in cash_report_container.findall(tag):
-                    cash_report_attrs = clean_attributes(
-                        cash_report_elem.attrib, CashReportCurrency
-                    )
-                    cash_reports.append(CashReportCurrency(**cash_report_attrs))
-
-    attrs["Trades"] = trades
-    attrs["CashTransactions"] = cash_transactions
-    attrs["CashReport"] = cash_reports
-
-    return FlexStatement(**attrs)
+    return build_record(FlexQueryResponse, attrs, validate, record_type)
+
+
+def parse_section(
+    elem: ET.Element,
+    section: Section,
+    validate: bool = True,
+    fields: frozenset[str] | None = None,
+    record_type: RecordType = "model",
+) -> Any:
+    """The rows of a section container, or the record of a single-element section."""
+    model_class = section.model
+    if not section.rows:
+        return parse_element(elem, model_class, validate, fields, record_type)
+
+    # One C-level findall per tag beats a Python pass over the children
+    rows = elem.findall(section.rows[0])
+    if not rows:
+        rows = [row for fallback in section.rows[1:] for row in elem.findall(fallback)]
+    return [parse_element(row, model_class, validate, fields, record_type) for row in rows]
+
+
+def parse_flex_statement(
+    elem: ET.Element,
+    validate: bool = True,
+    sections: Collection[str] = frozenset(STATEMENT_SECTIONS),
+    fields: Mapping[str, frozenset[str]] | None = None,
+    record_type: RecordType = "model",
+) -> FlexStatement | Record:
+    fields = fields or {}
+    attrs = clean_attributes(elem.attrib, FlexStatement, fields.get("FlexStatement"))
+
+    # One pass over the children, dispatching on the section tag; only the first
+    # element of each section counts
+    dispatch = section_dispatch(frozenset(sections))
+    parsed: dict[str, Any] = {}
+    for child in elem:
+        tag = child.tag
+        if tag in dispatch and tag not in parsed:
+            section = dispatch[tag]
+            section_fields = fields.get(section.model.__name__)
+            parsed[tag] = parse_section(child, section, validate, section_fields, record_type)
+
+    attrs.update(parsed)
+    return build_record(FlexStatement, attrs, validate, record_type)
+
+
+def iter_rows(
+    source: XMLSource, rows: Mapping[str, Collection[str]]
+) -> Iterator[tuple[str, ET.Element]]:
+    """
+    Stream `(container, element)` pairs for the row tags registered per container.
+
+    Every element is detached from its parent once it has been handled, so only the
+    currently open path of the document is kept in memory.
+    """
+    stack: list[ET.Element] = []
+    inside = 0  # > 0 while within a matched element that is still being built
+
+    for event, elem in iter_events(source):
+        if event == "start":
+            if not stack and elem.tag != "FlexQueryResponse":
+                raise ValueError("Not a FlexQueryResponse XML file")
+            if stack and elem.tag in rows.get(stack[-1].tag, ()):
+                inside += 1
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if not stack:
+            # Read on to the end: a download then completes and its connection is reused
+            continue
+
+        parent = stack[-1]
+        if elem.tag in rows.get(parent.tag, ()):
+            inside -= 1
+            yield parent.tag, elem
+
+        if not inside:
+            # The element just closed is always the last child of its parent
+            del parent[-1]
+            elem.clear()
+
+
+def iter_elements(source: XMLSource, container: str, tag: str) -> Iterator[ET.Element]:
+    """Stream the `tag` elements found directly inside `container` elements."""
+    for _, elem in iter_rows(source, {container: (tag,)}):
+        yield elem
+
+
+def iter_models(
+    source: XMLSource,
+    container: str,
+    tag: str,
+    model_class: type[ModelT],
+    validate: bool = True,
+    fields: Collection[str] | None = None,
+) -> Iterator[ModelT]:
+    """Stream `model_class` instances for the rows of a statement section."""
+    projected = None
+    if fields is not None:
+        projected = frozenset(fields)
+        projected_plan(model_class, projected)  # reject unknown field names early
+    for elem in iter_elements(source, container, tag):
+        yield build_model(
+            model_class, clean_attributes(elem.attrib, model_class, projected), validate
+        )
+
+
+def iter_trades(
+    source: XMLSource, validate: bool = True, fields: Collection[str] | None = None
+) -> Iterator[Trade]:
+    """Stream the trades of every statement with bounded memory, optionally only `fields`."""
+    return iter_models(source, "Trades", "Trade", Trade, validate, fields)
+
+
+def iter_cash_transactions(
+    source: XMLSource, validate: bool = True, fields: Collection[str] | None = None
+) -> Iterator[CashTransaction]:
+    """Stream the cash transactions of every statement with bounded memory."""
+    return iter_models(
+        source, "CashTransactions", "CashTransaction", CashTransaction, validate, fields
+    )
+
+
+def iter_section_models(
+    source: XMLSource,
+    sections: Collection[str] = ("Trades", "CashTransactions"),
+    validate: bool = True,
+    fields: Mapping[str, Collection[str]] | None = None,
+) -> Iterator[BaseModel]:
+    """
+    Stream the rows of several statement sections in document order, e.g. the trades
+    and cash transactions of a report that is still being downloaded.
+
+    `sections` and `fields` select what is parsed, as in `parse`.
+    """
+    selected, projected = _projection(sections, fields)
+    # Standard row tags only: fallbacks would need the whole container first
+    models: dict[tuple[str, str], type[BaseModel]] = {}
+    rows: dict[str, tuple[str, ...]] = {}
+    for name in selected:
+        section = SECTIONS[name]
+        tag = section.row_tags[0]
+        models[section.parent, tag] = section.model
+        rows[section.parent] = (*rows.get(section.parent, ()), tag)
+    for parent, elem in iter_rows(source, rows):
+        model_class = models[parent, elem.tag]
+        attrs = clean_attributes(elem.attrib, model_class, projected.get(model_class.__name__))
+        yield build_model(model_class, attrs, validate)
+
+
+def iter_statements(
+    source: XMLSource,
+    validate: bool = True,
+    sections: Collection[str] | None = None,
+    fields: Mapping[str, Collection[str]] | None = None,
+) -> Iterator[FlexStatement]:
+    """
+    Stream statements one at a time; memory is bounded by the largest statement.
+
+    `sections` and `fields` select what is parsed, as in `parse`.
+    """
+    selected, projected = _projection(sections, fields)
+    for elem in iter_elements(source, "FlexStatements", "FlexStatement"):
+        yield cast(FlexStatement, parse_flex_statement(elem, validate, selected, projected))
@@ -0,0 +1,141 @@
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Client-side request budget, shareable across clients, threads and asyncio tasks.
+
+    Tokens refill at `rate` per second up to `capacity`. Each request takes one
+    token; when the bucket is empty the caller waits for its reserved slot, so
+    concurrent callers are served in order without busy-waiting.
+
+    Example: IBKR allows about one request per second per token, so share one
+    `TokenBucket(rate=1.0, capacity=1)` between all clients using that token.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum burst size (default: `rate`, at least 1).
+        clock: Monotonic time source, for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.clock = clock
+        self.acquired = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, possibly on credit, and return how long to wait for it."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            self.acquired += 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if wait:
+                self.throttled += 1
+                self.throttled_seconds += wait
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the seconds waited."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Asyncio version of `acquire`."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class Backoff:
+    """
+    Retry schedule used by the clients while polling: `retry_interval * 2**attempt`,
+    capped at `maximum` seconds.
+
+    Counts the retries and the time spent waiting in them.
+    """
+
+    def __init__(self, maximum: float = 60.0):
+        self.maximum = maximum
+        self.retries = 0
+        self.rate_limited = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def delay(self, retry_interval: float, attempt: int) -> float:
+        return min(retry_interval * (2**attempt), self.maximum)
+
+    def on_success(self) -> None:
+        """Called after a request went through."""
+
+    def on_rate_limited(self) -> None:
+        """Called when IBKR answered with error 1008."""
+        with self._lock:
+            self.rate_limited += 1
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.throttled_seconds += seconds
+
+
+class AdaptiveBackoff(Backoff):
+    """
+    Jittered backoff that slows down on rate limiting and recovers on success.
+
+    Every 1008 error multiplies a shared `penalty` by `factor` (up to
+    `max_penalty`); every successful request divides it again, down to 1. Delays
+    are `Backoff.delay() * penalty`, capped at `maximum`, with up to `jitter`
+    (fraction) randomly taken off so that workers sharing a token spread out.
+    Share one instance between clients to make them slow down together.
+    """
+
+    def __init__(
+        self,
+        maximum: float = 60.0,
+        factor: float = 2.0,
+        max_penalty: float = 32.0,
+        jitter: float = 0.5,
+        rng: Callable[[], float] = random.random,
+    ):
+        super().__init__(maximum)
+        self.factor = factor
+        self.max_penalty = max_penalty
+        self.jitter = jitter
+        self.rng = rng
+        self.penalty = 1.0
+
+    def delay(self, retry_interval: float, attempt: int) -> float:
+        raw = min(retry_interval * (2**attempt) * self.penalty, self.maximum)
+        return raw * (1 - self.jitter * self.rng())
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.penalty = max(1.0, self.penalty / self.factor)
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            self.rate_limited += 1
+            self.penalty = min(self.max_penalty, self.penalty * self.factor)
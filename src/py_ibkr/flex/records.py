@@ -0,0 +1,149 @@
+"""
+Compact records: slotted, Pydantic-free counterparts of the Flex models.
+
+`parse(..., record_type="compact")` builds these instead of models. A record keeps
+the converted values of the attributes present in the XML in `__slots__`, so it has
+no per-instance `__dict__` and no Pydantic bookkeeping; unset fields read as the
+model default. Records are not validated by Pydantic: `to_model()` builds the full
+model on demand.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any, ClassVar, Literal
+
+from pydantic import BaseModel
+
+from .models import (
+    CashReportCurrency,
+    CashTransaction,
+    ChangeInNAV,
+    CorporateAction,
+    FlexQueryResponse,
+    FlexStatement,
+    OpenPosition,
+    OptionEAE,
+    Trade,
+    Transfer,
+)
+
+RecordType = Literal["model", "compact"]
+
+
+class Record:
+    """Base class of the generated `Compact*` record classes."""
+
+    __slots__ = ()
+
+    model_class: ClassVar[type[BaseModel]]
+    _defaults: ClassVar[dict[str, Any]]
+    _factories: ClassVar[dict[str, Callable[[], Any]]]
+    _slot_items: ClassVar[tuple[tuple[str, Any], ...]]
+
+    def __init__(self, values: Mapping[str, Any]):
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots (and unknown names)
+        factory = self._factories.get(name)
+        if factory is not None:
+            value = factory()
+            setattr(self, name, value)
+            return value
+        try:
+            return self._defaults[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def to_dict(self) -> dict[str, Any]:
+        """The fields present in the XML, nested records included as is."""
+        values = {}
+        for name, slot in self._slot_items:
+            try:
+                values[name] = slot.__get__(self)
+            except AttributeError:
+                continue
+        return values
+
+    def to_model(self, validate: bool = True) -> BaseModel:
+        """Build the full Pydantic model, converting nested records too."""
+        from .parser import build_model  # the parser builds records
+
+        values = {}
+        for name, value in self.to_dict().items():
+            if isinstance(value, list):
+                value = [v.to_model(validate) if isinstance(v, Record) else v for v in value]
+            elif isinstance(value, Record):
+                value = value.to_model(validate)
+            values[name] = value
+        return build_model(self.model_class, values, validate)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Record) or type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"{type(self).__name__}({values})"
+
+
+def _compact_class(model_class: type[BaseModel]) -> type[Record]:
+    """Generate the record class of `model_class`, with one slot per model field."""
+    defaults: dict[str, Any] = {}
+    factories: dict[str, Callable[[], Any]] = {}
+    for name, field_info in model_class.model_fields.items():
+        if field_info.default_factory is not None:
+            factories[name] = field_info.default_factory  # type: ignore[assignment]
+        elif not field_info.is_required():
+            defaults[name] = field_info.default
+
+    name = f"Compact{model_class.__name__}"
+    namespace = {
+        "__slots__": tuple(model_class.model_fields),
+        "__module__": __name__,
+        "__qualname__": name,
+        "__doc__": f"Compact record of `{model_class.__name__}`.",
+        "model_class": model_class,
+        "_defaults": defaults,
+        "_factories": factories,
+    }
+    cls: type[Record] = type(name, (Record,), namespace)
+    cls._slot_items = tuple((field, cls.__dict__[field]) for field in model_class.model_fields)
+    return cls
+
+
+# Module attributes, so that records pickle by reference to their class
+CompactTrade = _compact_class(Trade)
+CompactCashTransaction = _compact_class(CashTransaction)
+CompactCashReportCurrency = _compact_class(CashReportCurrency)
+CompactOpenPosition = _compact_class(OpenPosition)
+CompactTransfer = _compact_class(Transfer)
+CompactCorporateAction = _compact_class(CorporateAction)
+CompactOptionEAE = _compact_class(OptionEAE)
+CompactChangeInNAV = _compact_class(ChangeInNAV)
+CompactFlexStatement = _compact_class(FlexStatement)
+CompactFlexQueryResponse = _compact_class(FlexQueryResponse)
+
+COMPACT_RECORDS: dict[type[BaseModel], type[Record]] = {
+    record.model_class: record
+    for record in (
+        CompactTrade,
+        CompactCashTransaction,
+        CompactCashReportCurrency,
+        CompactOpenPosition,
+        CompactTransfer,
+        CompactCorporateAction,
+        CompactOptionEAE,
+        CompactChangeInNAV,
+        CompactFlexStatement,
+        CompactFlexQueryResponse,
+    )
+}
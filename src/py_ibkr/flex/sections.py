@@ -0,0 +1,72 @@
+"""
+Registry of the `FlexStatement` sections the parsers read.
+
+Most sections are a container element holding one row element per record, e.g.
+`<Trades><Trade .../></Trades>`, parsed into a list. A few, such as `<ChangeInNAV .../>`,
+are a single element whose attributes are the record itself. Every parser (tree,
+event backends, streaming and columnar) reads this table, so a new section is one
+entry here plus its model and `FlexStatement` field.
+"""
+
+from functools import cache
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from .models import (
+    CashReportCurrency,
+    CashTransaction,
+    ChangeInNAV,
+    CorporateAction,
+    OpenPosition,
+    OptionEAE,
+    Trade,
+    Transfer,
+)
+
+
+class Section(NamedTuple):
+    """
+    A statement section: its tag, which is also the `FlexStatement` field, and model.
+
+    `rows` are the row tags of a container section. The first is the standard tag;
+    the others are only read when a container has none of it (non-standard files).
+    Without `rows` the section element itself is the record.
+    """
+
+    name: str
+    model: type[BaseModel]
+    rows: tuple[str, ...] = ()
+
+    @property
+    def parent(self) -> str:
+        """Tag of the element the records are direct children of."""
+        return self.name if self.rows else "FlexStatement"
+
+    @property
+    def row_tags(self) -> tuple[str, ...]:
+        """Tags of the record elements within `parent`."""
+        return self.rows or (self.name,)
+
+
+SECTIONS: dict[str, Section] = {
+    section.name: section
+    for section in (
+        Section("Trades", Trade, ("Trade",)),
+        Section("CashTransactions", CashTransaction, ("CashTransaction",)),
+        Section(
+            "CashReport", CashReportCurrency, ("CashReportCurrency", "CashReport", "CashReportInfo")
+        ),
+        Section("OpenPositions", OpenPosition, ("OpenPosition",)),
+        Section("Transfers", Transfer, ("Transfer",)),
+        Section("CorporateActions", CorporateAction, ("CorporateAction",)),
+        Section("OptionEAE", OptionEAE, ("OptionEAE",)),
+        Section("ChangeInNAV", ChangeInNAV),
+    )
+}
+
+
+@cache
+def section_dispatch(sections: frozenset[str]) -> dict[str, Section]:
+    """The selected sections by tag: one lookup per child element of a statement."""
+    return {name: SECTIONS[name] for name in sections}
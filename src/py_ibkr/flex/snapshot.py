@@ -0,0 +1,237 @@
+"""
+Binary snapshots of parsed Flex reports.
+
+`parse(path, cache_dir=...)` and `parse_columns(path, cache_dir=...)` store their
+result under a hash of the XML, so an unchanged report is loaded from the snapshot
+instead of being parsed again. Snapshots are pickles: only point `cache_dir` at a
+directory you trust.
+"""
+
+import copyreg
+import gc
+import hashlib
+import io
+import json
+import os
+import pickle
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import IO, Any, TypeVar, get_args
+
+from pydantic import BaseModel
+
+from .enum_lookup import enum_settings
+from .models import FlexQueryResponse
+from .parser import XMLBuffer, construct_model
+
+# Bump when the layout written by `_SnapshotPickler` changes
+SNAPSHOT_FORMAT = 1
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+T = TypeVar("T")
+
+
+def _package_version() -> str:
+    try:
+        return version("py-ibkr")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _describe_schema(model_class: type[BaseModel], seen: dict[str, Any]) -> None:
+    """Collect fields, annotations and enum members of `model_class` and its children."""
+    if model_class.__qualname__ in seen:
+        return
+    fields = seen[model_class.__qualname__] = {}
+    for name, field in model_class.model_fields.items():
+        fields[name] = repr(field.annotation)
+        pending = [field.annotation]
+        while pending:
+            annotation = pending.pop()
+            pending.extend(get_args(annotation))
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                _describe_schema(annotation, seen)
+            elif isinstance(annotation, type) and issubclass(annotation, Enum):
+                seen[annotation.__qualname__] = [str(m.value) for m in annotation]
+
+
+@cache
+def schema_fingerprint() -> str:
+    """Hash identifying the snapshot format, the py-ibkr version and the model schema."""
+    schema: dict[str, Any] = {}
+    _describe_schema(FlexQueryResponse, schema)
+    blob = json.dumps([SNAPSHOT_FORMAT, _package_version(), schema], sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def enum_fingerprint() -> str:
+    """The unknown-enum policy and registered aliases, which change parse results."""
+    policy, aliases = enum_settings()
+    described = {
+        f"{enum_class.__module__}.{enum_class.__qualname__}": sorted(enum_aliases.items())
+        for enum_class, enum_aliases in aliases.items()
+    }
+    return json.dumps([policy, described], sort_keys=True)
+
+
+def file_digest(file_path: str | os.PathLike[str]) -> str:
+    """SHA-256 of the file contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_digest(source: str | os.PathLike[str] | XMLBuffer) -> str:
+    """SHA-256 of a report file, or of an in-memory report (hashed in place)."""
+    if isinstance(source, XMLBuffer):
+        return hashlib.sha256(source).hexdigest()
+    return file_digest(source)
+
+
+def snapshot_path(
+    cache_dir: str | os.PathLike[str],
+    source: str | os.PathLike[str] | XMLBuffer,
+    variant: str = "parse",
+) -> str:
+    """Location of the `variant` snapshot for the current contents of `source` and enum settings."""
+    raw = f"{source_digest(source)}:{schema_fingerprint()}:{enum_fingerprint()}:{variant}"
+    key = hashlib.sha256(raw.encode())
+    return os.path.join(os.path.expanduser(os.fspath(cache_dir)), key.hexdigest() + ".pickle")
+
+
+def _restore(model_class: type[BaseModel], attrs: dict[str, Any]) -> BaseModel:
+    return construct_model(model_class, attrs)
+
+
+def _reduce_model(obj: BaseModel) -> tuple[Any, ...]:
+    values = obj.__dict__
+    return _restore, (type(obj), {name: values[name] for name in obj.model_fields_set})
+
+
+@cache
+def _dispatch_table() -> dict[type, Any]:
+    """`copyreg` reducers plus `_reduce_model` for every model reachable from the response."""
+    table: dict[type, Any] = dict(copyreg.dispatch_table)
+    pending: list[Any] = [FlexQueryResponse]
+    while pending:
+        annotation = pending.pop()
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if annotation in table:
+                continue
+            table[annotation] = _reduce_model
+            pending.extend(field.annotation for field in annotation.model_fields.values())
+        else:
+            pending.extend(get_args(annotation))
+    return table
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickle models as `(class, explicitly set fields)` with repeated values shared.
+
+    Loading skips Pydantic's `__setstate__` and the unset (default) fields, and equal
+    strings, decimals and dates across rows are stored once and loaded as one object.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._values: dict[tuple[type, Any], Any] = {}
+
+    def _share(self, value: Any) -> Any:
+        if value is None or isinstance(value, (list, bool, BaseModel)):
+            return value
+        # Equal decimals may differ in exponent or sign (3.2 and 3.20, 0 and -0):
+        # only share the exact same digits
+        key = str(value) if type(value) is Decimal else value
+        return self._values.setdefault((type(value), key), value)
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, BaseModel):
+            values = obj.__dict__
+            share = self._share
+            attrs = {share(name): share(values[name]) for name in obj.model_fields_set}
+            return _restore, (type(obj), attrs)
+        return NotImplemented
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Loading allocates every object of the report at once; cyclic GC passes over
+    # them would find nothing to free and double the load time
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def dumps(result: Any) -> bytes:
+    """
+    Serialize parse results for another process, loadable with `loads`.
+
+    Models are reduced like in snapshots, but through a dispatch table and without
+    sharing values: the result is larger, but it is written about twice as fast.
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = _dispatch_table()
+    with _gc_paused():
+        pickler.dump(result)
+    return buffer.getvalue()
+
+
+def loads(data: bytes) -> Any:
+    """Inverse of `dumps`."""
+    with _gc_paused():
+        return pickle.loads(data)
+
+
+def load_snapshot(path: str) -> Any | None:
+    """Load a snapshot, or return None if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f, _gc_paused():
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated or written by an incompatible version; parse again
+        return None
+
+
+def store_snapshot(path: str, result: Any) -> None:
+    """Write a snapshot atomically, so concurrent readers never see a partial file."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            _SnapshotPickler(f).dump(result)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def cached_parse(
+    source: str | os.PathLike[str] | XMLBuffer,
+    cache_dir: str | os.PathLike[str],
+    parse: Callable[[], T],
+    variant: str = "parse",
+) -> T:
+    """Return the snapshot for `source`, or `parse()` it and store a new snapshot."""
+    path = snapshot_path(cache_dir, source, variant)
+    result = load_snapshot(path)
+    if result is None:
+        result = parse()
+        store_snapshot(path, result)
+    return result  # type: ignore[no-any-return]
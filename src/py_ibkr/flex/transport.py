@@ -0,0 +1,293 @@
+import base64
+import http.client
+import ssl
+import threading
+import time
+import zlib
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from types import TracebackType
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+# Scheme, host, port and the proxy URL the connection goes through ("" for none)
+PoolKey = tuple[str, str, int, str]
+
+# Redirects followed per request, as in urllib
+MAX_REDIRECTS = 10
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Value of the Accept-Encoding header for the encodings `ContentDecoder` handles
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Errors raised when a kept-alive connection was closed by the server meanwhile
+_STALE_CONNECTION_ERRORS = (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine)
+
+
+class HTTPStatusError(OSError):
+    """Raised for HTTP responses with a 4xx/5xx status."""
+
+    def __init__(self, code: int, reason: str):
+        super().__init__(f"HTTP Error {code}: {reason}")
+        self.code = code
+        self.reason = reason
+
+
+class DecodingError(http.client.HTTPException):
+    """Raised for unsupported, corrupt or truncated compressed response bodies."""
+
+
+class ContentDecoder:
+    """
+    Incremental decoder for an HTTP Content-Encoding: gzip, deflate or identity.
+
+    Feed the body chunk by chunk to `decompress` and call `flush` at the end; only the
+    zlib window is held in memory. Both zlib-wrapped and raw deflate are accepted.
+
+    Raises:
+        DecodingError: For unsupported encodings and corrupt or truncated data.
+    """
+
+    def __init__(self, encoding: str | None):
+        self.encoding = (encoding or "identity").strip().lower()
+        self._decompressor: zlib._Decompress | None = None
+        if self.encoding in ("gzip", "x-gzip"):
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+            self._started = False
+        elif self.encoding != "identity":
+            raise DecodingError(f"Unsupported Content-Encoding: {encoding}")
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._decompressor is None:
+            return data
+        try:
+            if self.encoding == "deflate" and not self._started:
+                self._started = True
+                try:
+                    return self._decompressor.decompress(data)
+                except zlib.error:
+                    # Some servers send raw deflate without the zlib header
+                    self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decompressor.decompress(data)
+        except zlib.error as e:
+            raise DecodingError(f"Invalid {self.encoding} data: {e}") from e
+
+    def flush(self) -> bytes:
+        if self._decompressor is None:
+            return b""
+        tail = self._decompressor.flush()
+        if not self._decompressor.eof:
+            raise DecodingError(f"Truncated {self.encoding} stream")
+        return tail
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP(S) connections, keyed by scheme, host and port.
+
+    Connections are returned to the pool once their response has been read to the
+    end, and reused for the next request to the same host (keep-alive), saving a TCP
+    and TLS handshake per request.
+
+    Args:
+        maxsize: Maximum number of idle connections kept per host.
+        idle_timeout: Seconds an idle connection may be reused; older ones are closed.
+        timeout: Socket timeout in seconds for connect and read.
+        ssl_context: SSL context for HTTPS connections (default: system trust store).
+        proxies: Proxy URL by scheme, e.g. `{"https": "http://proxy:3128"}` (default: the
+            `HTTP(S)_PROXY` environment variables, as urllib reads them). Hosts matched by
+            `NO_PROXY` are connected to directly. HTTPS goes through a CONNECT tunnel.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4,
+        idle_timeout: float = 30.0,
+        timeout: float | None = 60.0,
+        ssl_context: ssl.SSLContext | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.proxies = dict(getproxies() if proxies is None else proxies)
+        self.connections_opened = 0
+        self._idle: dict[PoolKey, list[tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _proxy(self, scheme: str, host: str) -> str:
+        """The proxy URL for requests to `host`, or "" to connect directly."""
+        proxy = self.proxies.get(scheme, "")
+        if not proxy or proxy_bypass(host):
+            return ""
+        return proxy if "://" in proxy else "http://" + proxy
+
+    def _connect(self, key: PoolKey) -> http.client.HTTPConnection:
+        scheme, host, port, proxy = key
+        connect_host, connect_port = host, port
+        if proxy:
+            parts = urlsplit(proxy)
+            connect_host, connect_port = parts.hostname or "", parts.port or 80
+        conn: http.client.HTTPConnection
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                connect_host, connect_port, timeout=self.timeout, context=self.ssl_context
+            )
+            if proxy:
+                conn.set_tunnel(host, port, headers=_proxy_headers(proxy))
+        else:
+            conn = http.client.HTTPConnection(connect_host, connect_port, timeout=self.timeout)
+        with self._lock:
+            self.connections_opened += 1
+        return conn
+
+    def _acquire(self, key: PoolKey) -> tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection for `key` (reused=True) or a new one."""
+        now = time.monotonic()
+        stale = []
+        conn = None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ConnectionPool is closed")
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used < self.idle_timeout:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+        for old in stale:
+            old.close()
+        if conn is not None:
+            return conn, True
+        return self._connect(key), False
+
+    def _release(self, key: PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if not self._closed and len(idle) < self.maxsize:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def _request(
+        self, key: PoolKey, path: str, headers: Mapping[str, str]
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request("GET", path, headers=dict(headers))
+                return conn, conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped the kept-alive connection; GET is safe to retry
+            except BaseException:
+                conn.close()
+                raise
+
+    @contextmanager
+    def urlopen(
+        self, url: str, headers: Mapping[str, str] | None = None
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        GET `url` and yield the response.
+
+        The connection goes back to the pool if the body was read completely and
+        the server allows keep-alive; otherwise it is closed.
+
+        Redirects (3xx with a `Location`) are followed, up to `MAX_REDIRECTS`.
+
+        Raises:
+            HTTPStatusError: For 4xx/5xx responses, and redirect loops or redirects to
+                anything but http(s).
+            OSError, http.client.HTTPException: For network and protocol errors.
+        """
+        headers = headers or {}
+        key, path, request_headers = self._target(url, headers)
+        for _ in range(MAX_REDIRECTS + 1):
+            conn, response = self._request(key, path, request_headers)
+            location = response.getheader("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            response.read()  # to the end, so that the connection can be reused
+            self._finish(key, conn, response)
+            url = urljoin(url, location)
+            try:
+                key, path, request_headers = self._target(url, headers)
+            except ValueError:
+                raise HTTPStatusError(response.status, f"Redirect to {url}") from None
+        else:
+            raise HTTPStatusError(response.status, f"More than {MAX_REDIRECTS} redirects")
+
+        try:
+            if response.status >= 400:
+                raise HTTPStatusError(response.status, response.reason)
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        self._finish(key, conn, response)
+
+    def _target(
+        self, url: str, headers: Mapping[str, str]
+    ) -> tuple[PoolKey, str, Mapping[str, str]]:
+        """The pool key, request target and headers of a GET of `url`."""
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        proxy = self._proxy(scheme, host)
+        if proxy and scheme == "http":
+            # A plain HTTP proxy is sent the absolute URL (HTTPS tunnels through CONNECT)
+            path = f"http://{parts.netloc.rpartition('@')[2]}{path}"
+            headers = {**headers, **_proxy_headers(proxy)}
+        return (scheme, host, port, proxy), path, headers
+
+    def _finish(
+        self, key: PoolKey, conn: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        """Pool the connection if its response was read to the end and keep-alive is allowed."""
+        if response.isclosed() and not response.will_close:
+            self._release(key, conn)
+        else:
+            conn.close()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all idle connections; the pool cannot be used afterwards."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+
+def _proxy_headers(proxy: str) -> dict[str, str]:
+    """The Proxy-Authorization header for credentials in a proxy URL such as `http://u:p@host`."""
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode()}
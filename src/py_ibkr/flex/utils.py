@@ -1,35 +1,65 @@
 from datetime import date, datetime, time
 from decimal import Decimal
+from functools import lru_cache
 
+from .enum_lookup import enum_converter
+from .enums import Code
 
+# Statements repeat the same few dates/timestamps across thousands of rows
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_date(value: str) -> date | None:
     if not value or value in ("0", "N/A", ""):
         return None
 
+    # Fixed-width layouts are sliced by hand, strptime is far slower
     if len(value) == 8:
-        return datetime.strptime(value, "%Y%m%d").date()
+        if not value.isdigit():
+            raise ValueError(f"Unsupported date format: {value}")
+        return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
     if "-" in value:
         return datetime.strptime(value, "%Y-%m-%d").date()
 
     raise ValueError(f"Unsupported date format: {value}")
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_time(value: str) -> time | None:
     if not value or value in ("0", "N/A", ""):
         return None
 
     if len(value) == 6:
-        return datetime.strptime(value, "%H%M%S").time()
+        if not value.isdigit():
+            raise ValueError(f"Unsupported time format: {value}")
+        return time(int(value[:2]), int(value[2:4]), int(value[4:]))
+    if len(value) == 8 and value[2] == ":" and value[5] == ":":
+        return time(int(value[:2]), int(value[3:5]), int(value[6:]))
     if ":" in value:
         return datetime.strptime(value, "%H:%M:%S").time()
 
     raise ValueError(f"Unsupported time format: {value}")
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_datetime(value: str) -> datetime | None:
     if not value or value in ("0", "N/A", ""):
         return None
 
+    # Fast path for the standard yyyyMMdd;HHmmss layout
+    if len(value) == 15 and value[8] == ";" and value[:8].isdigit() and value[9:].isdigit():
+        return datetime(
+            int(value[:4]),
+            int(value[4:6]),
+            int(value[6:8]),
+            int(value[9:11]),
+            int(value[11:13]),
+            int(value[13:]),
+        )
+
     # Handle semicolon separator
     if ";" in value:
         d_str, t_str = value.split(";")
@@ -69,3 +99,20 @@ def parse_decimal(value: str) -> Decimal | None:
     if not value or value in ("N/A", ""):
         return None
     return Decimal(value.replace(",", ""))
+
+
+_to_code = enum_converter(Code)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_codes(value: str) -> tuple[Code, ...]:
+    """
+    Split a `notes`/`code` sequence (sep = ; or ,) into Code members.
+
+    A statement only has a few dozen distinct sequences such as "O;P", so each one
+    is parsed once and every row with it shares the same tuple.
+    """
+    if not value:
+        return ()
+    sep = ";" if ";" in value else ","
+    return tuple(_to_code(v) for v in value.split(sep) if v)
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
 
-from pydantic import RootModel
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
 from pydantic_extra_types.currency_code import Currency as CurrencyVO
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     AccountIDInput: TypeAlias = "AccountID" | str
     CurrencyCodeInput: TypeAlias = "CurrencyCode" | CurrencyVO | str
     SymbolInput: TypeAlias = "Symbol" | str
@@ -14,6 +17,7 @@ if TYPE_CHECKING:
     FlexQueryIDInput: TypeAlias = "FlexQueryID" | str
     ReferenceCodeInput: TypeAlias = "ReferenceCode" | str
 else:
+    # Replaced by the value object classes below, so that Pydantic validates into them
     AccountIDInput = Any
     CurrencyCodeInput = Any
     SymbolInput = Any
@@ -22,62 +26,129 @@ else:
     FlexQueryIDInput = Any
     ReferenceCodeInput = Any
 
+# Distinct values kept per class; the table is reset when full, so it stays bounded
+INTERN_LIMIT = 1 << 16
+
+
+class _StrVO(str):
+    """
+    Base for string-based value objects: interned `str` subclasses.
+
+    Instances are validated once per distinct value and shared: a statement has
+    thousands of rows but only a few symbols and account IDs, so every row refers
+    to the same object. Equal to, and usable as, the plain string.
+    """
+
+    __slots__ = ()
 
-class _StrVO(RootModel[str]):
-    """Base for string-based value objects."""
+    _interned: ClassVar[dict[str, Any]]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+
+    def __new__(cls, value: str) -> Self:
+        if type(value) is cls:
+            return value
+        try:
+            return cls._interned[value]  # type: ignore[no-any-return]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable
+            pass
+        if not isinstance(value, str):
+            raise TypeError(f"{cls.__name__} must be a string, not {type(value).__name__}")
+        obj = super().__new__(cls, value)
+        if len(cls._interned) >= INTERN_LIMIT:
+            cls._interned.clear()
+        cls._interned[str(value)] = obj
+        return obj
 
     @property
     def value(self) -> str:
-        return self.root
+        return str(self)
 
     def __str__(self) -> str:
-        return self.root
+        return str.__str__(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str.__repr__(self)})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (str(self),)
+
+    @classmethod
+    def _validate(cls, value: Any) -> Self:
+        if not isinstance(value, str):
+            raise ValueError(f"{cls.__name__} must be a string")
+        return cls(value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # Instances from the parser pass the `isinstance` check without a Python call
+        return core_schema.union_schema(
+            [
+                core_schema.is_instance_schema(cls),
+                core_schema.no_info_plain_validator_function(
+                    cls._validate, json_schema_input_schema=core_schema.str_schema()
+                ),
+            ],
+            mode="left_to_right",
+            serialization=core_schema.to_string_ser_schema(),
+        )
 
 
 class AccountID(_StrVO):
     """Strict Value Object for IBKR Account ID."""
 
+    __slots__ = ()
     Input: ClassVar[TypeAlias] = AccountIDInput
 
 
 class Symbol(_StrVO):
     """Strict Value Object for security symbols."""
 
+    __slots__ = ()
     Input: ClassVar[TypeAlias] = SymbolInput
 
 
 class ConID(_StrVO):
     """Strict Value Object for IBKR Contract ID."""
 
+    __slots__ = ()
     Input: ClassVar[TypeAlias] = ConIDInput
 
 
 class FlexToken(_StrVO):
     """Strict Value Object for IBKR Flex Web Service Token."""
 
+    __slots__ = ()
     Input: ClassVar[TypeAlias] = FlexTokenInput
 
 
 class FlexQueryID(_StrVO):
     """Strict Value Object for IBKR Flex Query ID."""
 
+    __slots__ = ()
     Input: ClassVar[TypeAlias] = FlexQueryIDInput
 
 
 class ReferenceCode(_StrVO):
     """Strict Value Object for IBKR Reference Code."""
 
+    __slots__ = ()
     Input: ClassVar[TypeAlias] = ReferenceCodeInput
 
 
-class CurrencyCode(RootModel[CurrencyVO | str]):
-    """Strict Value Object for currency codes."""
+class CurrencyCode(_StrVO):
+    """Strict Value Object for currency codes (also accepts `pydantic_extra_types` Currency)."""
 
+    __slots__ = ()
     Input: ClassVar[TypeAlias] = CurrencyCodeInput
 
-    @property
-    def value(self) -> CurrencyVO | str:
-        return self.root
 
-    def __str__(self) -> str:
-        return str(self.root)
+if not TYPE_CHECKING:
+    for _vo in (AccountID, Symbol, ConID, FlexToken, FlexQueryID, ReferenceCode, CurrencyCode):
+        _vo.Input = _vo
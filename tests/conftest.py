@@ -0,0 +1,214 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from py_ibkr import FlexClient
+
+SEND_OK = (
+    b"<FlexStatementResponse><Status>Success</Status>"
+    b"<ReferenceCode>123</ReferenceCode></FlexStatementResponse>"
+)
+NOT_READY = (
+    b"<FlexStatementResponse><Status>Warn</Status>"
+    b"<ErrorCode>1003</ErrorCode><ErrorMessage>Not ready</ErrorMessage></FlexStatementResponse>"
+)
+
+SAMPLE_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<FlexQueryResponse queryName="Sample" type="AF">
+<FlexStatements count="2">
+<FlexStatement accountId="U1000001" fromDate="20230101" toDate="20231231" period="Custom"
+    whenGenerated="20240102;083000">
+<Trades>
+<Trade accountId="U1000001" currency="USD" assetCategory="STK" symbol="AAPL" conid="265598"
+    transactionType="ExchTrade" buySell="BUY" openCloseIndicator="O" orderType="LMT"
+    quantity="10" tradePrice="150.25" tradeDate="20230315" tradeTime="093000"
+    dateTime="20230315;093000" settleDateTarget="20230317" notes="O;P" isAPIOrder="N"
+    ibCommission="-1.00" fxRateToBase="1" />
+<Trade accountId="U1000001" currency="EUR" assetCategory="STK" symbol="SAP" conid="14204"
+    transactionType="ExchTrade" buySell="SELL" openCloseIndicator="C" orderType="LMT;MKT"
+    quantity="-5" tradePrice="1,120.50" tradeDate="2023-06-01" tradeTime="15:45:00"
+    dateTime="20230601;154500" settleDateTarget="20230605" notes="C" isAPIOrder="Y"
+    ibCommission="-2.50" fxRateToBase="1.0712" />
+</Trades>
+<CashTransactions>
+<CashTransaction accountId="U1000001" currency="USD" type="Dividends" amount="12.34"
+    dateTime="20230401" reportDate="20230401" symbol="AAPL" code="Po" />
+<CashTransaction accountId="U1000001" currency="USD" type="Deposits/Withdrawals"
+    amount="1000" dateTime="20230102;101500" reportDate="20230102" code="" />
+</CashTransactions>
+<CashReport>
+<CashReportCurrency accountId="U1000001" currency="USD" endingCash="1234.56"
+    toDate="20231231" />
+</CashReport>
+<OpenPositions>
+<OpenPosition accountId="U1000001" currency="USD" assetCategory="STK" symbol="AAPL"
+    conid="265598" position="10" markPrice="192.53" positionValue="1925.3" side="Long"
+    reportDate="20231229" openDateTime="20230315;093000" code="" />
+</OpenPositions>
+<Transfers>
+<Transfer accountId="U1000001" currency="USD" assetCategory="STK" symbol="MSFT" conid="272093"
+    type="ACATS" direction="IN" date="20230510" quantity="3" transferPrice="0"
+    positionAmount="925.5" deliveringBroker="Other Broker" />
+</Transfers>
+<CorporateActions>
+<CorporateAction accountId="U1000001" currency="USD" assetCategory="STK" symbol="AAPL"
+    conid="265598" type="FS" reportDate="20230825" dateTime="20230824;202500" quantity="10"
+    actionDescription="AAPL SPLIT 2 FOR 1" code="" />
+</CorporateActions>
+<OptionEAE>
+<OptionEAE accountId="U1000001" currency="USD" assetCategory="OPT"
+    symbol="AAPL  230616C00170000" putCall="C" strike="170" expiry="20230616" multiplier="100"
+    transactionType="Expiration" date="20230616" quantity="1" tradePrice="0" />
+</OptionEAE>
+<ChangeInNAV accountId="U1000001" currency="USD" fromDate="20230101" toDate="20231231"
+    startingValue="1000" mtm="12.5" depositsWithdrawals="1000" endingValue="2012.5"
+    twr="1.25" />
+</FlexStatement>
+<FlexStatement accountId="U1000002" fromDate="20230101" toDate="20231231" period="Custom"
+    whenGenerated="20240102;083000">
+<Trades>
+<Trade accountId="U1000002" currency="USD" assetCategory="OPT" symbol="SPY   231215C00450000"
+    putCall="C" strike="450" expiry="20231215" multiplier="100" transactionType="ExchTrade"
+    buySell="BUY" quantity="1" tradePrice="3.2" tradeDate="20231101" notes="" />
+</Trades>
+<CashTransactions />
+<CashReport>
+<CashReportInfo accountId="U1000002" currency="USD" endingCash="10" />
+</CashReport>
+</FlexStatement>
+</FlexStatements>
+</FlexQueryResponse>
+"""
+
+
+# Only the first FlexStatements element and the first container of each section
+# count; rows are direct children; CashReport falls back to non-standard tags;
+# ChangeInNAV is a single element
+EDGE_CASES = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!-- generated -->
+<FlexQueryResponse queryName="Edge" type="AF">
+<FlexStatements count="3">
+<FlexStatement accountId="U1" />
+<FlexStatement accountId="U2">
+<Trades>
+<Trade symbol="A" quantity="1"><Nested symbol="X" /></Trade>
+<Order symbol="B" />
+<Trade symbol="C" quantity="2" />
+</Trades>
+<Trades><Trade symbol="IGNORED" /></Trades>
+<CashTransactions>
+<CashTransaction type="Deposits &amp; Withdrawals" description="A &#38; B" amount="1" />
+</CashTransactions>
+<CashReport>
+<CashReportInfo currency="EUR" endingCash="2" />
+<CashReport currency="USD" endingCash="1" />
+</CashReport>
+</FlexStatement>
+<Other><FlexStatement accountId="IGNORED" /></Other>
+<FlexStatement accountId="U3">
+<CashReport>
+<CashReportCurrency currency="USD" endingCash="3" />
+<CashReportInfo currency="EUR" endingCash="not a number" />
+</CashReport>
+<ChangeInNAV endingValue="5" /><ChangeInNAV endingValue="6" />
+<OptionEAE><OptionEAE quantity="1" /></OptionEAE>
+</FlexStatement>
+</FlexStatements>
+<FlexStatements><FlexStatement accountId="IGNORED" /></FlexStatements>
+</FlexQueryResponse>
+"""
+
+
+class FakeClock:
+    """Manual clock for the `clock` arguments; `sleep` advances it instead of waiting."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def sample_xml_path(tmp_path):
+    path = tmp_path / "sample.xml"
+    path.write_bytes(SAMPLE_XML)
+    return path
+
+
+class LocalHTTPServer:
+    """
+    Local stand-in for the Flex Web Service.
+
+    `routes` maps a URL path to a list of `(status, headers, body)` responses that
+    are served in order; the last one repeats.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, list[tuple[int, dict[str, str], bytes]]] = {}
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.client_ports: set[int] = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body are written separately
+
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                server.client_ports.add(self.client_address[1])
+                responses = server.routes.get(urlsplit(self.path).path)
+                if not responses:
+                    self.send_error(404)
+                    return
+                status, headers, body = responses.pop(0) if len(responses) > 1 else responses[0]
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/AccountManagement/FlexWebService"
+
+    def route(self, path: str, *bodies: bytes, status: int = 200, headers=None) -> None:
+        self.routes["/AccountManagement/FlexWebService/" + path] = [
+            (status, headers or {}, body) for body in bodies
+        ]
+
+
+@pytest.fixture
+def http_server():
+    server = LocalHTTPServer()
+    server.thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def make_client(http_server):
+    """Build a `FlexClient` (or `client_class`) that talks to `http_server`."""
+
+    def make(client_class=FlexClient, **kwargs):
+        client = client_class(**kwargs)
+        client.BASE_URL = http_server.base_url
+        return client
+
+    return make
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+from conftest import NOT_READY, SEND_OK
+
+from py_ibkr import AsyncFlexClient, FlexAuthError, FlexNotReadyError, FlexRateLimitError
+
+AUTH_ERROR = (
+    b"<FlexStatementResponse><Status>Warn</Status>"
+    b"<ErrorCode>1012</ErrorCode><ErrorMessage>Token expired</ErrorMessage>"
+    b"</FlexStatementResponse>"
+)
+RATE_LIMIT = (
+    b"<FlexStatementResponse><Status>Warn</Status>"
+    b"<ErrorCode>1008</ErrorCode><ErrorMessage>Too many</ErrorMessage></FlexStatementResponse>"
+)
+
+
+def test_async_download_with_retry(http_server, make_client):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", NOT_READY, b"<FlexQueryResponse />")
+
+    async def main():
+        async with make_client(AsyncFlexClient) as client:
+            return await client.download("token", "query", retry_interval=0)
+
+    assert asyncio.run(main()) == b"<FlexQueryResponse />"
+    assert "fd=" not in http_server.requests[0][0]
+
+
+def test_async_send_request_dates(http_server, make_client):
+    http_server.route("SendRequest", SEND_OK)
+
+    async def main():
+        async with make_client(AsyncFlexClient) as client:
+            return await client.send_request("token", "query", "20230101", "20230131")
+
+    assert str(asyncio.run(main())) == "123"
+    assert "fd=20230101&td=20230131" in http_server.requests[0][0]
+
+
+def test_async_errors(http_server, make_client):
+    http_server.route("SendRequest", AUTH_ERROR)
+    http_server.route("GetStatement", RATE_LIMIT)
+
+    async def main():
+        async with make_client(AsyncFlexClient) as client:
+            with pytest.raises(FlexAuthError, match="Token expired"):
+                await client.send_request("token", "query")
+            with pytest.raises(FlexRateLimitError, match="Too many"):
+                await client.get_statement("token", "123")
+
+    asyncio.run(main())
+
+
+def test_async_download_gives_up(http_server, make_client):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", NOT_READY)
+
+    async def main():
+        async with make_client(AsyncFlexClient) as client:
+            await client.download("token", "query", max_retries=2, retry_interval=0)
+
+    with pytest.raises(FlexNotReadyError):
+        asyncio.run(main())
+
+
+def test_download_many_limits_concurrency(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_download(self, token, query_id, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if query_id == "bad":
+            raise FlexAuthError("bad query")
+        return f"{token}:{query_id}:{kwargs['retry_interval']}".encode()
+
+    monkeypatch.setattr(AsyncFlexClient, "download", fake_download)
+    queries = [("t", f"q{i}") for i in range(10)]
+
+    async def main():
+        async with AsyncFlexClient() as client:
+            ok = await client.download_many(queries, concurrency=3, retry_interval=0)
+            mixed = await client.download_many(
+                [("t", "q0"), ("t", "bad")], return_exceptions=True, retry_interval=0
+            )
+            return ok, mixed
+
+    ok, mixed = asyncio.run(main())
+
+    assert ok == [f"t:q{i}:0".encode() for i in range(10)]
+    assert peak == 3
+    assert mixed[0] == b"t:q0:0"
+    assert isinstance(mixed[1], FlexAuthError)
+
+
+def test_download_many_cancels_siblings_on_error(monkeypatch):
+    cancelled = []
+
+    async def fake_download(self, token, query_id, **kwargs):
+        if query_id == "bad":
+            await asyncio.sleep(0.01)
+            raise FlexAuthError("bad query")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(query_id)
+            raise
+        return b""
+
+    monkeypatch.setattr(AsyncFlexClient, "download", fake_download)
+
+    async def main():
+        async with AsyncFlexClient() as client:
+            with pytest.raises(FlexAuthError):
+                await client.download_many([("t", "q0"), ("t", "bad"), ("t", "q2")])
+            # Already cancelled when the error propagates, not when the loop closes
+            assert sorted(cancelled) == ["q0", "q2"]
+
+    asyncio.run(main())
+
+
+def test_async_download_to(http_server, make_client, tmp_path):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", NOT_READY, b"<FlexQueryResponse />")
+    dest = tmp_path / "report.xml"
+
+    async def main():
+        async with make_client(AsyncFlexClient) as client:
+            return await client.download_to("token", "query", dest, retry_interval=0)
+
+    assert asyncio.run(main()) == 21
+    assert dest.read_bytes() == b"<FlexQueryResponse />"
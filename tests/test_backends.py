@@ -0,0 +1,77 @@
+import contextlib
+import xml.etree.ElementTree as ET
+
+import pytest
+from conftest import EDGE_CASES
+
+from py_ibkr import parse
+from py_ibkr.flex import backends
+from py_ibkr.flex.backends import BACKENDS, available_backends, resolve_backend
+
+
+@pytest.fixture(params=available_backends())
+def backend(request):
+    return request.param
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_backends_match_etree(sample_xml_path, backend, validate):
+    expected = parse(str(sample_xml_path), validate=validate)
+
+    assert parse(str(sample_xml_path), validate=validate, backend=backend) == expected
+    assert parse(sample_xml_path.read_bytes(), validate=validate, backend=backend) == expected
+
+
+def test_backends_edge_cases(backend):
+    expected = parse(EDGE_CASES)
+
+    result = parse(EDGE_CASES, backend=backend)
+
+    assert result == expected
+    assert [s.accountId for s in result.FlexStatements] == ["U1", "U2", "U3"]
+    assert [t.symbol for t in result.FlexStatements[1].Trades] == ["A", "C"]
+    assert [c.currency for c in result.FlexStatements[1].CashReport] == ["USD", "EUR"]
+    assert result.FlexStatements[1].CashTransactions[0].description == "A & B"
+    assert result.FlexStatements[2].ChangeInNAV.endingValue == 5
+    assert len(result.FlexStatements[2].OptionEAE) == 1
+
+
+def test_backends_compact_and_projection(sample_xml_path, backend):
+    options = {"sections": {"Trades"}, "fields": {"Trade": ["symbol", "quantity"]}}
+    path = str(sample_xml_path)
+
+    assert parse(path, backend=backend, **options) == parse(path, **options)
+    compact = parse(path, record_type="compact", backend=backend)
+    assert compact == parse(path, record_type="compact")
+
+
+def test_backends_errors(backend):
+    with pytest.raises(ET.ParseError):
+        parse(b"<FlexQueryResponse><FlexStatements>", backend=backend)
+    with pytest.raises(ValueError, match="Not a FlexQueryResponse"):
+        parse(b"<FlexStatementResponse />", backend=backend)
+
+
+def test_resolve_backend(monkeypatch):
+    assert set(available_backends()) <= set(BACKENDS)
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        resolve_backend("sax")
+
+    monkeypatch.setattr(backends, "_lxml_etree", lambda: None)
+
+    assert resolve_backend("lxml") == "etree"
+    assert "lxml" not in available_backends()
+
+
+def test_lxml_does_not_load_external_entities(http_server):
+    pytest.importorskip("lxml")
+    http_server.route("Entity", b"SECRET")
+    doc = (
+        f'<!DOCTYPE FlexQueryResponse [<!ENTITY e SYSTEM "{http_server.base_url}/Entity">]>'
+        '<FlexQueryResponse><FlexStatements count="0">&e;</FlexStatements></FlexQueryResponse>'
+    ).encode()
+
+    with contextlib.suppress(ET.ParseError):  # undefined entity
+        parse(doc, backend="lxml")
+
+    assert http_server.requests == []
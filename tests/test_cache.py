@@ -0,0 +1,118 @@
+import asyncio
+import os
+import threading
+from datetime import date
+
+from conftest import SEND_OK, FakeClock
+
+from py_ibkr import AsyncFlexClient, DownloadCache
+from py_ibkr.flex.cache import PART_GRACE
+
+
+def test_cache_key(tmp_path):
+    cache_key = DownloadCache(tmp_path).key
+    day = date(2024, 1, 2)
+    assert cache_key("1", "20240101", "20240131", day) == cache_key(1, "20240101", "20240131", day)
+    assert cache_key("1", day=day) != cache_key("2", day=day)
+    assert cache_key("1", day=day) != cache_key("1", day=date(2024, 1, 3))
+    assert cache_key("1", "20240101", day=day) != cache_key("1", None, "20240101", day=day)
+
+
+def test_cache_ttl(tmp_path):
+    clock = FakeClock()
+    cache = DownloadCache(tmp_path, ttl=60, clock=clock)
+    cache.put("k", b"<xml />")
+    assert cache.get("k") == b"<xml />"
+
+    clock.now += 61
+    assert cache.get("k") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.evict()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_lru_eviction(tmp_path):
+    clock = FakeClock()
+    cache = DownloadCache(tmp_path, max_size=25, clock=clock)
+    for key in ("a", "b"):
+        cache.put(key, b"x" * 10)
+        clock.now += 1
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    clock.now += 1
+
+    cache.put("c", b"x" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert sorted(os.listdir(tmp_path)) == ["a.xml", "c.xml"]
+
+
+def test_cache_eviction_sweeps_abandoned_parts(tmp_path):
+    clock = FakeClock()
+    cache = DownloadCache(tmp_path, clock=clock)
+    stale, fresh = tmp_path / ".crashed.part", tmp_path / ".writing.part"
+    for path, age in ((stale, PART_GRACE + 1), (fresh, PART_GRACE - 1)):
+        path.write_bytes(b"<Flex")
+        os.utime(path, (clock.now - age, clock.now - age))
+
+    cache.put("k", b"<xml />")
+
+    assert not stale.exists()
+    assert fresh.exists()
+    assert cache.get("k") == b"<xml />"
+
+
+def test_client_download_cached(http_server, make_client, tmp_path):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", b"<FlexQueryResponse />")
+    cache = DownloadCache(tmp_path)
+
+    with make_client(cache=cache) as client:
+        first = client.download("token", "query", from_date="20240101", to_date="20240131")
+        second = client.download("token", "query", from_date="20240101", to_date="20240131")
+        client.download("token", "query")
+
+    assert first == second == b"<FlexQueryResponse />"
+    assert len(http_server.requests) == 4  # the second download made no request
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_async_client_download_cached(http_server, make_client, tmp_path):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", b"<FlexQueryResponse />")
+    cache = DownloadCache(tmp_path)
+
+    async def main():
+        async with make_client(AsyncFlexClient, cache=cache) as client:
+            return [await client.download("token", "query") for _ in range(2)]
+
+    assert asyncio.run(main()) == [b"<FlexQueryResponse />"] * 2
+    assert len(http_server.requests) == 2
+
+
+def test_cache_concurrent_writers_never_expose_partial_entries(tmp_path):
+    cache = DownloadCache(tmp_path)
+    payloads = [bytes([65 + i]) * 200_000 for i in range(4)]
+    seen = set()
+
+    def write(payload):
+        for _ in range(10):
+            DownloadCache(tmp_path).put("shared", payload)
+
+    def read():
+        for _ in range(50):
+            data = cache.get("shared")
+            if data is not None:
+                seen.add(data)
+
+    threads = [threading.Thread(target=write, args=(p,)) for p in payloads]
+    threads.append(threading.Thread(target=read))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen <= set(payloads)
+    assert [p.name for p in tmp_path.iterdir()] == ["shared.xml"]
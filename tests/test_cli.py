@@ -1,4 +1,6 @@
+import json
 import sys
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -136,24 +138,25 @@ def test_cli_download_with_iso_dates(mock_client_class, capsys):
 
 
 @patch("py_ibkr.cli.FlexClient")
-@patch("builtins.open", new_callable=MagicMock)
-def test_cli_download_to_file(mock_open, mock_client_class):
+def test_cli_download_to_file(mock_client_class):
     mock_client = MagicMock()
-    mock_client.download.return_value = b"<xml>data</xml>"
     mock_client_class.return_value = mock_client
 
-    mock_file = MagicMock()
-    mock_open.return_value.__enter__.return_value = mock_file
-
     with patch.object(
         sys, "argv", ["py-ibkr", "download", "-t", "tok", "-q", "qid", "-o", "out.xml"]
     ):
         main()
 
-    mock_client.download.assert_called_once()
-    # open('.env') then open('out.xml', 'wb')
-    assert mock_open.call_args_list[-1] == (("out.xml", "wb"),)
-    mock_file.write.assert_called_once_with(b"<xml>data</xml>")
+    mock_client.download.assert_not_called()
+    mock_client.download_to.assert_called_once_with(
+        dest="out.xml",
+        token="tok",
+        query_id="qid",
+        max_retries=10,
+        retry_interval=10,
+        from_date=None,
+        to_date=None,
+    )
 
 
 @patch("py_ibkr.cli.FlexClient")
@@ -197,3 +200,47 @@ def test_load_dotenv(tmp_path):
 
     assert os.environ["IBKR_FLEX_TOKEN"] == "file-tok"
     assert os.environ["IBKR_FLEX_QUERY_ID"] == "file-qid"
+
+
+def test_cli_parse_jsonl(sample_xml_path, tmp_path, capsys):
+    broken = tmp_path / "broken.xml"
+    broken.write_bytes(b"<FlexQueryResponse>")
+    output = tmp_path / "out.jsonl"
+
+    with patch.object(
+        sys, "argv", ["py-ibkr", "parse", str(tmp_path), "-w", "1", "-o", str(output)]
+    ):
+        with pytest.raises(SystemExit) as e:
+            main()
+    assert e.value.code == 1
+
+    [line] = output.read_text().splitlines()
+    record = json.loads(line)
+    assert record["path"] == str(sample_xml_path)
+    assert record["report"]["FlexStatements"][0]["accountId"] == "U1000001"
+    err = capsys.readouterr().err
+    assert "broken.xml: error:" in err
+    assert f"{sample_xml_path}: " in err
+    assert "Parsed 1/2 files" in err
+
+
+def test_cli_parse_parquet(sample_xml_path, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "tables"
+
+    with patch.object(
+        sys, "argv", ["py-ibkr", "parse", str(sample_xml_path), "-f", "parquet", "-o", str(output)]
+    ):
+        main()
+
+    trades = pq.read_table(output / "Trades.parquet")
+    assert trades.column("symbol").to_pylist() == ["AAPL", "SAP", "SPY   231215C00450000"]
+    assert trades.schema.field("tradePrice").type == pa.decimal128(6, 2)
+    assert trades.column("tradePrice").to_pylist() == [
+        Decimal("150.25"),
+        Decimal("1120.50"),
+        Decimal("3.20"),
+    ]
+    cash = pq.read_table(output / "CashTransactions.parquet")
+    assert cash.num_rows == 2
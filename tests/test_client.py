@@ -1,18 +1,22 @@
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
+from conftest import NOT_READY, SEND_OK
 
 from py_ibkr import (
     FlexAuthError,
     FlexClient,
+    FlexError,
     FlexInProgressError,
     FlexNotReadyError,
     FlexRateLimitError,
 )
+from py_ibkr.flex.client import CHUNK_SIZE, _write_statement
 
 
 class TestFlexClient:
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     def test_send_request_success(self, mock_urlopen):
         mock_response = MagicMock()
         mock_response.read.return_value = b"""
@@ -22,6 +26,7 @@ class TestFlexClient:
         </FlexStatementResponse>
         """
         mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {}
         mock_urlopen.return_value = mock_response
 
         client = FlexClient()
@@ -31,11 +36,11 @@ class TestFlexClient:
         # Verify URL construction with dates
         client.send_request("token", "query_id", from_date="20230101", to_date="20230131")
         args, kwargs = mock_urlopen.call_args
-        url = args[0].get_full_url()
+        url = args[0]
         assert "fd=20230101" in url
         assert "td=20230131" in url
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     def test_send_request_rate_limit(self, mock_urlopen):
         mock_response = MagicMock()
         mock_response.read.return_value = b"""
@@ -46,13 +51,14 @@ class TestFlexClient:
         </FlexStatementResponse>
         """
         mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {}
         mock_urlopen.return_value = mock_response
 
         client = FlexClient()
         with pytest.raises(FlexRateLimitError, match="Rate limit exceeded"):
             client.send_request("token", "query_id")
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     def test_send_request_auth_error(self, mock_urlopen):
         mock_response = MagicMock()
         mock_response.read.return_value = b"""
@@ -63,24 +69,26 @@ class TestFlexClient:
         </FlexStatementResponse>
         """
         mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {}
         mock_urlopen.return_value = mock_response
 
         client = FlexClient()
         with pytest.raises(FlexAuthError, match="Invalid token"):
             client.send_request("token", "query_id")
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     def test_get_statement_success(self, mock_urlopen):
         mock_response = MagicMock()
         mock_response.read.return_value = b"<FlexQueryResponse>data</FlexQueryResponse>"
         mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {}
         mock_urlopen.return_value = mock_response
 
         client = FlexClient()
         data = client.get_statement("token", "12345")
         assert data == b"<FlexQueryResponse>data</FlexQueryResponse>"
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     def test_get_statement_not_ready(self, mock_urlopen):
         mock_response = MagicMock()
         mock_response.read.return_value = b"""
@@ -91,13 +99,14 @@ class TestFlexClient:
         </FlexStatementResponse>
         """
         mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {}
         mock_urlopen.return_value = mock_response
 
         client = FlexClient()
         with pytest.raises(FlexNotReadyError, match="Statement not ready"):
             client.get_statement("token", "12345")
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     @patch("time.sleep", return_value=None)
     def test_download_with_retry(self, mock_sleep, mock_urlopen):
         # Step 1: SendRequest success
@@ -107,6 +116,7 @@ class TestFlexClient:
             b"<ReferenceCode>123</ReferenceCode></FlexStatementResponse>"
         )
         mock_resp1.__enter__.return_value = mock_resp1
+        mock_resp1.headers = {}
 
         # Step 2: GetStatement not ready then success
         mock_resp_not_ready = MagicMock()
@@ -115,10 +125,12 @@ class TestFlexClient:
             b"<ErrorCode>1003</ErrorCode></FlexStatementResponse>"
         )
         mock_resp_not_ready.__enter__.return_value = mock_resp_not_ready
+        mock_resp_not_ready.headers = {}
 
         mock_resp_success = MagicMock()
         mock_resp_success.read.return_value = b"<FlexQueryResponse>data</FlexQueryResponse>"
         mock_resp_success.__enter__.return_value = mock_resp_success
+        mock_resp_success.headers = {}
 
         mock_urlopen.side_effect = [mock_resp1, mock_resp_not_ready, mock_resp_success]
 
@@ -129,7 +141,7 @@ class TestFlexClient:
         assert mock_urlopen.call_count == 3
         assert mock_sleep.call_count == 1
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     @patch("time.sleep", return_value=None)
     def test_download_retry_on_in_progress(self, mock_sleep, mock_urlopen):
         # First call to send_request returns 1019
@@ -139,6 +151,7 @@ class TestFlexClient:
             MagicMock(
                 __enter__=MagicMock(
                     return_value=MagicMock(
+                        headers={},
                         read=MagicMock(
                             return_value=b"""
                 <FlexStatusResponse>
@@ -147,13 +160,14 @@ class TestFlexClient:
                     <ErrorMessage>Statement generation in progress</ErrorMessage>
                 </FlexStatusResponse>
             """
-                        )
+                        ),
                     )
                 )
             ),
             MagicMock(
                 __enter__=MagicMock(
                     return_value=MagicMock(
+                        headers={},
                         read=MagicMock(
                             return_value=b"""
                 <FlexStatusResponse>
@@ -161,13 +175,15 @@ class TestFlexClient:
                     <ReferenceCode>12345</ReferenceCode>
                 </FlexStatusResponse>
             """
-                        )
+                        ),
                     )
                 )
             ),
             MagicMock(
                 __enter__=MagicMock(
-                    return_value=MagicMock(read=MagicMock(return_value=b"<xml>data</xml>"))
+                    return_value=MagicMock(
+                        headers={}, read=MagicMock(return_value=b"<xml>data</xml>")
+                    )
                 )
             ),
         ]
@@ -179,7 +195,7 @@ class TestFlexClient:
         assert mock_urlopen.call_count == 3
         mock_sleep.assert_called_once_with(10)
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     def test_get_statement_in_progress(self, mock_urlopen):
         mock_response = MagicMock()
         mock_response.read.return_value = b"""
@@ -190,13 +206,14 @@ class TestFlexClient:
         </FlexStatementResponse>
         """
         mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {}
         mock_urlopen.return_value = mock_response
 
         client = FlexClient()
         with pytest.raises(FlexInProgressError, match="Statement generation in progress"):
             client.get_statement("token", "12345")
 
-    @patch("py_ibkr.flex.client.urlopen")
+    @patch("py_ibkr.flex.client.ConnectionPool.urlopen")
     @patch("time.sleep", return_value=None)
     def test_download_exponential_backoff(self, mock_sleep, mock_urlopen):
         # Step 1: SendRequest success
@@ -206,6 +223,7 @@ class TestFlexClient:
             b"<ReferenceCode>123</ReferenceCode></FlexStatementResponse>"
         )
         mock_resp1.__enter__.return_value = mock_resp1
+        mock_resp1.headers = {}
 
         # Step 2: GetStatement in progress (1019) -> not ready (1003) -> success
         mock_resp_1019 = MagicMock()
@@ -214,6 +232,7 @@ class TestFlexClient:
             b"<ErrorCode>1019</ErrorCode></FlexStatementResponse>"
         )
         mock_resp_1019.__enter__.return_value = mock_resp_1019
+        mock_resp_1019.headers = {}
 
         mock_resp_1003 = MagicMock()
         mock_resp_1003.read.return_value = (
@@ -221,10 +240,12 @@ class TestFlexClient:
             b"<ErrorCode>1003</ErrorCode></FlexStatementResponse>"
         )
         mock_resp_1003.__enter__.return_value = mock_resp_1003
+        mock_resp_1003.headers = {}
 
         mock_resp_success = MagicMock()
         mock_resp_success.read.return_value = b"<xml>data</xml>"
         mock_resp_success.__enter__.return_value = mock_resp_success
+        mock_resp_success.headers = {}
 
         mock_urlopen.side_effect = [
             mock_resp1,
@@ -242,3 +263,85 @@ class TestFlexClient:
         mock_sleep.assert_any_call(10)
         mock_sleep.assert_any_call(20)
         assert mock_sleep.call_count == 2
+
+
+INVALID_REQUEST = (
+    b"\n<FlexStatementResponse><Status>Fail</Status>"
+    b"<ErrorCode>1020</ErrorCode><ErrorMessage>Invalid request</ErrorMessage>"
+    b"</FlexStatementResponse>"
+)
+
+
+def test_download_to_path_streams_in_chunks(http_server, make_client, tmp_path):
+    report = b"\n<FlexQueryResponse>" + b"<Trade />" * 20_000 + b"</FlexQueryResponse>"
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", NOT_READY, report)
+    dest = tmp_path / "report.xml"
+
+    with make_client() as client:
+        size = client.download_to("token", "query", dest, retry_interval=0)
+
+    assert size == len(report) > CHUNK_SIZE
+    assert dest.read_bytes() == report
+    assert [p.name for p in tmp_path.iterdir()] == ["report.xml"]
+
+
+def test_download_to_error_envelope_writes_nothing(http_server, make_client, tmp_path):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", INVALID_REQUEST)
+    sink = io.BytesIO()
+    dest = tmp_path / "report.xml"
+
+    with make_client() as client:
+        with pytest.raises(FlexError, match="1020"):
+            client.download_to("token", "query", sink)
+        with pytest.raises(FlexError, match="1020"):
+            client.download_to("token", "query", dest)
+
+    assert sink.getvalue() == b""
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_statement_sniffs_across_chunks():
+    sink = io.BytesIO()
+    pieces = [INVALID_REQUEST[:6], INVALID_REQUEST[6:30], INVALID_REQUEST[30:]]
+    chunks = iter([(piece, piece) for piece in pieces])
+    with pytest.raises(FlexError, match="Invalid request"):
+        _write_statement(chunks, sink)
+    assert sink.getvalue() == b""
+
+    pieces = [b"<Fl", b"exQueryResponse>", b"</FlexQueryResponse>"]
+    chunks = iter([(piece, piece) for piece in pieces])
+    assert _write_statement(chunks, sink) == 39
+    assert sink.getvalue() == b"<FlexQueryResponse></FlexQueryResponse>"
+
+
+def test_download_parsed_streams_rows(http_server, make_client, sample_xml_path, tmp_path):
+    from py_ibkr import DownloadCache, parse
+
+    report = sample_xml_path.read_bytes()
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", NOT_READY, report)
+    expected = parse(report).FlexStatements
+
+    with make_client() as client:
+        client.cache = DownloadCache(str(tmp_path))
+        rows = list(client.download_parsed("token", "query", retry_interval=0))
+        # Stored once the body arrived completely, then served from the cache
+        trades = list(client.iter_download_trades("token", "query"))
+
+    assert rows == [
+        *expected[0].Trades,
+        *expected[0].CashTransactions,
+        *expected[1].Trades,
+    ]
+    assert trades == [trade for statement in expected for trade in statement.Trades]
+    assert sum("GetStatement" in path for path, _ in http_server.requests) == 2
+
+
+def test_download_parsed_error_envelope_raises_on_call(http_server, make_client):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", INVALID_REQUEST)
+
+    with make_client() as client, pytest.raises(FlexError, match="1020"):
+        client.download_parsed("token", "query")
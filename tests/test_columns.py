@@ -0,0 +1,140 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+
+from py_ibkr import parse, set_unknown_enum_policy
+from py_ibkr.flex.columns import ColumnTable, DateColumn, DecimalColumn, parse_columns
+from py_ibkr.flex.models import Trade
+
+
+def test_parse_columns_matches_models(sample_xml_path):
+    response = parse(str(sample_xml_path))
+    trades = [t for s in response.FlexStatements for t in s.Trades]
+
+    tables = parse_columns(str(sample_xml_path))
+    table = tables["Trades"]
+
+    assert table.num_rows == len(trades)
+    data = table.to_pydict()
+    assert data["tradePrice"] == [t.tradePrice for t in trades]
+    assert data["tradeDate"] == [t.tradeDate for t in trades]
+    assert data["tradeTime"] == [time(9, 30), time(15, 45), None]
+    assert data["dateTime"] == [datetime(2023, 3, 15, 9, 30), datetime(2023, 6, 1, 15, 45), None]
+    assert data["isAPIOrder"] == [False, True, None]
+    assert data["buySell"] == ["BUY", "SELL", "BUY"]
+    assert data["orderType"] == ["LMT", "MULTIPLE", None]
+    assert data["notes"] == ["O;P", "C", ""]
+
+    assert tables["CashTransactions"]["type"].to_list() == ["Dividends", "Deposits & Withdrawals"]
+    assert tables["CashReport"].num_rows == 2
+    assert tables["OpenPositions"]["side"].to_list() == ["Long"]
+    assert tables["ChangeInNAV"]["endingValue"].to_list() == [Decimal("2012.5")]
+
+
+def test_decimal_column_is_fixed_point(sample_xml_path):
+    column = parse_columns(str(sample_xml_path), sections=["Trades"])["Trades"]["tradePrice"]
+
+    assert isinstance(column, DecimalColumn)
+    assert column.values.typecode == "q"
+    assert column.scale == 2
+    assert list(column.values) == [15025, 112050, 320]
+    assert column.to_list()[1] == Decimal("1120.50")
+
+
+def test_column_table_sparse_rows():
+    table = ColumnTable(Trade)
+    prices = ["1,120.50", "-.5", "3", "1E+2", "N/A", "", "2.125"]
+    for price in prices:
+        table.append({"tradePrice": price})
+    table.append({"symbol": "AAPL"})
+
+    data = table.to_pydict()
+    expected = [Decimal(p.replace(",", "")) if p not in ("N/A", "") else None for p in prices]
+    assert data["tradePrice"] == [*expected, None]
+    assert table["tradePrice"].scale == 3
+    assert data["symbol"] == [None] * len(prices) + ["AAPL"]
+    assert all(len(column) == table.num_rows for column in table.columns.values())
+
+
+def test_decimal_column_wider_than_int64():
+    table = ColumnTable(Trade)
+    prices = ["1.5", "0.12345678901234567890", "-1234567890.12345678901234567890"]
+    for price in prices:
+        table.append({"tradePrice": price})
+
+    column = table["tradePrice"]
+    assert column.scale == 20
+    assert column.to_list() == [Decimal(p) for p in prices]
+
+
+def test_decimal_column_rescale_past_int64():
+    table = ColumnTable(Trade)
+    table.append({"tradePrice": "12345678901.25"})
+    assert table["tradePrice"].values.typecode == "q"
+
+    table.append({"tradePrice": "1e-10"})  # 12345678901.25 at scale 10 overflows int64
+    table.append({"tradePrice": "2"})
+
+    column = table["tradePrice"]
+    assert column.scale == 10
+    assert column.to_list() == [Decimal("12345678901.25"), Decimal("1e-10"), Decimal(2)]
+
+
+def test_to_arrow_wide_decimals():
+    pa = pytest.importorskip("pyarrow")
+    table = ColumnTable(Trade)
+    prices = ["-1234567890.12345678901234567890", "", "1e-10"]
+    for price in prices:
+        table.append({"tradePrice": price})
+
+    column = table.to_arrow().column("tradePrice")
+    assert column.type == pa.decimal128(30, 20)
+    assert column.to_pylist() == [Decimal(prices[0]), None, Decimal("1e-10")]
+
+
+def test_date_column_is_day_number(sample_xml_path):
+    column = parse_columns(str(sample_xml_path), sections=["Trades"])["Trades"]["tradeDate"]
+
+    assert isinstance(column, DateColumn)
+    assert column.values.typecode == "i"
+    assert column.values[0] == (date(2023, 3, 15) - date(1970, 1, 1)).days
+
+
+def test_parse_columns_unknown_section(sample_xml_path):
+    with pytest.raises(ValueError, match="Unsupported columnar section"):
+        parse_columns(str(sample_xml_path), sections=["Nope"])
+
+
+def test_parse_columns_raw_enum_policy(sample_xml_path, tmp_path):
+    path = tmp_path / "new_values.xml"
+    path.write_bytes(
+        sample_xml_path.read_bytes()
+        .replace(b'notes="O;P"', b'notes="O;Zz"')
+        .replace(b'assetCategory="STK"', b'assetCategory="SPACESHIP"')
+    )
+    set_unknown_enum_policy("raw")
+    try:
+        table = parse_columns(str(path), sections=["Trades"])["Trades"]
+    finally:
+        set_unknown_enum_policy("raise")
+
+    assert table["notes"].to_list() == ["O;Zz", "C", ""]
+    assert table["assetCategory"].to_list() == ["SPACESHIP", "SPACESHIP", "OPT"]
+
+
+def test_to_arrow(sample_xml_path):
+    pa = pytest.importorskip("pyarrow")
+
+    table = parse_columns(str(sample_xml_path))["Trades"].to_arrow()
+
+    assert table.num_rows == 3
+    assert table.schema.field("tradePrice").type == pa.decimal128(6, 2)
+    assert table.column("tradePrice").to_pylist() == [
+        Decimal("150.25"),
+        Decimal("1120.50"),
+        Decimal("3.20"),
+    ]
+    assert table.schema.field("tradeDate").type == pa.date32()
+    assert table.column("tradeDate").to_pylist()[0] == date(2023, 3, 15)
+    assert table.column("strike").to_pylist() == [None, None, 450]
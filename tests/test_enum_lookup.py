@@ -0,0 +1,88 @@
+import pytest
+
+from py_ibkr import parse, register_enum_alias, set_unknown_enum_policy
+from py_ibkr.flex.enum_lookup import ENUM_ALIASES, enum_converter, enum_table
+from py_ibkr.flex.enums import AssetClass, CashAction, Code, OrderType, TransferType
+from py_ibkr.flex.utils import parse_codes
+
+
+@pytest.fixture
+def policy():
+    yield set_unknown_enum_policy
+    set_unknown_enum_policy("raise")
+
+
+def test_enum_table_lookup():
+    convert = enum_converter(CashAction)
+
+    assert convert("Dividends") is CashAction.DIVIDEND
+    assert convert("Deposits/Withdrawals") is CashAction.DEPOSITWITHDRAW
+    assert convert("") is None
+    assert enum_converter(TransferType)("ACAT") is TransferType.ACATS
+
+
+def test_multi_value_order_type_is_cached():
+    assert enum_converter(OrderType)("LMT;MKT") is OrderType.MULTIPLE
+    assert enum_table(OrderType)["LMT;MKT"] is OrderType.MULTIPLE
+
+
+def test_register_enum_alias(monkeypatch):
+    monkeypatch.setitem(ENUM_ALIASES, AssetClass, {})
+    convert = enum_converter(AssetClass)
+
+    register_enum_alias(AssetClass, "STOCK", "STK")
+
+    assert convert("STOCK") is AssetClass.STOCK
+    del enum_table(AssetClass)["STOCK"]
+    with pytest.raises(ValueError):
+        register_enum_alias(AssetClass, "X", "not a value")
+
+
+def test_register_enum_alias_updates_codes(policy, monkeypatch):
+    monkeypatch.setitem(ENUM_ALIASES, Code, {})
+    policy("unknown")
+    assert parse_codes("ZZ") == (Code.UNKNOWN,)
+
+    register_enum_alias(Code, "ZZ", "O")
+    try:
+        assert parse_codes("ZZ") == (Code.OPENING,)
+    finally:
+        del enum_table(Code)["ZZ"]
+        parse_codes.cache_clear()
+
+
+def test_unknown_policy(policy):
+    convert = enum_converter(AssetClass)
+    with pytest.raises(ValueError, match="'SPACESHIP' is not a valid AssetClass"):
+        convert("SPACESHIP")
+
+    policy("unknown")
+    assert convert("SPACESHIP") is AssetClass.UNKNOWN
+    assert parse_codes("O;Zz") == (Code.OPENING, Code.UNKNOWN)
+
+    policy("raw")
+    assert convert("SPACESHIP") == "SPACESHIP"
+    assert parse_codes("O;Zz") == (Code.OPENING, "Zz")
+
+    with pytest.raises(ValueError, match="Unknown enum policy"):
+        policy("ignore")
+
+
+def test_unknown_values_do_not_abort_parse(sample_xml_path, tmp_path, policy):
+    path = tmp_path / "new_values.xml"
+    path.write_bytes(
+        sample_xml_path.read_bytes()
+        .replace(b'assetCategory="STK"', b'assetCategory="SPACESHIP"')
+        .replace(b'type="Dividends"', b'type="Loyalty Bonus"')
+    )
+    with pytest.raises(ValueError):
+        parse(str(path))
+
+    policy("unknown")
+    response = parse(str(path))
+    assert response.FlexStatements[0].Trades[0].assetCategory is AssetClass.UNKNOWN
+    assert response.FlexStatements[0].CashTransactions[0].type is CashAction.UNKNOWN
+
+    policy("raw")
+    response = parse(str(path), validate=False)
+    assert response.FlexStatements[0].CashTransactions[0].type == "Loyalty Bonus"
@@ -0,0 +1,184 @@
+import multiprocessing
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pytest
+from conftest import EDGE_CASES
+
+from py_ibkr import parse, parse_many, register_enum_alias, set_unknown_enum_policy
+from py_ibkr.flex import parallel
+from py_ibkr.flex.enum_lookup import ENUM_ALIASES, enum_table
+from py_ibkr.flex.enums import AssetClass, CashAction
+from py_ibkr.flex.parallel import statement_offsets
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_parallel_parse_matches_serial(sample_xml_path, validate):
+    expected = parse(str(sample_xml_path), validate=validate)
+
+    result = parse(str(sample_xml_path), validate=validate, workers=2)
+
+    assert result == expected
+    assert [s.accountId for s in result.FlexStatements] == ["U1000001", "U1000002"]
+    assert result.queryName == "Sample"
+
+
+def test_parallel_parse_in_memory(sample_xml_path):
+    data = sample_xml_path.read_bytes()
+
+    assert parse(memoryview(data), workers=2) == parse(data)
+    with open(sample_xml_path, "rb") as f:
+        assert parse(f, workers=2) == parse(data)
+
+
+def test_parallel_parse_edge_cases():
+    # Statements nested in other elements, or in a second container, are not split out
+    assert parse(EDGE_CASES, workers=2) == parse(EDGE_CASES)
+    first = b'<FlexStatement accountId="U1" />'
+    nested_first = EDGE_CASES.replace(
+        first, b'<Other><FlexStatement accountId="X" /></Other>' + first
+    )
+    assert parse(nested_first, workers=2) == parse(nested_first)
+
+
+def test_parallel_parse_preserves_order(sample_xml_path, tmp_path):
+    head, _, rest = sample_xml_path.read_bytes().partition(b"<FlexStatement ")
+    statement = rest.partition(b"</FlexStatement>")[0]
+    statements = [
+        b"<FlexStatement "
+        + statement.replace(b"U1000001", f"U{n:07}".encode())
+        + b"</FlexStatement>"
+        for n in range(12)
+    ]
+    path = tmp_path / "many.xml"
+    path.write_bytes(head + b"\n".join(statements) + b"</FlexStatements></FlexQueryResponse>")
+
+    result = parse(str(path), workers=3)
+
+    assert [s.accountId for s in result.FlexStatements] == [f"U{n:07}" for n in range(12)]
+    assert result == parse(str(path))
+
+
+def test_parallel_parse_projection(sample_xml_path):
+    fields = {"Trade": ["symbol", "quantity"]}
+    expected = parse(str(sample_xml_path), sections={"Trades"}, fields=fields)
+
+    result = parse(str(sample_xml_path), sections={"Trades"}, fields=fields, workers=2)
+
+    assert result == expected
+    assert result.FlexStatements[0].CashTransactions == []
+
+
+def test_parallel_parse_without_statements(tmp_path):
+    path = tmp_path / "empty.xml"
+    path.write_bytes(
+        b'<FlexQueryResponse queryName="Empty"><FlexStatements count="0" /></FlexQueryResponse>'
+    )
+
+    result = parse(str(path), workers=2)
+
+    assert result.queryName == "Empty"
+    assert result.FlexStatements == []
+
+
+def test_parallel_parse_rejects_other_documents(tmp_path):
+    path = tmp_path / "other.xml"
+    path.write_bytes(b"<FlexStatementResponse><Status>Fail</Status></FlexStatementResponse>")
+
+    with pytest.raises(ValueError, match="Not a FlexQueryResponse"):
+        parse(str(path), workers=2)
+
+
+def test_statement_offsets():
+    data = (
+        b'<FlexStatements count="2"><FlexStatement a="1"><Trades/></FlexStatement>'
+        b'<FlexStatement a="2"/></FlexStatements>'
+    )
+
+    offsets = statement_offsets(data)
+
+    assert [data[start:end] for start, end in offsets] == [
+        b'<FlexStatement a="1"><Trades/></FlexStatement>',
+        b'<FlexStatement a="2"/>',
+    ]
+
+
+def test_statement_offsets_first_container_only():
+    data = (
+        b'<FlexQueryResponse><FlexStatements><FlexStatement a="1"/></FlexStatements>'
+        b'<FlexStatements><FlexStatement a="2"/></FlexStatements></FlexQueryResponse>'
+    )
+
+    assert [data[start:end] for start, end in statement_offsets(data)] == [
+        b'<FlexStatement a="1"/>'
+    ]
+
+
+def test_statement_offsets_unterminated():
+    with pytest.raises(ValueError, match="Unterminated"):
+        statement_offsets(b'<FlexStatements><FlexStatement a="1"><Trades/>')
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many(sample_xml_path, tmp_path, workers):
+    broken = tmp_path / "broken.xml"
+    broken.write_bytes(b"<FlexQueryResponse><FlexStatements>")
+    paths = [sample_xml_path, broken, sample_xml_path]
+
+    results = list(parse_many(paths, workers=workers))
+
+    assert sorted(map(str, (path for path, _ in results))) == sorted(map(str, paths))
+    responses = [result for _, result in results if not isinstance(result, Exception)]
+    errors = [result for path, result in results if isinstance(result, Exception)]
+    assert responses == [parse(str(sample_xml_path))] * 2
+    assert len(errors) == 1 and isinstance(errors[0], ET.ParseError)
+
+
+def test_parse_many_single_worker_skips_serialization(sample_xml_path, monkeypatch):
+    def fail(_):
+        raise AssertionError("serialized in process")
+
+    monkeypatch.setattr(parallel, "dumps", fail)
+    monkeypatch.setattr(parallel, "loads", fail)
+
+    [(_, result)] = parse_many([sample_xml_path], workers=1)
+
+    assert result == parse(str(sample_xml_path))
+
+
+def test_parse_many_options(sample_xml_path):
+    [(path, result)] = parse_many([sample_xml_path], workers=2, sections={"Trades"})
+
+    assert path == sample_xml_path
+    assert result.FlexStatements[0].CashTransactions == []
+    assert len(result.FlexStatements[0].Trades) == 2
+
+
+def test_spawned_workers_use_enum_settings(sample_xml_path, tmp_path, monkeypatch):
+    # Spawned workers import py_ibkr afresh (the default on macOS, Windows and
+    # Linux from Python 3.14): the parent's policy and aliases must reach them
+    spawn = multiprocessing.get_context("spawn")
+    monkeypatch.setattr(
+        parallel, "ProcessPoolExecutor", partial(ProcessPoolExecutor, mp_context=spawn)
+    )
+    monkeypatch.setitem(ENUM_ALIASES, AssetClass, {})
+    path = tmp_path / "new_values.xml"
+    path.write_bytes(
+        sample_xml_path.read_bytes()
+        .replace(b'assetCategory="STK"', b'assetCategory="STOCK"')
+        .replace(b'type="Dividends"', b'type="Loyalty Bonus"')
+    )
+    register_enum_alias(AssetClass, "STOCK", "STK")
+    set_unknown_enum_policy("unknown")
+    try:
+        expected = parse(str(path))
+        assert expected.FlexStatements[0].Trades[0].assetCategory is AssetClass.STOCK
+        assert expected.FlexStatements[0].CashTransactions[0].type is CashAction.UNKNOWN
+
+        assert parse(str(path), workers=2) == expected
+        [(_, result)] = parse_many([path], workers=2)
+        assert result == expected
+    finally:
+        set_unknown_enum_policy("raise")
+        del enum_table(AssetClass)["STOCK"]
@@ -0,0 +1,268 @@
+import io
+import mmap
+import xml.etree.ElementTree as ET
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from py_ibkr import (
+    iter_cash_transactions,
+    iter_section_models,
+    iter_statements,
+    iter_trades,
+    parse,
+)
+from py_ibkr.flex import parser
+from py_ibkr.flex.enums import (
+    BuySell,
+    CashAction,
+    Code,
+    InOut,
+    LongShort,
+    OptionAction,
+    Reorg,
+    TransferType,
+)
+from py_ibkr.flex.models import ChangeInNAV, FlexStatement, OptionEAE, Trade
+from py_ibkr.flex.parser import construct_model, iter_elements
+
+
+def test_parse_sample(sample_xml_path):
+    response = parse(str(sample_xml_path))
+
+    assert response.queryName == "Sample"
+    assert [str(s.accountId) for s in response.FlexStatements] == ["U1000001", "U1000002"]
+    assert len(response.FlexStatements[0].Trades) == 2
+    assert len(response.FlexStatements[0].CashReport) == 1
+    assert len(response.FlexStatements[1].CashReport) == 1
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_parse_statement_sections(sample_xml_path, validate):
+    first, second = parse(str(sample_xml_path), validate=validate).FlexStatements
+
+    assert first.OpenPositions[0].side is LongShort.LONG
+    assert first.OpenPositions[0].positionValue == Decimal("1925.3")
+    transfer = first.Transfers[0]
+    assert (transfer.type, transfer.direction) == (TransferType.ACATS, InOut.IN)
+    assert transfer.date == date(2023, 5, 10)
+    assert first.CorporateActions[0].type is Reorg.FORWARDSPLIT
+    assert first.OptionEAE[0].transactionType is OptionAction.EXPIRE
+    assert first.ChangeInNAV == ChangeInNAV(
+        accountId="U1000001",
+        currency="USD",
+        fromDate=date(2023, 1, 1),
+        toDate=date(2023, 12, 31),
+        startingValue=Decimal("1000"),
+        mtm=Decimal("12.5"),
+        depositsWithdrawals=Decimal("1000"),
+        endingValue=Decimal("2012.5"),
+        twr=Decimal("1.25"),
+    )
+    assert second.OpenPositions == [] and second.ChangeInNAV is None
+
+
+def test_parse_first_section_element_only():
+    data = b"""<FlexQueryResponse><FlexStatements><FlexStatement>
+<ChangeInNAV endingValue="1" /><ChangeInNAV endingValue="2" />
+<OptionEAE><OptionEAE quantity="1" /></OptionEAE><OptionEAE><OptionEAE quantity="2" /></OptionEAE>
+</FlexStatement></FlexStatements></FlexQueryResponse>"""
+
+    statement = parse(data).FlexStatements[0]
+
+    assert statement.ChangeInNAV.endingValue == Decimal("1")
+    assert [row.quantity for row in statement.OptionEAE] == [Decimal("1")]
+
+
+def test_iter_section_models(sample_xml_path):
+    sections = ("OptionEAE", "ChangeInNAV", "Trades")
+
+    rows = list(iter_section_models(str(sample_xml_path), sections))
+
+    expected = parse(str(sample_xml_path)).FlexStatements
+    assert rows == [
+        *expected[0].Trades,
+        *expected[0].OptionEAE,
+        expected[0].ChangeInNAV,
+        *expected[1].Trades,
+    ]
+    assert isinstance(rows[2], OptionEAE)
+
+
+def test_parse_in_memory_sources(sample_xml_path, monkeypatch):
+    monkeypatch.setattr(parser, "_FEED_CHUNK_SIZE", 1000)  # several slices per report
+    expected = parse(str(sample_xml_path))
+    data = sample_xml_path.read_bytes()
+
+    assert parse(sample_xml_path) == expected
+    assert parse(data) == expected
+    assert parse(bytearray(data)) == expected
+    assert parse(memoryview(data)) == expected
+    assert parse(io.BytesIO(data)) == expected
+    with open(sample_xml_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert parse(m) == expected
+        assert list(iter_trades(m)) == [t for s in expected.FlexStatements for t in s.Trades]
+    # The map was released by the parser, so it closed without a BufferError
+
+
+def test_iter_trades_from_chunks_while_arriving(sample_xml_path):
+    data = sample_xml_path.read_bytes()
+    pieces = [data[i : i + 100] for i in range(0, len(data), 100)]
+    received = []
+
+    def arriving():
+        for piece in pieces:
+            received.append(piece)
+            yield piece
+
+    trades = iter_trades(arriving())
+    first = next(trades)
+
+    assert first.symbol == "AAPL"
+    assert len(received) < len(pieces)  # yielded before the document was complete
+    assert [first, *trades] == list(iter_trades(data))
+    assert parse(iter(pieces)) == parse(data)
+
+
+def test_parse_rejects_empty_input():
+    with pytest.raises(ET.ParseError):
+        parse(b"")
+
+
+def test_iter_trades_matches_parse(sample_xml_path):
+    response = parse(str(sample_xml_path))
+    expected = [t for s in response.FlexStatements for t in s.Trades]
+
+    trades = list(iter_trades(str(sample_xml_path)))
+
+    assert trades == expected
+    assert trades[1].tradePrice == Decimal("1120.50")
+
+
+def test_iter_cash_transactions(sample_xml_path):
+    cash = list(iter_cash_transactions(str(sample_xml_path)))
+
+    assert [c.type for c in cash] == [CashAction.DIVIDEND, CashAction.DEPOSITWITHDRAW]
+
+
+def test_iter_statements_matches_parse(sample_xml_path):
+    response = parse(str(sample_xml_path))
+
+    assert list(iter_statements(str(sample_xml_path))) == response.FlexStatements
+
+
+def test_iter_elements_prunes_tree(sample_xml_path):
+    seen = []
+    for elem in iter_elements(str(sample_xml_path), "Trades", "Trade"):
+        seen.append(elem)
+    # Handled elements are cleared and detached as soon as the consumer moves on
+    assert len(seen) == 3
+    assert all(not elem.attrib for elem in seen)
+
+
+def test_iter_trades_rejects_other_documents(tmp_path):
+    path = tmp_path / "other.xml"
+    path.write_bytes(b"<Other><Trades><Trade/></Trades></Other>")
+
+    with pytest.raises(ValueError, match="Not a FlexQueryResponse"):
+        list(iter_trades(str(path)))
+
+
+def test_parse_without_validation_matches_validated(sample_xml_path):
+    validated = parse(str(sample_xml_path))
+    trusted = parse(str(sample_xml_path), validate=False)
+
+    assert trusted == validated
+    trade = trusted.FlexStatements[0].Trades[0]
+    assert trade.buySell == BuySell.BUY
+    assert trade.notes == (Code.OPENING, Code.PARTIAL)
+    assert trade.model_fields_set == validated.FlexStatements[0].Trades[0].model_fields_set
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_codes_are_shared_between_rows(tmp_path, validate):
+    rows = "".join(f'<Trade symbol="S{n}" notes="O;P" />' for n in range(3))
+    path = tmp_path / "notes.xml"
+    path.write_text(
+        "<FlexQueryResponse><FlexStatements><FlexStatement><Trades>"
+        f"{rows}</Trades></FlexStatement></FlexStatements></FlexQueryResponse>"
+    )
+
+    trades = parse(str(path), validate=validate).FlexStatements[0].Trades
+
+    assert trades[0].notes == (Code.OPENING, Code.PARTIAL)
+    assert trades[0].notes is trades[1].notes is trades[2].notes
+    assert Trade(notes=["C", "Ep"]).notes == (Code.CLOSING, Code.EXPIRED)
+
+
+def test_iter_trades_without_validation(sample_xml_path):
+    assert list(iter_trades(str(sample_xml_path), validate=False)) == list(
+        iter_trades(str(sample_xml_path))
+    )
+
+
+def test_construct_model_matches_model_construct():
+    attrs = {"symbol": "AAPL", "quantity": Decimal("10"), "notes": (Code.OPENING,)}
+
+    fast = construct_model(Trade, dict(attrs))
+    reference = Trade.model_construct(**attrs)
+
+    assert fast == reference
+    assert list(vars(fast)) == list(vars(reference))
+    assert fast.model_fields_set == {"symbol", "quantity", "notes"}
+    first, second = construct_model(FlexStatement, {}), construct_model(FlexStatement, {})
+    assert first.Trades is not second.Trades
+
+
+TRADE_FIELDS = ["symbol", "quantity", "tradePrice", "tradeDate"]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_parse_projection(sample_xml_path, validate):
+    full = parse(str(sample_xml_path))
+    response = parse(
+        str(sample_xml_path),
+        validate=validate,
+        sections={"Trades"},
+        fields={"Trade": TRADE_FIELDS},
+    )
+
+    statement = response.FlexStatements[0]
+    assert statement.accountId == full.FlexStatements[0].accountId
+    assert statement.CashTransactions == []
+    assert statement.CashReport == []
+    for trade, expected in zip(statement.Trades, full.FlexStatements[0].Trades, strict=True):
+        assert trade.model_fields_set == set(TRADE_FIELDS)
+        assert trade.model_dump(include=set(TRADE_FIELDS)) == expected.model_dump(
+            include=set(TRADE_FIELDS)
+        )
+        assert trade.tradeID is None
+        assert trade.buySell is None
+
+
+def test_parse_projection_errors(sample_xml_path):
+    with pytest.raises(ValueError, match="Unknown statement sections: Positions"):
+        parse(str(sample_xml_path), sections={"Positions"})
+    with pytest.raises(ValueError, match="Unknown Trade fields: price"):
+        parse(str(sample_xml_path), fields={"Trade": ["symbol", "price"]})
+    with pytest.raises(ValueError, match="Cannot select fields of Position"):
+        parse(str(sample_xml_path), fields={"Position": ["symbol"]})
+
+
+def test_iter_projection(sample_xml_path):
+    trades = list(iter_trades(str(sample_xml_path), fields=TRADE_FIELDS))
+    assert [t.model_fields_set for t in trades] == [set(TRADE_FIELDS)] * 3
+
+    statements = list(iter_statements(str(sample_xml_path), sections=["CashTransactions"]))
+    assert [len(s.CashTransactions) for s in statements] == [2, 0]
+    assert all(not s.Trades for s in statements)
+
+
+def test_parse_projection_snapshot(sample_xml_path, tmp_path):
+    cache_dir = str(tmp_path)
+    projected = parse(str(sample_xml_path), cache_dir=cache_dir, sections={"Trades"})
+    full = parse(str(sample_xml_path), cache_dir=cache_dir)
+
+    assert not projected.FlexStatements[0].CashTransactions
+    assert full.FlexStatements[0].CashTransactions
@@ -1,8 +1,19 @@
 from datetime import date, datetime, time
 from decimal import Decimal
 
+import pytest
+
+from py_ibkr.flex.enums import Code
 from py_ibkr.flex.models import Trade
-from py_ibkr.flex.parser import clean_attributes, parse_date, parse_datetime, parse_time
+from py_ibkr.flex.parser import (
+    clean_attributes,
+    converter_plan,
+    parse_bool,
+    parse_date,
+    parse_datetime,
+    parse_decimal,
+    parse_time,
+)
 
 
 def test_parse_date():
@@ -41,3 +52,41 @@ def test_clean_attributes_decimal():
     attrs = {"tradePrice": "1,234.56"}
     cleaned = clean_attributes(attrs, Trade)
     assert cleaned["tradePrice"] == Decimal("1234.56")
+
+
+def test_clean_attributes_time_and_codes():
+    attrs = {"tradeTime": "093000", "notes": "O;P", "orderType": "LMT;MKT", "unknown": "x"}
+    cleaned = clean_attributes(attrs, Trade)
+    assert cleaned == {
+        "tradeTime": time(9, 30, 0),
+        "notes": (Code.OPENING, Code.PARTIAL),
+        "orderType": "MULTIPLE",
+    }
+
+
+def test_converter_plan_cached_per_model():
+    plan = converter_plan(Trade)
+    assert plan is converter_plan(Trade)
+    assert plan["tradeDate"] is parse_date
+    assert plan["orderTime"] is parse_datetime
+    assert plan["isAPIOrder"] is parse_bool
+    assert plan["tradePrice"] is parse_decimal
+
+
+def test_parse_date_time_invalid():
+    with pytest.raises(ValueError):
+        parse_date("2023011X")
+    with pytest.raises(ValueError):
+        parse_date("20231301")
+    with pytest.raises(ValueError):
+        parse_time("12300X")
+    with pytest.raises(ValueError):
+        parse_datetime("20230101;")
+
+
+def test_parse_datetime_fast_path_and_cache():
+    value = parse_datetime("20231231;235959")
+    assert value == datetime(2023, 12, 31, 23, 59, 59)
+    # Repeated timestamps share the cached instance
+    assert parse_datetime("20231231;235959") is value
+    assert parse_date("2023-12-31") is parse_date("2023-12-31")
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from conftest import SEND_OK, FakeClock
+
+from py_ibkr import AdaptiveBackoff, Backoff, FlexRateLimitError, TokenBucket
+
+RATE_LIMIT = (
+    b"<FlexStatementResponse><Status>Warn</Status>"
+    b"<ErrorCode>1008</ErrorCode><ErrorMessage>Too many requests</ErrorMessage>"
+    b"</FlexStatementResponse>"
+)
+
+
+def test_token_bucket_throttles_after_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    with patch("time.sleep", side_effect=clock.sleep) as sleep:
+        waits = [bucket.acquire() for _ in range(4)]
+
+    # Burst of two, then one request every 1/rate seconds
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+    assert sleep.call_count == 2
+    assert bucket.acquired == 4
+    assert bucket.throttled == 2
+    assert bucket.throttled_seconds == pytest.approx(1.0)
+
+
+def test_token_bucket_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+
+    assert bucket.acquire() == 0.0
+    clock.now += 5
+    assert bucket.acquire() == 0.0  # capacity caps the refill at one token
+    assert bucket._reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_shared_across_threads():
+    bucket = TokenBucket(rate=1000.0, capacity=1)
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert bucket.acquired == 20
+    assert bucket.throttled >= 1
+
+
+def test_token_bucket_async():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+
+    async def main():
+        return [await bucket.acquire_async(), await bucket.acquire_async()]
+
+    with patch("asyncio.sleep", new=AsyncMock(side_effect=clock.sleep)):
+        assert asyncio.run(main()) == [0.0, 1.0]
+    assert clock.now == 1.0
+
+
+def test_token_bucket_rejects_bad_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_backoff_default_schedule():
+    backoff = Backoff()
+    assert [backoff.delay(10, i) for i in range(4)] == [10, 20, 40, 60]
+
+
+def test_adaptive_backoff_slows_down_and_recovers():
+    backoff = AdaptiveBackoff(jitter=0.5, rng=lambda: 0.0)
+
+    assert backoff.delay(1, 0) == 1
+    backoff.on_rate_limited()
+    backoff.on_rate_limited()
+    assert backoff.penalty == 4
+    assert backoff.delay(1, 1) == 8
+    assert backoff.delay(10, 3) == 60  # capped
+
+    backoff.on_success()
+    assert backoff.penalty == 2
+    for _ in range(5):
+        backoff.on_success()
+    assert backoff.penalty == 1
+    assert backoff.rate_limited == 2
+
+
+def test_adaptive_backoff_jitter():
+    backoff = AdaptiveBackoff(jitter=0.5, rng=lambda: 1.0)
+    assert backoff.delay(10, 0) == 5
+
+
+@patch("time.sleep", return_value=None)
+def test_download_retries_rate_limit(mock_sleep, http_server, make_client):
+    http_server.route("SendRequest", RATE_LIMIT, SEND_OK)
+    http_server.route("GetStatement", RATE_LIMIT, b"<FlexQueryResponse />")
+    backoff = AdaptiveBackoff(rng=lambda: 0.0)
+    bucket = TokenBucket(rate=1000.0)
+
+    with make_client(rate_limiter=bucket, backoff=backoff) as client:
+        data = client.download("token", "query", retry_interval=1)
+
+    assert data == b"<FlexQueryResponse />"
+    assert backoff.rate_limited == 2
+    assert backoff.retries == 2
+    # Penalty doubled on the first 1008, halved on success, doubled again
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 2]
+    assert backoff.throttled_seconds == 4
+    assert bucket.acquired == 4
+
+
+@patch("time.sleep", return_value=None)
+def test_download_rate_limit_gives_up(mock_sleep, http_server, make_client):
+    http_server.route("SendRequest", RATE_LIMIT)
+
+    with make_client() as client:
+        with pytest.raises(FlexRateLimitError):
+            client.download("token", "query", max_retries=2)
+
+    mock_sleep.assert_called_once_with(10)
@@ -0,0 +1,61 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from py_ibkr import parse
+from py_ibkr.flex.models import FlexQueryResponse, Trade
+from py_ibkr.flex.records import CompactFlexQueryResponse, CompactTrade, Record
+
+
+def test_compact_parse(sample_xml_path):
+    expected = parse(str(sample_xml_path))
+
+    response = parse(str(sample_xml_path), record_type="compact")
+
+    assert isinstance(response, CompactFlexQueryResponse)
+    trade = response.FlexStatements[0].Trades[1]
+    assert isinstance(trade, CompactTrade)
+    assert not hasattr(trade, "__dict__")
+    assert trade.symbol == "SAP"
+    assert trade.tradePrice == Decimal("1120.50")
+    assert trade.strike is None  # absent: the model default
+    assert trade.notes == expected.FlexStatements[0].Trades[1].notes
+    assert response.to_model() == expected
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_compact_to_model(validate):
+    record = CompactTrade({"symbol": "AAPL", "quantity": Decimal("10")})
+
+    model = record.to_model(validate=validate)
+
+    assert isinstance(model, Trade)
+    assert model.model_fields_set == {"symbol", "quantity"}
+    assert model == Trade(symbol="AAPL", quantity=Decimal("10"))
+
+
+def test_compact_record_protocol():
+    record = CompactTrade({"symbol": "AAPL"})
+
+    assert record == CompactTrade({"symbol": "AAPL"})
+    assert record != CompactTrade({"symbol": "MSFT"})
+    assert repr(record) == "CompactTrade(symbol='AAPL')"
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record.notes == () and record.to_dict() == {"symbol": "AAPL"}
+    with pytest.raises(AttributeError, match="no attribute 'bogus'"):
+        record.bogus  # noqa: B018
+    with pytest.raises(AttributeError):
+        CompactTrade({"bogus": 1})
+
+
+def test_compact_parallel_and_snapshot(sample_xml_path, tmp_path):
+    expected = parse(str(sample_xml_path), record_type="compact")
+
+    assert parse(str(sample_xml_path), record_type="compact", workers=2) == expected
+    cache_dir = str(tmp_path / "cache")
+    assert parse(str(sample_xml_path), record_type="compact", cache_dir=cache_dir) == expected
+    loaded = parse(str(sample_xml_path), record_type="compact", cache_dir=cache_dir)
+    assert isinstance(loaded, Record) and loaded == expected
+    # Model and compact snapshots of the same file do not collide
+    assert isinstance(parse(str(sample_xml_path), cache_dir=cache_dir), FlexQueryResponse)
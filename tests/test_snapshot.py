@@ -0,0 +1,148 @@
+import os
+
+import pytest
+
+from py_ibkr import parse, parse_columns, register_enum_alias, set_unknown_enum_policy
+from py_ibkr.flex import parser, snapshot
+from py_ibkr.flex.enum_lookup import ENUM_ALIASES, enum_table
+from py_ibkr.flex.enums import CashAction
+
+
+def snapshots(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith(".pickle"))
+
+
+def test_parse_snapshot_roundtrip(sample_xml_path, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    expected = parse(str(sample_xml_path))
+
+    first = parse(str(sample_xml_path), cache_dir=str(cache_dir))
+    assert first == expected
+    assert len(snapshots(cache_dir)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("XML parsed despite snapshot")
+
+    monkeypatch.setattr(parser, "parse_flex_query_response", fail)
+    loaded = parse(str(sample_xml_path), cache_dir=str(cache_dir))
+
+    assert loaded == expected
+    trade = loaded.FlexStatements[0].Trades[0]
+    assert trade.model_fields_set == expected.FlexStatements[0].Trades[0].model_fields_set
+    assert trade.quantity == expected.FlexStatements[0].Trades[0].quantity
+
+
+def test_snapshot_invalidated_by_content_change(sample_xml_path, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    parse(str(sample_xml_path), cache_dir=cache_dir)
+
+    sample_xml_path.write_bytes(
+        sample_xml_path.read_bytes().replace(b'queryName="Sample"', b'queryName="Changed"')
+    )
+    response = parse(str(sample_xml_path), cache_dir=cache_dir)
+
+    assert response.queryName == "Changed"
+    assert len(snapshots(cache_dir)) == 2
+
+
+def test_snapshot_invalidated_by_version_change(sample_xml_path, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    before = snapshot.snapshot_path(cache_dir, str(sample_xml_path))
+
+    monkeypatch.setattr(snapshot, "_package_version", lambda: "999.0")
+    snapshot.schema_fingerprint.cache_clear()
+    try:
+        after = snapshot.snapshot_path(cache_dir, str(sample_xml_path))
+    finally:
+        snapshot.schema_fingerprint.cache_clear()
+
+    assert before != after
+
+
+def test_corrupt_snapshot_is_replaced(sample_xml_path, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    path = snapshot.snapshot_path(cache_dir, str(sample_xml_path))
+    os.makedirs(cache_dir)
+    with open(path, "wb") as f:
+        f.write(b"\x80\x05truncated")
+
+    response = parse(str(sample_xml_path), cache_dir=cache_dir)
+
+    assert response == parse(str(sample_xml_path))
+    assert snapshot.load_snapshot(path) == response
+
+
+def test_parse_columns_snapshot(sample_xml_path, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    expected = parse_columns(str(sample_xml_path))
+
+    parse_columns(str(sample_xml_path), cache_dir=cache_dir)
+    parse_columns(str(sample_xml_path), sections=["Trades"], cache_dir=cache_dir)
+    loaded = parse_columns(str(sample_xml_path), cache_dir=cache_dir)
+
+    assert len(snapshots(cache_dir)) == 2
+    assert {k: t.to_pydict() for k, t in loaded.items()} == {
+        k: t.to_pydict() for k, t in expected.items()
+    }
+    # Converters are restored, so the loaded tables can keep growing
+    loaded["Trades"].append({"quantity": "1.5", "assetCategory": "STK"})
+    assert loaded["Trades"]["quantity"].to_list()[-1] == 1.5
+
+
+def test_snapshot_of_in_memory_report(sample_xml_path, tmp_path):
+    data = sample_xml_path.read_bytes()
+    cache_dir = str(tmp_path)
+
+    assert parse(data, cache_dir=cache_dir) == parse(str(sample_xml_path))
+    # Keyed by content: the file and a file object of the same bytes hit the snapshot
+    assert snapshots(cache_dir) == [os.path.basename(snapshot.snapshot_path(cache_dir, data))]
+    assert parse(str(sample_xml_path), cache_dir=cache_dir) == parse(data)
+    with open(sample_xml_path, "rb") as f:
+        tables = parse_columns(f, cache_dir=cache_dir)
+    assert len(snapshots(cache_dir)) == 2
+    assert tables["Trades"].to_pydict() == parse_columns(data)["Trades"].to_pydict()
+
+
+def test_snapshot_keeps_decimal_exponents(tmp_path):
+    # Equal decimals with different exponents or signs must not share one object
+    path = tmp_path / "decimals.xml"
+    path.write_bytes(
+        b"""<FlexQueryResponse><FlexStatements><FlexStatement><Trades>
+<Trade tradePrice="3.2" quantity="0" /><Trade tradePrice="3.20" quantity="-0" />
+<Trade tradePrice="3.200" quantity="0.00" />
+</Trades></FlexStatement></FlexStatements></FlexQueryResponse>"""
+    )
+    cache_dir = str(tmp_path / "cache")
+    expected = parse(str(path))
+
+    parse(str(path), cache_dir=cache_dir)
+    loaded = parse(str(path), cache_dir=cache_dir)
+
+    assert len(snapshots(cache_dir)) == 1
+    assert loaded.model_dump_json() == expected.model_dump_json()
+    trades = loaded.FlexStatements[0].Trades
+    assert [str(t.tradePrice) for t in trades] == ["3.2", "3.20", "3.200"]
+    assert [str(t.quantity) for t in trades] == ["0", "-0", "0.00"]
+
+
+def test_snapshot_keyed_by_enum_settings(sample_xml_path, tmp_path, monkeypatch):
+    path = tmp_path / "new_values.xml"
+    path.write_bytes(sample_xml_path.read_bytes().replace(b"Dividends", b"Loyalty Bonus"))
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setitem(ENUM_ALIASES, CashAction, {})
+
+    set_unknown_enum_policy("unknown")
+    try:
+        cached = parse(str(path), cache_dir=cache_dir)
+        assert cached.FlexStatements[0].CashTransactions[0].type is CashAction.UNKNOWN
+        set_unknown_enum_policy("raise")
+        with pytest.raises(ValueError):
+            parse(str(path), cache_dir=cache_dir)
+
+        register_enum_alias(CashAction, "Loyalty Bonus", "Dividends")
+        aliased = parse(str(path), cache_dir=cache_dir)
+        assert aliased.FlexStatements[0].CashTransactions[0].type is CashAction.DIVIDEND
+        assert len(snapshots(cache_dir)) == 2
+    finally:
+        set_unknown_enum_policy("raise")
+        enum_table(CashAction).pop("Loyalty Bonus", None)
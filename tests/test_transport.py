@@ -0,0 +1,292 @@
+import gzip
+import io
+import socket
+import zlib
+
+import pytest
+from conftest import NOT_READY, SEND_OK
+
+from py_ibkr import FlexClient, FlexError
+from py_ibkr.flex.transport import ConnectionPool, ContentDecoder, DecodingError, HTTPStatusError
+
+
+def test_pool_reuses_connection(http_server):
+    http_server.route("GetStatement", b"data")
+    url = http_server.base_url + "/GetStatement?t=x"
+
+    with ConnectionPool() as pool:
+        for _ in range(3):
+            with pool.urlopen(url) as response:
+                assert response.read() == b"data"
+
+        assert pool.connections_opened == 1
+    assert len(http_server.client_ports) == 1
+
+
+def test_pool_idle_timeout_discards_connections(http_server):
+    http_server.route("GetStatement", b"data")
+    url = http_server.base_url + "/GetStatement"
+
+    pool = ConnectionPool(idle_timeout=0)
+    for _ in range(2):
+        with pool.urlopen(url) as response:
+            response.read()
+    pool.close()
+
+    assert pool.connections_opened == 2
+
+
+def test_pool_does_not_reuse_partially_read_response(http_server):
+    http_server.route("GetStatement", b"0123456789")
+    url = http_server.base_url + "/GetStatement"
+
+    pool = ConnectionPool()
+    with pool.urlopen(url) as response:
+        response.read(4)
+    with pool.urlopen(url) as response:
+        assert response.read() == b"0123456789"
+    pool.close()
+
+    assert pool.connections_opened == 2
+
+
+def test_pool_retries_stale_connection(http_server):
+    http_server.route("GetStatement", b"data")
+    url = http_server.base_url + "/GetStatement"
+
+    pool = ConnectionPool()
+    with pool.urlopen(url) as response:
+        response.read()
+    # Simulate the kept-alive socket being dropped while idle
+    ((conn, _),) = next(iter(pool._idle.values()))
+    conn.sock.shutdown(socket.SHUT_RDWR)
+
+    with pool.urlopen(url) as response:
+        assert response.read() == b"data"
+    pool.close()
+
+    assert pool.connections_opened == 2
+
+
+def test_pool_http_error(http_server):
+    pool = ConnectionPool()
+    with pytest.raises(HTTPStatusError) as e:
+        with pool.urlopen(http_server.base_url + "/Missing"):
+            pass
+    assert e.value.code == 404
+    pool.close()
+
+
+def test_pool_closed():
+    pool = ConnectionPool()
+    pool.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        with pool.urlopen("http://127.0.0.1:1/"):
+            pass
+
+
+def test_pool_follows_redirects(http_server):
+    http_server.route("GetStatement", b"data")
+    http_server.route("Moved", b"", status=302, headers={"Location": "GetStatement?t=x"})
+
+    with ConnectionPool() as pool:
+        with pool.urlopen(http_server.base_url + "/Moved") as response:
+            assert response.read() == b"data"
+        assert pool.connections_opened == 1  # the redirect body was drained
+    assert http_server.requests[-1][0].endswith("/GetStatement?t=x")
+
+
+def test_pool_redirect_loop(http_server):
+    http_server.route("Loop", b"", status=302, headers={"Location": "Loop"})
+
+    with ConnectionPool() as pool, pytest.raises(HTTPStatusError, match="redirects") as e:
+        with pool.urlopen(http_server.base_url + "/Loop"):
+            pass
+    assert e.value.code == 302
+
+
+def test_pool_http_proxy(http_server):
+    # The local server stands in for the proxy: it is sent the absolute URL
+    http_server.route("GetStatement", b"data")
+    proxy = "http://user:secret@" + http_server.base_url.split("/")[2]
+    url = "http://flex.example/AccountManagement/FlexWebService/GetStatement"
+
+    with ConnectionPool(proxies={"http": proxy}) as pool:
+        with pool.urlopen(url) as response:
+            assert response.read() == b"data"
+
+    path, headers = http_server.requests[0]
+    assert path == url
+    assert headers["Host"] == "flex.example"
+    assert headers["Proxy-Authorization"] == "Basic dXNlcjpzZWNyZXQ="
+
+
+def test_pool_https_proxy_tunnel(monkeypatch):
+    monkeypatch.setenv("NO_PROXY", "internal.example")
+    pool = ConnectionPool(proxies={"https": "proxy.example:3128"})
+
+    conn = pool._connect(("https", "flex.example", 443, pool._proxy("https", "flex.example")))
+    assert (conn.host, conn.port) == ("proxy.example", 3128)
+    assert (conn._tunnel_host, conn._tunnel_port) == ("flex.example", 443)
+    assert pool._proxy("https", "internal.example") == ""
+    pool.close()
+
+
+def test_client_download_reuses_connection(http_server, make_client):
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", NOT_READY, b"<FlexQueryResponse />")
+
+    with make_client() as client:
+        data = client.download("token", "query", retry_interval=0)
+
+        assert data == b"<FlexQueryResponse />"
+        assert client.pool.connections_opened == 1
+    assert [path.split("?")[0].rsplit("/", 1)[1] for path, _ in http_server.requests] == [
+        "SendRequest",
+        "GetStatement",
+        "GetStatement",
+    ]
+    assert http_server.requests[0][1]["User-Agent"] == "python/py-ibkr"
+
+
+def test_client_http_error(make_client):
+    with make_client() as client:
+        with pytest.raises(FlexError, match="HTTP Error 404"):
+            client.get_statement("token", "123")
+
+
+def test_client_follows_send_request_redirect(http_server, make_client):
+    http_server.route("SendRequest", b"", status=302, headers={"Location": "Moved"})
+    http_server.route("Moved", SEND_OK)
+
+    with make_client() as client:
+        assert client.send_request("token", "query") == "123"
+
+
+def test_client_invalid_response(http_server, make_client):
+    http_server.route("SendRequest", b"<html><body>Maintenance</body>")
+
+    with make_client() as client:
+        with pytest.raises(FlexError, match="Invalid Flex Web Service response"):
+            client.send_request("token", "query")
+
+
+def test_client_connection_error():
+    with FlexClient(timeout=1) as client:
+        client.BASE_URL = "http://127.0.0.1:1/FlexWebService"
+        with pytest.raises(FlexError, match="URL Error"):
+            client.get_statement("token", "123")
+
+
+def _raw_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.mark.parametrize(
+    "encoding, compress",
+    [
+        ("gzip", gzip.compress),
+        ("deflate", zlib.compress),
+        ("deflate", _raw_deflate),
+        ("identity", lambda data: data),
+    ],
+)
+def test_content_decoder_incremental(encoding, compress):
+    body = compress(b"<FlexQueryResponse>" + b"<Trade />" * 5000 + b"</FlexQueryResponse>")
+    decoder = ContentDecoder(encoding)
+    decoded = b"".join(decoder.decompress(body[i : i + 7]) for i in range(0, len(body), 7))
+    decoded += decoder.flush()
+    assert decoded.endswith(b"<Trade /></FlexQueryResponse>")
+    assert len(decoded) == 19 + 9 * 5000 + 20
+
+
+def test_content_decoder_errors():
+    with pytest.raises(DecodingError, match="Unsupported"):
+        ContentDecoder("br")
+    decoder = ContentDecoder("gzip")
+    decoder.decompress(gzip.compress(b"<xml />" * 100)[:-10])
+    with pytest.raises(DecodingError, match="Truncated"):
+        decoder.flush()
+
+
+def _gzip_server(http_server, report: bytes) -> bytes:
+    body = gzip.compress(report)
+    http_server.route("SendRequest", SEND_OK)
+    http_server.route("GetStatement", body, headers={"Content-Encoding": "gzip"})
+    return body
+
+
+def test_client_negotiates_gzip(http_server, make_client, sample_xml_path):
+    report = sample_xml_path.read_bytes()
+    _gzip_server(http_server, report)
+
+    with make_client() as client:
+        assert client.download("token", "query") == report
+
+    path, headers = http_server.requests[-1]
+    assert headers["Accept-Encoding"] == "gzip, deflate"
+
+
+def test_client_compression_disabled(http_server, make_client):
+    http_server.route("SendRequest", SEND_OK)
+
+    with make_client(compression=False) as client:
+        client.send_request("token", "query")
+
+    assert http_server.requests[0][1]["Accept-Encoding"] == "identity"
+
+
+def test_download_to_decompresses_while_streaming(http_server, make_client, tmp_path):
+    report = b"<FlexQueryResponse>" + b"<Trade />" * 50_000 + b"</FlexQueryResponse>"
+    _gzip_server(http_server, report)
+    dest = tmp_path / "report.xml"
+
+    with make_client() as client:
+        assert client.download_to("token", "query", dest) == len(report)
+
+    assert dest.read_bytes() == report
+
+
+def test_download_to_keep_compressed(http_server, make_client, sample_xml_path, tmp_path):
+    report = sample_xml_path.read_bytes()
+    body = _gzip_server(http_server, report)
+    dest = tmp_path / "report.xml.gz"
+
+    with make_client() as client:
+        assert client.download_to("token", "query", dest, keep_compressed=True) == len(body)
+
+        # gzip responses are archived byte for byte
+        assert dest.read_bytes() == body
+
+        # identity responses are compressed while writing
+        http_server.route("GetStatement", report)
+        sink = io.BytesIO()
+        client.download_to("token", "query", sink, keep_compressed=True)
+        assert gzip.decompress(sink.getvalue()) == report
+
+
+def test_download_to_compressed_error_envelope(http_server, make_client):
+    envelope = (
+        b"<FlexStatementResponse><Status>Warn</Status>"
+        b"<ErrorCode>1012</ErrorCode><ErrorMessage>Token expired</ErrorMessage>"
+        b"</FlexStatementResponse>"
+    )
+    _gzip_server(http_server, envelope)
+    sink = io.BytesIO()
+
+    with make_client() as client:
+        with pytest.raises(FlexError, match="Token expired"):
+            client.download_to("token", "query", sink, keep_compressed=True)
+
+    assert sink.getvalue() == b""
+
+
+def test_client_truncated_gzip(http_server, make_client):
+    http_server.route("SendRequest", SEND_OK)
+    body = gzip.compress(b"<FlexQueryResponse />")[:-8]
+    http_server.route("GetStatement", body, headers={"Content-Encoding": "gzip"})
+
+    with make_client() as client:
+        with pytest.raises(FlexError, match="Truncated gzip"):
+            client.download("token", "query")
@@ -0,0 +1,44 @@
+import pickle
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from py_ibkr import parse
+from py_ibkr.vo import AccountID, ConID, Symbol
+
+
+class Holder(BaseModel):
+    symbol: Symbol.Input = None
+
+
+def test_value_objects_are_interned_strings():
+    symbol = Symbol("AAPL")
+
+    assert Symbol("AAPL") is symbol
+    assert Symbol(symbol) is symbol
+    assert symbol == "AAPL" and symbol.value == "AAPL" and str(symbol) == "AAPL"
+    assert type(str(symbol)) is str
+    assert repr(symbol) == "Symbol('AAPL')"
+    assert ConID("AAPL") is not symbol  # one table per class
+    assert pickle.loads(pickle.dumps(symbol)) is symbol
+    with pytest.raises(TypeError):
+        AccountID(123)  # type: ignore[arg-type]
+
+
+def test_value_object_fields():
+    holder = Holder(symbol="AAPL")
+
+    assert type(holder.symbol) is Symbol and holder.symbol is Symbol("AAPL")
+    assert holder.model_dump_json() == '{"symbol":"AAPL"}'
+    assert Holder.model_json_schema()["properties"]["symbol"]["type"] == "string"
+    with pytest.raises(ValidationError):
+        Holder(symbol=123)
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_rows_share_value_objects(sample_xml_path, validate):
+    statement = parse(str(sample_xml_path), validate=validate).FlexStatements[0]
+
+    first, second = statement.Trades[0], statement.CashTransactions[0]
+    assert type(first.accountId) is AccountID
+    assert first.accountId is second.accountId